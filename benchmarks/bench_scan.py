@@ -0,0 +1,222 @@
+"""
+Benchmark UspsMail.scan_mail against a local fake IMAP server.
+
+Every mailbox size is served by a child process and scanned five times:
+
+    cold      first scan, nothing cached
+    unchanged the same mailbox again
+    new mail  after a new digest arrived
+    restart   a fresh component that only has the image cache on disk
+    removed   the same component after the new digest was deleted
+
+Wall time, round trips, bytes on the wire and peak Python memory
+(tracemalloc) are measured in the client for each scan.
+
+    python benchmarks/bench_scan.py --sizes 10,1000,100000 --images 6
+    python benchmarks/bench_scan.py --json baseline.json
+    python benchmarks/bench_scan.py --baseline baseline.json
+"""
+import argparse
+import asyncio
+import imaplib
+import json
+import os
+import re
+import shutil
+import socket
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fakeimap  # noqa: E402
+from custom_components import usps_mail  # noqa: E402
+
+COLUMNS = ['wall_ms', 'round_trips', 'bytes_in', 'bytes_out', 'peak_kib']
+
+
+class WireStats:
+    """What the client sent and received"""
+    def __init__(self):
+        self.commands = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def round_trips(self):
+        """Number of tagged commands sent"""
+        return sum(self.commands.values())
+
+
+def counting_imap(stats):
+    """An IMAP4 class that adds its traffic to stats, handed to ImapSession as the connect hook"""
+    class CountingIMAP4(imaplib.IMAP4):
+        """Plain IMAP4 that counts commands and bytes"""
+        def __init__(self, host, port, timeout=None):
+            # imaplib only takes a timeout itself from Python 3.9 on.
+            self._timeout = timeout
+            super().__init__(host, port)
+
+        def _create_socket(self, *args):
+            return socket.create_connection((self.host, self.port), self._timeout)
+
+        def send(self, data):
+            command = re.match(rb'(?:' + re.escape(self.tagpre) + rb'\d+) (UID \S+|\S+)', data)
+            if command:
+                name = command.group(1).decode('ascii').upper()
+                stats.commands[name] = stats.commands.get(name, 0) + 1
+            stats.bytes_out += len(data)
+            super().send(data)
+
+        def read(self, size):
+            data = super().read(size)
+            stats.bytes_in += len(data)
+            return data
+
+        def readline(self):
+            line = super().readline()
+            stats.bytes_in += len(line)
+            return line
+
+    def connect(host, port, timeout=None):
+        """Open a connection, counting the greeting as well"""
+        stats.commands['CONNECT'] = stats.commands.get('CONNECT', 0) + 1
+        return CountingIMAP4(host, port, timeout)
+    return connect
+
+
+class BenchStates:
+    """Keeps the last state set for each entity"""
+    def __init__(self):
+        self.states = {}
+
+    def set(self, entity_id, state, attributes=None):
+        self.states[entity_id] = state
+
+    async_set = set
+
+
+class BenchHass:
+    """Just enough of Home Assistant to run UspsMail without an event loop"""
+    def __init__(self, config_dir):
+        self.config_dir = config_dir
+        self.loop = asyncio.new_event_loop()
+        self.data = {}
+        self.states = BenchStates()
+        self.config = self
+
+    def path(self, *parts):
+        """Paths in the config directory"""
+        return os.path.join(self.config_dir, *parts)
+
+    def add_job(self, target, *args):
+        """Run plain jobs, storage saves are skipped"""
+        result = target(*args)
+        if asyncio.iscoroutine(result):
+            result.close()
+
+
+def make_component(config_dir, port, stats, args):
+    """A UspsMail for the fake server, with its image cache in config_dir"""
+    hass = BenchHass(config_dir)
+    session = usps_mail.ImapSession('127.0.0.1', port, 'INBOX', 'user@example.com', 'secret',
+                                    connect=counting_imap(stats))
+    cache = usps_mail.ImageCache(hass.path('.storage', usps_mail.CACHE_DIR))
+    return hass, usps_mail.UspsMail(hass, session, 'None', config_dir, args.fetch_mode, args.chunk, cache,
+                                    usps_mail.CAMERA_ANIMATION, args.widths)
+
+
+def measure(component, stats):
+    """Scan once and return the figures for it"""
+    stats.__init__()
+    tracemalloc.start()
+    start = time.perf_counter()
+    component.scan_mail('benchmark')
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'wall_ms': round(wall * 1000, 1), 'round_trips': stats.round_trips, 'bytes_in': stats.bytes_in,
+            'bytes_out': stats.bytes_out, 'peak_kib': peak // 1024, 'letters': component.letters,
+            'packages': component.packages, 'commands': dict(stats.commands)}
+
+
+def run_size(size, args):
+    """All scans for one mailbox size"""
+    results = {}
+    config_dir = tempfile.mkdtemp(prefix='usps_mail_bench_')
+    try:
+        with fakeimap.ServerProcess(size, args.digests, args.images, args.notices, args.image_width,
+                                    args.days, args.capabilities) as server:
+            stats = WireStats()
+            _, component = make_component(config_dir, server.port, stats, args)
+            results['cold'] = measure(component, stats)
+            results['unchanged'] = measure(component, stats)
+            digest = server.add_digest(args.images)
+            results['new mail'] = measure(component, stats)
+            component.close()
+            _, component = make_component(config_dir, server.port, stats, args)
+            results['restart'] = measure(component, stats)
+            server.expunge(digest)
+            results['removed'] = measure(component, stats)
+            component.close()
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+    return results
+
+
+def print_table(report, baseline=None):
+    """Print the figures, with the change against the baseline when there is one"""
+    print('%8s  %-9s' % ('messages', 'scan') + ''.join('%14s' % column for column in COLUMNS)
+          + '%9s%9s' % ('letters', 'packages'))
+    for size, scans in report.items():
+        for scan, figures in scans.items():
+            row = '%8s  %-9s' % (size, scan)
+            for column in COLUMNS:
+                cell = str(figures[column])
+                before = (baseline or {}).get(size, {}).get(scan, {}).get(column)
+                if before:
+                    cell += ' %+.0f%%' % ((figures[column] - before) * 100.0 / before)
+                row += '%14s' % cell
+            print(row + '%9s%9s' % (figures['letters'], figures['packages']))
+
+
+def main():
+    """Parse the arguments and run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='10,1000,10000',
+                        help='comma separated mailbox sizes, from 10 up to 100000 messages')
+    parser.add_argument('--digests', type=int, default=1, help='digests per day')
+    parser.add_argument('--images', type=int, default=6, help='mailpieces per digest')
+    parser.add_argument('--notices', type=int, default=2, help='delivery notices per day')
+    parser.add_argument('--days', type=int, default=1, help='days of digests and notices, ending today')
+    parser.add_argument('--image-width', type=int, default=640, help='width of the mailpiece pictures')
+    parser.add_argument('--capabilities', help='comma separated capabilities the server announces, '
+                                               'for example IMAP4rev1 for a server without any extensions')
+    parser.add_argument('--fetch-mode', default=usps_mail.FETCH_PARTS,
+                        choices=[usps_mail.FETCH_PARTS, usps_mail.FETCH_RFC822])
+    parser.add_argument('--chunk', type=int, default=25, help='digests per UID FETCH')
+    parser.add_argument('--widths', default='320,640', help='camera picture widths to prepare')
+    parser.add_argument('--json', metavar='FILE', help='also write the figures to FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='show the change against figures from --json')
+    args = parser.parse_args()
+    args.widths = [int(width) for width in args.widths.split(',') if width]
+    if args.capabilities:
+        args.capabilities = [capability for capability in args.capabilities.upper().split(',') if capability]
+
+    report = {}
+    for size in args.sizes.split(','):
+        report[size] = run_size(int(size), args)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    print_table(report, baseline)
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump(report, json_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,746 @@
+"""
+A local IMAP4rev1 stand-in used to benchmark the usps_mail component.
+
+It understands just enough of RFC 3501 (plus IDLE, ENABLE, ESEARCH,
+CONDSTORE/QRESYNC and Gmail's X-GM-RAW) to serve the commands the component
+sends, and counts round trips and bytes on the wire for every session.
+"""
+import datetime
+import email
+import email.header
+import email.parser
+import email.utils
+import io
+import multiprocessing
+import random
+import re
+import socketserver
+import threading
+from email.mime.image import MIMEImage
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+DIGEST_SUBJECT = 'Your Informed Delivery Daily Digest'
+NOTICE_FROM = 'auto-reply@usps.com'
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def imap_date(day):
+    """Format a date the way SEARCH SINCE expects it"""
+    return '%02d-%s-%d' % (day.day, MONTHS[day.month - 1], day.year)
+
+
+def parse_imap_date(value):
+    """Parse a SEARCH SINCE date"""
+    day, month, year = value.split('-')
+    return datetime.date(int(year), MONTHS.index(month.title()) + 1, int(day))
+
+
+def mailpiece_jpeg(width, seed):
+    """A grayscale JPEG that looks roughly like a scanned envelope"""
+    from PIL import Image, ImageDraw
+    rnd = random.Random(seed)
+    height = width * 3 // 5
+    image = Image.new('L', (width, height), 235)
+    draw = ImageDraw.Draw(image)
+    for _ in range(3):
+        left = rnd.randint(width // 20, width // 2)
+        top = rnd.randint(height // 10, height * 3 // 4)
+        for line in range(rnd.randint(2, 4)):
+            length = rnd.randint(width // 6, width // 3)
+            draw.rectangle([left, top + line * 14, left + length, top + line * 14 + 8], fill=rnd.randint(20, 90))
+    data = io.BytesIO()
+    image.save(data, 'JPEG', quality=80)
+    return data.getvalue()
+
+
+def make_digest(day, images, image_width=640, seed=0, html_size=60000):
+    """Build an Informed Delivery digest with the given number of mailpieces"""
+    msg = MIMEMultipart('related')
+    msg['From'] = 'USPS Informed Delivery <USPSInformeddelivery@email.informeddelivery.usps.com>'
+    msg['To'] = 'user@example.com'
+    msg['Subject'] = DIGEST_SUBJECT + ' for ' + day.strftime('%a, %m/%d')
+    msg['Date'] = email.utils.format_datetime(
+        datetime.datetime.combine(day, datetime.time(8, 0), datetime.timezone.utc))
+    html = '<html><body>' + ('<p>You have mail arriving soon.</p>' * (html_size // 34)) + '</body></html>'
+    msg.attach(MIMEText(html, 'html'))
+    for index in range(images):
+        part = MIMEImage(mailpiece_jpeg(image_width, seed * 1000 + index), 'jpeg')
+        part.add_header('Content-Disposition', 'inline', filename='mailpiece%s.jpg' % index)
+        part.add_header('Content-ID', '<mailpiece%s>' % index)
+        msg.attach(part)
+    return msg.as_bytes()
+
+
+def make_notice(day, tracking, status='Delivered'):
+    """Build a USPS tracking notice"""
+    subjects = {
+        'Delivered': 'USPS® Item Delivered, Front Door/Porch ' + tracking,
+        'Out for Delivery': 'USPS® Item Out for Delivery ' + tracking,
+        'Expected': 'USPS® Expected Delivery on ' + day.strftime('%A, %B %d, %Y') + ' ' + tracking,
+    }
+    body = ('Hello,\n\nYour item has a new status: %s.\n\nUSPS Tracking Number: %s\n\n' % (status, tracking)
+            + 'Thank you for using USPS.\n' * 200)
+    msg = MIMEText(body, 'plain')
+    msg['From'] = NOTICE_FROM
+    msg['To'] = 'user@example.com'
+    msg['Subject'] = subjects[status]
+    msg['Date'] = email.utils.format_datetime(
+        datetime.datetime.combine(day, datetime.time(14, 30), datetime.timezone.utc))
+    return msg.as_bytes()
+
+
+NOISE = ('From: friend{seed}@example.com\r\nTo: user@example.com\r\nSubject: Hello there {seed}\r\n'
+         'Date: {date}\r\nContent-Type: text/plain; charset="us-ascii"\r\n\r\n'
+         'Just some unrelated mail number {seed}.\r\n')
+
+
+def make_noise(day, seed):
+    """Build an unrelated message, without the email package so large mailboxes fill quickly"""
+    date = email.utils.format_datetime(datetime.datetime.combine(day, datetime.time(10, 0), datetime.timezone.utc))
+    raw = NOISE.format(seed=seed, date=date).encode('ascii')
+    return raw, {'subject': 'Hello there %s' % seed, 'from': 'friend%s@example.com' % seed}
+
+
+class Message:
+    """A message stored in the fake mailbox"""
+    def __init__(self, uid, raw, day, modseq, headers=None):
+        self.uid = uid
+        self.raw = raw
+        self.day = day
+        self.modseq = modseq
+        self.flags = set()
+        self._parsed = None
+        if headers is None:
+            parsed = email.parser.BytesHeaderParser().parsebytes(raw)
+            headers = {name: str(email.header.make_header(email.header.decode_header(parsed.get(name, ''))))
+                       for name in ('subject', 'from')}
+        self._headers = headers
+
+    @property
+    def parsed(self):
+        """The message parsed with the stdlib email package"""
+        if self._parsed is None:
+            self._parsed = email.message_from_bytes(self.raw)
+        return self._parsed
+
+    def header(self, name):
+        """A decoded Subject or From header"""
+        return self._headers[name.lower()]
+
+
+class Mailbox:
+    """A single folder with UIDs, UIDVALIDITY and a modification sequence"""
+    def __init__(self, uidvalidity=1):
+        self.uidvalidity = uidvalidity
+        self.messages = []
+        self.next_uid = 1
+        self.highestmodseq = 1
+        self.expunged = []
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+
+    def append(self, raw, day=None, headers=None):
+        """Add a message and wake up any IDLEing session"""
+        with self.lock:
+            self.highestmodseq += 1
+            message = Message(self.next_uid, raw, day or datetime.date.today(), self.highestmodseq, headers)
+            self.messages.append(message)
+            self.next_uid += 1
+            self.changed.notify_all()
+        return message.uid
+
+    def expunge(self, uid):
+        """Remove a message"""
+        with self.lock:
+            self.highestmodseq += 1
+            self.messages = [msg for msg in self.messages if msg.uid != uid]
+            self.expunged.append((uid, self.highestmodseq))
+            self.changed.notify_all()
+
+
+def seed_mailbox(mailbox, size, digests=1, images=5, notices=2, image_width=640, days=1):
+    """Fill the mailbox with noise plus digests and notices for recent days"""
+    today = datetime.date.today()
+    special = digests + notices
+    noise = max(size - special * days, 0)
+    old_day = today - datetime.timedelta(days=days + 30)
+    for index in range(noise):
+        raw, headers = make_noise(old_day, index)
+        mailbox.append(raw, old_day, headers)
+    for offset in reversed(range(days)):
+        day = today - datetime.timedelta(days=offset)
+        for index in range(digests):
+            mailbox.append(make_digest(day, images, image_width, seed=offset * 100 + index), day)
+        for index in range(notices):
+            status = ['Delivered', 'Out for Delivery', 'Expected'][index % 3]
+            mailbox.append(make_notice(day, '94001%017d' % (offset * 100 + index), status), day)
+    return mailbox
+
+
+class Stats:
+    """Wire counters shared by every session of a server"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zero the counters"""
+        self.connections = 0
+        self.commands = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def round_trips(self):
+        """Number of tagged commands received"""
+        return sum(self.commands.values())
+
+    def count(self, command):
+        """Record a tagged command"""
+        with self.lock:
+            self.commands[command] = self.commands.get(command, 0) + 1
+
+
+def tokenize(line):
+    """Split a command line into atoms, quoted strings and parenthesized lists"""
+    stack = [[]]
+    pos = 0
+    while pos < len(line):
+        char = line[pos]
+        if char == ' ':
+            pos += 1
+        elif char == '(':
+            stack.append([])
+            pos += 1
+        elif char == ')':
+            done = stack.pop()
+            stack[-1].append(done)
+            pos += 1
+        elif char == '"':
+            end = pos + 1
+            value = ''
+            while line[end] != '"':
+                if line[end] == '\\':
+                    end += 1
+                value += line[end]
+                end += 1
+            stack[-1].append(value)
+            pos = end + 1
+        else:
+            match = re.compile(r'[^ ()\[]+(\[[^\]]*\](<[\d.]+>)?)?').match(line, pos)
+            stack[-1].append(match.group(0))
+            pos = match.end()
+    return stack[0]
+
+
+def parse_set(value, highest):
+    """Expand a sequence set such as 1:4,7,9:* into a predicate"""
+    ranges = []
+    for item in value.split(','):
+        if ':' in item:
+            low, high = item.split(':')
+        else:
+            low = high = item
+        low = highest if low == '*' else int(low)
+        high = highest if high == '*' else int(high)
+        ranges.append((min(low, high), max(low, high)))
+    return lambda num: any(low <= num <= high for low, high in ranges)
+
+
+def compact_set(numbers):
+    """Render numbers as an IMAP sequence set"""
+    numbers = sorted(numbers)
+    out = []
+    start = prev = None
+    for num in numbers:
+        if start is None:
+            start = prev = num
+        elif num == prev + 1:
+            prev = num
+        else:
+            out.append(str(start) if start == prev else '%s:%s' % (start, prev))
+            start = prev = num
+    if start is not None:
+        out.append(str(start) if start == prev else '%s:%s' % (start, prev))
+    return ','.join(out)
+
+
+def quote(value):
+    """Quote a string for a response"""
+    if value is None:
+        return 'NIL'
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def body_structure(part):
+    """Render the BODYSTRUCTURE of a message part"""
+    if part.is_multipart():
+        children = ''.join(body_structure(child) for child in part.get_payload())
+        params = ' '.join('%s %s' % (quote(key.upper()), quote(val)) for key, val in part.get_params()[1:])
+        return '(%s %s (%s) NIL NIL NIL)' % (children, quote(part.get_content_subtype().upper()), params)
+    payload = part.get_payload(decode=False)
+    if isinstance(payload, list):
+        payload = ''
+    size = len(payload.encode('utf-8', 'replace'))
+    params = ' '.join('%s %s' % (quote(key.upper()), quote(val)) for key, val in (part.get_params() or [])[1:])
+    params = '(%s)' % params if params else 'NIL'
+    fields = [quote(part.get_content_maintype().upper()), quote(part.get_content_subtype().upper()), params,
+              quote(part.get('Content-ID')), 'NIL', quote((part.get('Content-Transfer-Encoding') or '7BIT').upper()),
+              str(size)]
+    if part.get_content_maintype() == 'text':
+        fields.append(str(payload.count('\n')))
+    fields.append('NIL')
+    disposition = part.get('Content-Disposition')
+    if disposition:
+        kind = disposition.split(';')[0].strip()
+        dparams = ' '.join('%s %s' % (quote(key.upper()), quote(val))
+                           for key, val in part.get_params(header='content-disposition')[1:])
+        fields.append('(%s %s)' % (quote(kind.upper()), '(%s)' % dparams if dparams else 'NIL'))
+    else:
+        fields.append('NIL')
+    fields.append('NIL')
+    return '(' + ' '.join(fields) + ')'
+
+
+def section_part(message, section):
+    """Find the MIME part for a numeric section such as 2 or 1.3"""
+    part = message
+    for index in section.split('.'):
+        if part.is_multipart():
+            part = part.get_payload()[int(index) - 1]
+        elif index != '1':
+            return None
+    return part
+
+
+def section_bytes(message, section):
+    """Return the bytes for a BODY[section] fetch item"""
+    raw = message.raw
+    head, _, body = raw.partition(b'\n\n')
+    if b'\r\n\r\n' in raw:
+        head, _, body = raw.partition(b'\r\n\r\n')
+    if section == '':
+        return raw
+    if section == 'TEXT':
+        return body
+    if section == 'HEADER':
+        return head + b'\r\n\r\n'
+    match = re.match(r'HEADER\.FIELDS \(([^)]*)\)', section)
+    if match:
+        wanted = match.group(1).upper().split()
+        lines = []
+        for name in wanted:
+            value = message.parsed.get(name)
+            if value is not None:
+                lines.append('%s: %s' % (name.title(), value))
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+    part = section_part(message.parsed, section)
+    if part is None:
+        return b''
+    payload = part.get_payload(decode=False)
+    return payload.encode('utf-8') if isinstance(payload, str) else b''
+
+
+class ImapHandler(socketserver.StreamRequestHandler):
+    """One client session"""
+    def setup(self):
+        super().setup()
+        self.server.stats.count('CONNECT')
+        self.selected = None
+        self.qresync = False
+        self.condstore = False
+
+    def send(self, data):
+        """Write to the client and count the bytes"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        with self.server.stats.lock:
+            self.server.stats.bytes_out += len(data)
+        self.wfile.write(data)
+
+    def handle(self):
+        self.send('* OK [CAPABILITY %s] fake IMAP ready\r\n' % ' '.join(self.server.capabilities))
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            with self.server.stats.lock:
+                self.server.stats.bytes_in += len(line)
+            line = line.decode('utf-8').rstrip('\r\n')
+            if not line:
+                continue
+            tag, _, rest = line.partition(' ')
+            command, _, args = rest.partition(' ')
+            command = command.upper()
+            uid = False
+            if command == 'UID':
+                uid = True
+                command, _, args = args.partition(' ')
+                command = command.upper()
+            self.server.stats.count(('UID ' if uid else '') + command)
+            handler = getattr(self, 'do_' + command.replace('-', '_'), None)
+            if handler is None:
+                self.send('%s BAD unknown command %s\r\n' % (tag, command))
+                continue
+            try:
+                result = handler(tag, args, uid)
+            except Exception as exx:  # pylint: disable=broad-except
+                self.send('%s BAD %s\r\n' % (tag, exx))
+                continue
+            if result == 'LOGOUT':
+                return
+            if result == 'SENT':
+                continue
+            self.send('%s OK %s completed\r\n' % (tag, command))
+
+    def do_CAPABILITY(self, tag, args, uid):
+        self.send('* CAPABILITY %s\r\n' % ' '.join(self.server.capabilities))
+
+    def do_LOGIN(self, tag, args, uid):
+        user, password = tokenize(args)
+        if (user, password) != (self.server.username, self.server.password):
+            raise ValueError('[AUTHENTICATIONFAILED] invalid credentials')
+
+    def do_NOOP(self, tag, args, uid):
+        self._report_changes()
+
+    def do_LOGOUT(self, tag, args, uid):
+        self.send('* BYE logging out\r\n%s OK LOGOUT completed\r\n' % tag)
+        return 'LOGOUT'
+
+    def do_ENABLE(self, tag, args, uid):
+        enabled = [cap for cap in args.upper().split() if cap in self.server.capabilities]
+        if 'QRESYNC' in enabled:
+            self.qresync = self.condstore = True
+        if 'CONDSTORE' in enabled:
+            self.condstore = True
+        self.send('* ENABLED %s\r\n' % ' '.join(enabled))
+
+    def do_SELECT(self, tag, args, uid):
+        tokens = tokenize(args)
+        if tokens[0].upper() != 'INBOX':
+            self.selected = None
+            self.send('%s NO [NONEXISTENT] Unknown Mailbox: %s\r\n' % (tag, tokens[0]))
+            return 'SENT'
+        box = self.server.mailbox
+        self.selected = box
+        with box.lock:
+            self.known = [msg.uid for msg in box.messages]
+            self.seen_modseq = box.highestmodseq
+            self.send('* %s EXISTS\r\n* 0 RECENT\r\n' % len(box.messages))
+            self.send('* OK [UIDVALIDITY %s] UIDs valid\r\n' % box.uidvalidity)
+            self.send('* OK [UIDNEXT %s] Predicted next UID\r\n' % box.next_uid)
+            if 'CONDSTORE' in self.server.capabilities:
+                self.send('* OK [HIGHESTMODSEQ %s] Highest\r\n' % box.highestmodseq)
+            if len(tokens) > 1 and self.qresync:
+                params = tokens[1]
+                if params and params[0].upper() == 'QRESYNC':
+                    qparams = params[1]
+                    uidvalidity, modseq = int(qparams[0]), int(qparams[1])
+                    if uidvalidity == box.uidvalidity:
+                        known = parse_set(qparams[2], box.next_uid) if len(qparams) > 2 else (lambda num: True)
+                        vanished = [num for num, seq in box.expunged if seq > modseq and known(num)]
+                        if vanished:
+                            self.send('* VANISHED (EARLIER) %s\r\n' % compact_set(vanished))
+                        for index, msg in enumerate(box.messages, 1):
+                            if msg.modseq > modseq and known(msg.uid):
+                                self.send('* %s FETCH (UID %s MODSEQ (%s) FLAGS ())\r\n'
+                                          % (index, msg.uid, msg.modseq))
+        self.send('%s OK [READ-WRITE] SELECT completed\r\n' % tag)
+        return 'SENT'
+
+    do_EXAMINE = do_SELECT
+
+    def _report_changes(self):
+        """Send EXISTS / EXPUNGE (VANISHED once QRESYNC is enabled) for changes since the last report"""
+        box = self.selected
+        if box is None:
+            return False
+        with box.lock:
+            current = [msg.uid for msg in box.messages]
+            changed = False
+            vanished = [num for num, _ in box.expunged if num in self.known]
+            for num in vanished:
+                if not self.qresync:
+                    self.send('* %s EXPUNGE\r\n' % (self.known.index(num) + 1))
+                self.known.remove(num)
+                changed = True
+            if vanished and self.qresync:
+                self.send('* VANISHED %s\r\n' % compact_set(vanished))
+            if len(current) != len(self.known):
+                self.send('* %s EXISTS\r\n' % len(current))
+                changed = True
+            self.known = current
+        return changed
+
+    def do_IDLE(self, tag, args, uid):
+        self.send('+ idling\r\n')
+        box = self.selected
+        done = threading.Event()
+
+        def wait_for_done():
+            line = self.rfile.readline()
+            with self.server.stats.lock:
+                self.server.stats.bytes_in += len(line)
+            done.set()
+            with box.lock:
+                box.changed.notify_all()
+
+        reader = threading.Thread(target=wait_for_done, daemon=True)
+        reader.start()
+        while not done.is_set():
+            self._report_changes()
+            with box.lock:
+                box.changed.wait(0.5)
+        reader.join()
+
+    def _matches(self, msg, keys, highest):
+        """Evaluate a list of search keys against one message"""
+        keys = list(keys)
+        while keys:
+            key = keys.pop(0)
+            if isinstance(key, list):
+                if not self._matches(msg, key, highest):
+                    return False
+                continue
+            name = key.upper()
+            if name == 'ALL':
+                continue
+            if name == 'UID':
+                if not parse_set(keys.pop(0), highest)(msg.uid):
+                    return False
+            elif re.match(r'^[\d*:,]+$', name):
+                continue
+            elif name == 'SUBJECT':
+                if keys.pop(0).lower() not in msg.header('Subject').lower():
+                    return False
+            elif name == 'FROM':
+                if keys.pop(0).lower() not in msg.header('From').lower():
+                    return False
+            elif name == 'SINCE':
+                if msg.day < parse_imap_date(keys.pop(0)):
+                    return False
+            elif name == 'OR':
+                left, right = keys.pop(0), keys.pop(0)
+                if not (self._matches(msg, [left], highest) or self._matches(msg, [right], highest)):
+                    return False
+            elif name == 'NOT':
+                if self._matches(msg, [keys.pop(0)], highest):
+                    return False
+            elif name == 'MODSEQ':
+                if msg.modseq <= int(keys.pop(0)):
+                    return False
+            elif name == 'X-GM-RAW':
+                if not self._gm_raw(msg, keys.pop(0)):
+                    return False
+            else:
+                raise ValueError('unsupported search key %s' % key)
+        return True
+
+    def _gm_raw(self, msg, query):
+        """A tiny subset of Gmail search syntax: subject: and from: terms, parentheses and OR"""
+        for alternative in re.split(r'\s+OR\s+', query):
+            terms = re.findall(r'(subject|from):(?:"([^"]*)"|([^\s()]+))', alternative)
+            if terms and all((quoted or bare).lower() in msg.header(field).lower()
+                             for field, quoted, bare in terms):
+                return True
+        return False
+
+    def do_SEARCH(self, tag, args, uid):
+        tokens = tokenize(args)
+        returns = None
+        if tokens and isinstance(tokens[0], str) and tokens[0].upper() == 'RETURN':
+            tokens.pop(0)
+            returns = [item.upper() for item in tokens.pop(0)] or ['ALL']
+        if tokens and isinstance(tokens[0], str) and tokens[0].upper() == 'CHARSET':
+            tokens = tokens[2:]
+        box = self.selected
+        with box.lock:
+            highest = box.messages[-1].uid if box.messages else 0
+            hits = [(index, msg) for index, msg in enumerate(box.messages, 1)
+                    if self._matches(msg, tokens, highest)]
+        numbers = [msg.uid if uid else index for index, msg in hits]
+        if returns is None:
+            self.send('* SEARCH%s\r\n' % ''.join(' %s' % num for num in numbers))
+            return
+        out = '* ESEARCH (TAG "%s")%s' % (tag, ' UID' if uid else '')
+        if 'COUNT' in returns:
+            out += ' COUNT %s' % len(numbers)
+        if 'MIN' in returns and numbers:
+            out += ' MIN %s' % min(numbers)
+        if 'MAX' in returns and numbers:
+            out += ' MAX %s' % max(numbers)
+        if 'ALL' in returns and numbers:
+            out += ' ALL %s' % compact_set(numbers)
+        self.send(out + '\r\n')
+
+    def do_FETCH(self, tag, args, uid):
+        tokens = tokenize(args)
+        sequence = tokens[0]
+        items = tokens[1] if isinstance(tokens[1], list) else tokens[1:]
+        changedsince = None
+        if len(tokens) > 2 and isinstance(tokens[2], list) and tokens[2][0].upper() == 'CHANGEDSINCE':
+            changedsince = int(tokens[2][1])
+        if items and isinstance(items[0], str) and items[0].upper() == 'FAST':
+            items = ['FLAGS', 'INTERNALDATE', 'RFC822.SIZE']
+        box = self.selected
+        with box.lock:
+            messages = list(enumerate(box.messages, 1))
+        highest = messages[-1][1].uid if messages else 0
+        wanted = parse_set(sequence, highest if uid else len(messages))
+        for index, msg in messages:
+            if not wanted(msg.uid if uid else index):
+                continue
+            if changedsince is not None and msg.modseq <= changedsince:
+                continue
+            out = []
+            if uid:
+                out.append('UID %s' % msg.uid)
+            for item in items:
+                name = item.upper()
+                if name == 'UID':
+                    if not uid:
+                        out.append('UID %s' % msg.uid)
+                elif name == 'FLAGS':
+                    out.append('FLAGS (%s)' % ' '.join(sorted(msg.flags)))
+                elif name == 'MODSEQ':
+                    out.append('MODSEQ (%s)' % msg.modseq)
+                elif name == 'INTERNALDATE':
+                    out.append('INTERNALDATE "%s 08:00:00 +0000"' % imap_date(msg.day))
+                elif name == 'RFC822.SIZE':
+                    out.append('RFC822.SIZE %s' % len(msg.raw))
+                elif name == 'BODYSTRUCTURE':
+                    out.append('BODYSTRUCTURE ' + body_structure(msg.parsed))
+                elif name == 'RFC822':
+                    msg.flags.add('\\Seen')
+                    out.append(('RFC822', msg.raw))
+                else:
+                    match = re.match(r'BODY(\.PEEK)?\[([^\]]*)\](?:<(\d+)\.(\d+)>)?$', item, re.I)
+                    if not match:
+                        raise ValueError('unsupported fetch item %s' % item)
+                    section = match.group(2)
+                    data = section_bytes(msg, section.upper() if not section[:1].isdigit() else section)
+                    label = 'BODY[%s]' % section
+                    if match.group(3) is not None:
+                        start, length = int(match.group(3)), int(match.group(4))
+                        data = data[start:start + length]
+                        label += '<%s>' % start
+                    if not match.group(1):
+                        msg.flags.add('\\Seen')
+                    out.append((label, data))
+            self._send_fetch(index, out)
+
+    def _send_fetch(self, index, items):
+        """Write one FETCH response, using literals for binary items"""
+        chunks = []
+        text = '* %s FETCH (' % index
+        for number, item in enumerate(items):
+            sep = ' ' if number else ''
+            if isinstance(item, tuple):
+                label, data = item
+                text += '%s%s {%s}\r\n' % (sep, label, len(data))
+                chunks.append(text.encode('utf-8'))
+                chunks.append(data)
+                text = ''
+            else:
+                text += sep + item
+        text += ')\r\n'
+        chunks.append(text.encode('utf-8'))
+        self.send(b''.join(chunks))
+
+
+class FakeImapServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """A threaded fake IMAP server listening on localhost"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, mailbox, username='user@example.com', password='secret', capabilities=None):
+        super().__init__(('127.0.0.1', 0), ImapHandler)
+        self.mailbox = mailbox
+        self.username = username
+        self.password = password
+        self.capabilities = list(capabilities or ['IMAP4rev1', 'IDLE', 'ENABLE', 'ESEARCH',
+                                                  'CONDSTORE', 'QRESYNC'])
+        self.stats = Stats()
+        self._thread = None
+
+    @property
+    def port(self):
+        """The port the server is listening on"""
+        return self.server_address[1]
+
+    def start(self):
+        """Serve on a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        self.shutdown()
+        self.server_close()
+
+
+def serve(conn, size, seed, capabilities=None):
+    """Child process: seed a mailbox, serve it and follow the commands sent over conn"""
+    server = FakeImapServer(seed_mailbox(Mailbox(), size, **seed), capabilities=capabilities).start()
+    conn.send(server.port)
+    while True:
+        command, args = conn.recv()
+        if command == 'digest':
+            images, number = args
+            conn.send(server.mailbox.append(make_digest(datetime.date.today(), images, seed['image_width'],
+                                                        seed=1000 + number)))
+        elif command == 'expunge':
+            conn.send(server.mailbox.expunge(args))
+        elif command == 'stats':
+            stats = server.stats
+            conn.send({'commands': dict(stats.commands), 'bytes_in': stats.bytes_in, 'bytes_out': stats.bytes_out})
+            stats.reset()
+        elif command == 'stop':
+            server.stop()
+            conn.send(None)
+            return
+
+
+class ServerProcess:
+    """A seeded FakeImapServer in a child process, so the server stays out of the client's memory figures"""
+    def __init__(self, size, digests=1, images=5, notices=2, image_width=640, days=1, capabilities=None):
+        self._size = size
+        self._capabilities = capabilities
+        self._seed = {'digests': digests, 'images': images, 'notices': notices,
+                      'image_width': image_width, 'days': days}
+        self._conn = None
+        self._process = None
+        self.port = None
+
+    def __enter__(self):
+        self._conn, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=serve, daemon=True,
+                                                args=(child, self._size, self._seed, self._capabilities))
+        self._process.start()
+        self.port = self._conn.recv()
+        return self
+
+    def __exit__(self, *exc):
+        self._call('stop')
+        self._process.join()
+
+    def add_digest(self, images, number=0):
+        """Deliver a new digest for today, returns its UID"""
+        return self._call('digest', (images, number))
+
+    def expunge(self, uid):
+        """Remove a message, as if the user deleted it"""
+        return self._call('expunge', uid)
+
+    def stats(self):
+        """Server side counters since the last call"""
+        return self._call('stats')
+
+    def _call(self, command, args=None):
+        """Send a command to the child and wait for its answer"""
+        self._conn.send((command, args))
+        return self._conn.recv()
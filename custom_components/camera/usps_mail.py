@@ -8,12 +8,11 @@ For more details about this component, please refer to the documentation at
 https://github.com/custom-components/usps_mail
 """
 import logging
-import base64
 
 from homeassistant.components.camera import Camera
-from custom_components.usps_mail import USPS_MAIL_DATA
+from custom_components.usps_mail import USPS_MAIL_DATA, image_content_type, image_url
 
-__version__ = '0.0.5'
+__version__ = '0.1.5'
 _LOGGER = logging.getLogger(__name__)
 
 CONF_FILE_PATH = 'file_path'
@@ -22,31 +21,61 @@ DEFAULT_NAME = 'USPS Mail Pictures'
 
 def setup_platform(hass, config, add_devices, discovery_info=None):
     """Set up the Camera that works with local files."""
-    camera = UspsMailCamera(hass, DEFAULT_NAME)
+    discovery_info = discovery_info or {}
+    camera = UspsMailCamera(hass, discovery_info.get('name', DEFAULT_NAME), discovery_info.get('account'))
     add_devices([camera])
 
 
 class UspsMailCamera(Camera):
     """Representation of a local file camera."""
 
-    def __init__(self, hass, name):
+    def __init__(self, hass, name, account=None):
         """Initialize USPS Mail Camera component."""
         super().__init__()
         self.is_streaming = False
         self.hass = hass
         self._name = name
+        self._account = account
+        # The image view checks the access tokens of the camera showing an image.
+        hass.data[USPS_MAIL_DATA][account]['camera'] = self
 
-    def camera_image(self):
-        """Return image response."""
-        total = self.hass.data[USPS_MAIL_DATA]['total']
-        if self.hass.data[USPS_MAIL_DATA]['count'] == total - 1 or total == 0:
-            self.hass.data[USPS_MAIL_DATA]['count'] = 0
-        else:
-            self.hass.data[USPS_MAIL_DATA]['count'] = self.hass.data[USPS_MAIL_DATA]['count'] + 1
-        image = self.hass.data[USPS_MAIL_DATA]['images'][self.hass.data[USPS_MAIL_DATA]['count']]
-        return base64.b64decode(image)
+    def camera_image(self, width=None, height=None):
+        """Return the smallest prebuilt picture that covers the requested size."""
+        store = self.hass.data[USPS_MAIL_DATA][self._account]['image_store']
+        variants = store.variants
+        if not variants:
+            return None
+        digest = variants[-1][2]
+        if width is not None or height is not None:
+            for variant_width, variant_height, variant_digest in variants:
+                if variant_width is None:
+                    break
+                if (width is None or variant_width >= width) and (height is None or variant_height >= height):
+                    digest = variant_digest
+                    break
+        image = store.get(digest)
+        if image is not None:
+            # A GIF in animation mode, a JPEG otherwise, the camera proxy sends this along with the image.
+            self.content_type = image_content_type(image)
+        return image
 
     @property
     def name(self):
         """Return the name of this camera."""
         return self._name
+
+    @property
+    def device_state_attributes(self):
+        """Return addresses of today's mailpieces and of every size of the camera picture."""
+        store = self.hass.data[USPS_MAIL_DATA][self._account]['image_store']
+        attributes = {'images': [self._image_url(digest) for digest in store.pieces]}
+        if store.variants:
+            attributes['picture'] = self._image_url(store.variants[-1][2])
+        # Home Assistant never asks camera_image for a size, so the smaller ones are only reachable from here.
+        for width, _, digest in store.variants[:-1]:
+            attributes['picture_{}'.format(width)] = self._image_url(digest)
+        return attributes
+
+    def _image_url(self, digest):
+        """The address of an image, with the current access token like the camera's own entity_picture"""
+        return image_url(digest) + '?token=' + self.access_tokens[-1]
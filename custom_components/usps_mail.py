@@ -7,166 +7,1492 @@ https://skalavala.github.io/usps/
 For more details about this component, please refer to the documentation at
 https://github.com/custom-components/usps_mail
 """
+import asyncio
 import base64
+import binascii
+import collections
+import concurrent.futures
+import contextlib
 import datetime
 import email
+import email.message
+import email.parser
+import email.policy
+import email.utils
+import hashlib
 import imaplib
+import io
+import json
 import logging
+import math
 import os
+import quopri
+import random
+import re
+import socket
+import sqlite3
 import sys
+import tempfile
+import threading
+import time
 import requests
 import voluptuous as vol
+from aiohttp import web
 import homeassistant.helpers.config_validation as cv
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_PORT
-from homeassistant.helpers.discovery import load_platform
-from homeassistant.helpers.event import track_time_interval
+from homeassistant.const import (
+    CONF_EMAIL, CONF_NAME, CONF_PASSWORD, CONF_PORT, CONF_SCAN_INTERVAL, EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP, STATE_UNKNOWN)
+from homeassistant.components.http import HomeAssistantView, KEY_AUTHENTICATED
+from homeassistant.core import callback
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.event import async_track_point_in_time, async_track_time_change
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
 
-__version__ = '0.1.1'
+__version__ = '0.1.2'
 _LOGGER = logging.getLogger(__name__)
 
+REQUIREMENTS = ['pillow==5.2.0']
+DEPENDENCIES = ['http']
+
 DOMAIN = 'usps_mail'
 USPS_MAIL_DATA = DOMAIN + '_data'
+CONF_ACCOUNTS = 'accounts'
 CONF_PROVIDER = 'provider'
 CONF_INBOXFOLDER = 'inbox_folder'
 CONF_CAMERA = 'camera'
 CONF_DEFAULT_IMG = 'default_image'
+CONF_IDLE = 'idle'
+CONF_FETCH_MODE = 'fetch_mode'
+CONF_FETCH_CHUNK = 'fetch_chunk_size'
+CONF_CACHE_SIZE = 'cache_size'
+CONF_CACHE_DAYS = 'cache_days'
+CONF_CAMERA_MODE = 'camera_mode'
+CONF_CAMERA_WIDTHS = 'camera_widths'
+CONF_BUSY_SCAN_INTERVAL = 'busy_scan_interval'
+CONF_MAX_SCAN_INTERVAL = 'max_scan_interval'
+CONF_DELIVERY_WINDOW = 'delivery_window'
+CONF_PERCEPTUAL_HASH = 'perceptual_hash'
+CONF_MEMORY_SIZE = 'memory_size'
+
+FETCH_PARTS = 'bodystructure'
+FETCH_RFC822 = 'rfc822'
+
+CAMERA_ANIMATION = 'animation'
+CAMERA_MOSAIC = 'mosaic'
+FRAME_DURATION = datetime.timedelta(seconds=3)
+SIMILAR_IMAGE_DISTANCE = 5
+
+DIGEST_SUBJECT = 'Informed Delivery Daily Digest'
+NOTICE_FROM = 'auto-reply@usps.com'
+NOTICE_SUBJECTS = ['Expected Delivery', 'Out for Delivery', 'Item Delivered']
+NOTICE_EXPECTED = 'Expected'
+NOTICE_OUT_FOR_DELIVERY = 'Out for Delivery'
+NOTICE_DELIVERED = 'Delivered'
+NOTICE_STATUSES = [NOTICE_EXPECTED, NOTICE_OUT_FOR_DELIVERY, NOTICE_DELIVERED]
+MAIL_DIGEST = 'digest'
+MAIL_NOTICE = 'notice'
+HEADER_FIELDS = 'BODY.PEEK[HEADER.FIELDS (FROM SUBJECT)]'
+NOTICE_FIELDS = 'BODY.PEEK[HEADER.FIELDS (SUBJECT DATE)]'
+NOTICE_TEXT_SIZE = 4096
+NOTICE_TEXT = 'BODY.PEEK[TEXT]<0.' + str(NOTICE_TEXT_SIZE) + '>'
+DIGEST_SEARCH = 'SUBJECT "' + DIGEST_SUBJECT + '"'
+NOTICE_SEARCH = ('FROM "' + NOTICE_FROM + '" OR (OR (SUBJECT "' + NOTICE_SUBJECTS[0] + '") (SUBJECT "'
+                 + NOTICE_SUBJECTS[1] + '")) (SUBJECT "' + NOTICE_SUBJECTS[2] + '")')
+DIGEST_GMAIL = 'subject:"' + DIGEST_SUBJECT + '"'
+NOTICE_GMAIL = ' OR '.join('(from:' + NOTICE_FROM + ' subject:"' + subject + '")' for subject in NOTICE_SUBJECTS)
+NOTICE_STATUS = re.compile(r'\b(?:(expected delivery)|(out for delivery)|(delivered))\b', re.IGNORECASE)
+TRACKING_NUMBER = re.compile(r'\b(9[1-5]\d{18,24}|[A-Z]{2}\d{9}US)\b')
+
+MIN_CAMERA_VERSION = '0.1.5'
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+CACHE_DIR = DOMAIN + '_images'
+CACHE_INDEX = 'index.json'
+CACHE_USED_RESOLUTION = datetime.timedelta(hours=1)
+MEMORY_SIZE = 10 * 1024 * 1024
+IMAGE_URL = '/api/' + DOMAIN + '/images/{digest}'
+IMAGE_CACHE_CONTROL = 'private, max-age=31536000, immutable'
+HISTORY_DB = DOMAIN + '_history.db'
+HISTORY_DAYS = 7
+HISTORY_PERIODS = ['day', 'week', 'month']
+ATTR_ACCOUNT = 'account'
+ATTR_PERIOD = 'period'
+ATTR_COUNT = 'count'
+EVENT_HISTORY = DOMAIN + '_history'
+HISTORY_TABLES = """
+CREATE TABLE IF NOT EXISTS digests (
+    account TEXT NOT NULL, uidvalidity INTEGER NOT NULL, uid INTEGER NOT NULL, day TEXT NOT NULL,
+    pieces INTEGER NOT NULL, hashes TEXT NOT NULL, PRIMARY KEY (account, uidvalidity, uid));
+CREATE TABLE IF NOT EXISTS deliveries (
+    account TEXT NOT NULL, uidvalidity INTEGER NOT NULL, uid INTEGER NOT NULL, day TEXT NOT NULL,
+    PRIMARY KEY (account, uidvalidity, uid));
+CREATE INDEX IF NOT EXISTS digests_by_day ON digests (account, day);
+CREATE INDEX IF NOT EXISTS deliveries_by_day ON deliveries (account, day);
+"""
+
+SCAN_INTERVAL = datetime.timedelta(hours=1)
+BUSY_SCAN_INTERVAL = datetime.timedelta(minutes=10)
+MAX_SCAN_INTERVAL = datetime.timedelta(hours=4)
+DELIVERY_WINDOW = datetime.timedelta(minutes=45)
+SCAN_JITTER = 0.1
+MAX_ARRIVALS = 30
+BACKOFF_START = datetime.timedelta(minutes=1)
+BACKOFF_MAX = datetime.timedelta(hours=1)
+AUTH_FAILURE_LIMIT = 3
+BREAKER_COOLDOWN = datetime.timedelta(hours=6)
+HEALTH_OK = 'ok'
+HEALTH_BACKOFF = 'backoff'
+HEALTH_OPEN = 'open'
+HEALTH_HALF_OPEN = 'half_open'
+SCAN_PHASES = ['connect', 'tls', 'login', 'select', 'search', 'fetch', 'parse', 'encode', 'publish']
+SCAN_BUCKETS = [0.5, 1, 2, 5, 10, 30, 60]
+MAX_SCAN_WORKERS = 4
+IMAP_TIMEOUT = datetime.timedelta(seconds=60)
+DOWNLOAD_TIMEOUT = datetime.timedelta(seconds=30)
+IDLE_TIMEOUT = datetime.timedelta(minutes=29)
+IDLE_RETRY = datetime.timedelta(minutes=1)
+IDLE_CHANGE = re.compile(br'\* (\d+ (EXISTS|EXPUNGE)|VANISHED)\b')
+IMAP_LITERAL = re.compile(br'\{(\d+)\}$')
+LITERAL_CHUNK = 64 * 1024
+IMAP_TOKEN = re.compile(r'\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|\{(\d+)\}\s*$|([^\s()"\[]+(?:\[[^\]]*\](?:<\d+>)?)?))')
+
+ACCOUNT_SCHEMA = vol.Schema({
+    vol.Optional(CONF_NAME): cv.slug,
+    vol.Required(CONF_PROVIDER): cv.string,
+    vol.Required(CONF_EMAIL): cv.string,
+    vol.Required(CONF_PASSWORD): cv.string,
+    vol.Optional(CONF_INBOXFOLDER, default='Inbox'): cv.string,
+    vol.Optional(CONF_PORT, default='993'): cv.string,
+})
 
-MIN_CAMERA_VERSION = '0.0.5'
 
-INTERVAL = datetime.timedelta(hours=1)
+def merge_accounts(conf):
+    """Make the account set up at the top level the first of the accounts"""
+    accounts = list(conf[CONF_ACCOUNTS])
+    if CONF_EMAIL in conf:
+        accounts.insert(0, ACCOUNT_SCHEMA({key: conf[key] for key in (
+            CONF_PROVIDER, CONF_EMAIL, CONF_PASSWORD, CONF_INBOXFOLDER, CONF_PORT)}))
+    if not accounts:
+        raise vol.Invalid('Set up at least one account')
+    names = [account.get(CONF_NAME) for account in accounts]
+    if len(set(names)) != len(names):
+        raise vol.Invalid('Every account needs its own name')
+    conf = dict(conf)
+    conf[CONF_ACCOUNTS] = accounts
+    return conf
+
 
 CONFIG_SCHEMA = vol.Schema({
-    DOMAIN: vol.Schema({
-        vol.Required(CONF_PROVIDER): cv.string,
-        vol.Required(CONF_EMAIL): cv.string,
-        vol.Required(CONF_PASSWORD): cv.string,
+    DOMAIN: vol.All(vol.Schema({
+        vol.Inclusive(CONF_PROVIDER, 'account'): cv.string,
+        vol.Inclusive(CONF_EMAIL, 'account'): cv.string,
+        vol.Inclusive(CONF_PASSWORD, 'account'): cv.string,
+        vol.Optional(CONF_ACCOUNTS, default=[]): vol.All(cv.ensure_list, [ACCOUNT_SCHEMA]),
         vol.Optional(CONF_DEFAULT_IMG, default='None'): cv.string,
         vol.Optional(CONF_CAMERA, default=False): cv.boolean,
         vol.Optional(CONF_INBOXFOLDER, default='Inbox'): cv.string,
         vol.Optional(CONF_PORT, default='993'): cv.string,
-    })
+        vol.Optional(CONF_IDLE, default=False): cv.boolean,
+        vol.Optional(CONF_FETCH_MODE, default=FETCH_PARTS): vol.In([FETCH_PARTS, FETCH_RFC822]),
+        vol.Optional(CONF_FETCH_CHUNK, default=25): cv.positive_int,
+        vol.Optional(CONF_CACHE_SIZE, default=50): cv.positive_int,
+        vol.Optional(CONF_CACHE_DAYS, default=7): cv.positive_int,
+        vol.Optional(CONF_MEMORY_SIZE, default=10): cv.positive_int,
+        vol.Optional(CONF_CAMERA_MODE, default=CAMERA_ANIMATION): vol.In([CAMERA_ANIMATION, CAMERA_MOSAIC]),
+        vol.Optional(CONF_CAMERA_WIDTHS, default=[320, 640]): vol.All(cv.ensure_list, [cv.positive_int]),
+        vol.Optional(CONF_SCAN_INTERVAL, default=SCAN_INTERVAL): cv.time_period,
+        vol.Optional(CONF_BUSY_SCAN_INTERVAL, default=BUSY_SCAN_INTERVAL): cv.time_period,
+        vol.Optional(CONF_MAX_SCAN_INTERVAL, default=MAX_SCAN_INTERVAL): cv.time_period,
+        vol.Optional(CONF_DELIVERY_WINDOW, default=DELIVERY_WINDOW): cv.time_period,
+        vol.Optional(CONF_PERCEPTUAL_HASH, default=False): cv.boolean,
+    }), merge_accounts)
 }, extra=vol.ALLOW_EXTRA)
 
+HISTORY_SERVICE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_ACCOUNT): cv.slug,
+    vol.Optional(ATTR_PERIOD, default='day'): vol.In(HISTORY_PERIODS),
+    vol.Optional(ATTR_COUNT, default=HISTORY_DAYS): cv.positive_int,
+})
+
 CAMERA_URL = 'https://raw.githubusercontent.com/custom-components/usps_mail/master/custom_components/camera/usps_mail.py'
+NO_MAIL_IMAGE = 'usps_mail_no_mail.gif'
+NO_MAIL_URL = 'https://raw.githubusercontent.com/custom-components/usps_mail/master/custom_components/' + NO_MAIL_IMAGE
+
+IMAGE_FILES = {}
+IMAGE_FILES_LOCK = threading.Lock()
+CURRENT_SCAN = threading.local()
 
-def setup(hass, config):
+async def async_setup(hass, config):
     """Set up this component."""
     _LOGGER.info('version %s is starting, if you have ANY issues with this, please report'
                  ' them here: https://github.com/custom-components/usps_mail', __version__)
-    mailserver = get_mailserver(config[DOMAIN][CONF_PROVIDER])
-    port = config[DOMAIN][CONF_PORT]
-    inbox_folder = config[DOMAIN][CONF_INBOXFOLDER]
-    username = config[DOMAIN][CONF_EMAIL]
-    password = config[DOMAIN][CONF_PASSWORD]
-    camera = config[DOMAIN][CONF_CAMERA]
-    image = config[DOMAIN][CONF_DEFAULT_IMG]
+    conf = config[DOMAIN]
     ha_conf_dir = str(hass.config.path())
-    usps_mail = UspsMail(hass, mailserver, port, inbox_folder, username, password, image, ha_conf_dir)
-    if camera:
+    history = MailHistory(hass.config.path('.storage', HISTORY_DB))
+    accounts = []
+    for account in conf[CONF_ACCOUNTS]:
+        name = account.get(CONF_NAME)
+        session = ImapSession(get_mailserver(account[CONF_PROVIDER]), account[CONF_PORT],
+                              account[CONF_INBOXFOLDER], account[CONF_EMAIL], account[CONF_PASSWORD])
+        cache = ImageCache(hass.config.path('.storage', account_id(CACHE_DIR, name)),
+                           conf[CONF_CACHE_SIZE] * 1024 * 1024, datetime.timedelta(days=conf[CONF_CACHE_DAYS]))
+        image_store = ImageStore(cache, conf[CONF_MEMORY_SIZE] * 1024 * 1024)
+        schedule = ScanSchedule(conf[CONF_SCAN_INTERVAL], conf[CONF_BUSY_SCAN_INTERVAL],
+                                conf[CONF_MAX_SCAN_INTERVAL], conf[CONF_DELIVERY_WINDOW])
+        usps_mail = UspsMail(hass, session, conf[CONF_DEFAULT_IMG], ha_conf_dir, conf[CONF_FETCH_MODE],
+                             conf[CONF_FETCH_CHUNK], cache, conf[CONF_CAMERA_MODE], conf[CONF_CAMERA_WIDTHS], name,
+                             schedule, history, conf[CONF_PERCEPTUAL_HASH], image_store)
+        await usps_mail.async_restore()
+        accounts.append(usps_mail)
+    pool = ScanPool(min(len(accounts), MAX_SCAN_WORKERS))
+    if conf[CONF_CAMERA]:
         camera_dir = str(hass.config.path("custom_components/camera/"))
-        camera_file = 'usps_mail.py'
-        camera_full_path = camera_dir + camera_file
-        if not os.path.isfile(camera_full_path):
-            get_camera(camera_file, camera_dir)
-        with open(camera_full_path, 'r') as local:
-            for line in local.readlines():
-                if '__version__' in line:
-                    camera_version = line.split("'")[1]
-                    break
-        local.close()
-        if camera_version != MIN_CAMERA_VERSION:
-            get_camera(camera_file, camera_dir)
-        load_platform(hass, 'camera', DOMAIN, {}, config)
-    def scan_mail_service(call):
+        await hass.async_add_executor_job(update_camera, 'usps_mail.py', camera_dir)
+        for usps_mail in accounts:
+            hass.async_create_task(async_load_platform(
+                hass, 'camera', DOMAIN, {'account': usps_mail.name, 'name': usps_mail.camera_name}, config))
+    @callback
+    def scan_all(call):
+        """Queue a scan of every account."""
+        return [pool.submit(usps_mail, call) for usps_mail in accounts]
+    async def async_scan_mail_service(call):
         """Set up service for manual trigger."""
-        usps_mail.scan_mail(call)
-    track_time_interval(hass, usps_mail.scan_mail, INTERVAL)
-    hass.services.register(DOMAIN, 'scan_mail', scan_mail_service)
+        await asyncio.gather(*[asyncio.wrap_future(future) for future in scan_all(call)])
+    @callback
+    def async_poll(usps_mail):
+        """Scan an account whenever its schedule says so."""
+        @callback
+        def async_scheduled_scan(now):
+            """Queue the scan and work out when the next one is due."""
+            pool.submit(usps_mail, now)
+            async_track_point_in_time(hass, async_scheduled_scan, usps_mail.schedule.next_scan(now))
+        async_track_point_in_time(hass, async_scheduled_scan, usps_mail.schedule.next_scan(dt_util.now()))
+    def watch(usps_mail):
+        """Scan an account when the server reports a change in its mailbox."""
+        def start_polling():
+            """Fall back to the schedule, called from the IDLE watcher thread."""
+            hass.add_job(async_poll, usps_mail)
+        watcher = IdleWatcher(usps_mail.session.copy(), lambda: pool.submit(usps_mail, 'idle'), start_polling)
+        watcher.start()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, watcher.stop)
+    for usps_mail in accounts:
+        if conf[CONF_IDLE]:
+            watch(usps_mail)
+        else:
+            async_poll(usps_mail)
+    # Neither IDLE nor a long quiet spell should keep the sensors from rolling over to a new day.
+    async_track_time_change(hass, scan_all, hour=0, minute=0, second=0)
+    @callback
+    def async_first_scan(event):
+        """Run the first scan in the background."""
+        # The pool is not tracked by Home Assistant, so startup never waits on the mailbox.
+        scan_all('startup')
+    if hass.is_running:
+        async_first_scan(None)
+    else:
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, async_first_scan)
+    hass.services.async_register(DOMAIN, 'scan_mail', async_scan_mail_service)
+    hass.http.register_view(UspsMailImageView())
+    async def async_history_service(call):
+        """Count the mail in the history and fire an event with the counts."""
+        account = call.data.get(ATTR_ACCOUNT)
+        periods = await hass.async_add_executor_job(
+            history.counts, account, call.data[ATTR_PERIOD], call.data[ATTR_COUNT], datetime.date.today())
+        hass.bus.async_fire(EVENT_HISTORY, {ATTR_ACCOUNT: account, ATTR_PERIOD: call.data[ATTR_PERIOD],
+                                            'periods': periods})
+    hass.services.async_register(DOMAIN, 'history', async_history_service, schema=HISTORY_SERVICE_SCHEMA)
+    for usps_mail in accounts:
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, usps_mail.close)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, pool.shutdown)
     return True
 
-
 class UspsMail:
     """The class for this component"""
-    def __init__(self, hass, mailserver, port, inbox_folder, username, password, image, ha_conf_dir):
+    def __init__(self, hass, session, image, ha_conf_dir, fetch_mode=FETCH_PARTS, fetch_chunk=25, cache=None,
+                 camera_mode=CAMERA_ANIMATION, camera_widths=(320, 640), name=None, schedule=None, history=None,
+                 perceptual_hash=False, image_store=None):
         self.hass = hass
+        self.name = name
+        self.session = session
+        self.schedule = schedule or ScanSchedule()
         self.packages = None
         self.letters = None
         self.ha_conf_dir = ha_conf_dir
-        self._mailserver = mailserver
-        self._port = port
         self._default_image = image
-        self._inbox_folder = inbox_folder
-        self._username = username
-        self._password = password
-        self.hass.data[USPS_MAIL_DATA] = {}
-        self.scan_mail('now')
+        self._fetch_mode = fetch_mode
+        self._fetch_chunk = fetch_chunk
+        self._camera_mode = camera_mode
+        self._camera_widths = camera_widths
+        self._perceptual_hash = perceptual_hash
+        self._fingerprints = {}
+        self._cache = cache or ImageCache(os.path.join(ha_conf_dir, '.storage', CACHE_DIR))
+        self.image_store = image_store or ImageStore(self._cache)
+        self._store = Store(hass, STORAGE_VERSION, account_id(STORAGE_KEY, name, '.'))
+        self._history = history or MailHistory(os.path.join(ha_conf_dir, '.storage', HISTORY_DB))
+        self._date = None
+        self._uidvalidity = None
+        self._last_uid = 0
+        self._digests = {}
+        self._notices = {}
+        self._recorded = set()
+        self._searched_on = None
+        self._modseq = None
+        self._shown = None
+        label = '' if name is None else ' ' + name.replace('_', ' ').title()
+        self.camera_name = 'USPS Mail' + label + ' Pictures'
+        self._letters_entity = account_id('sensor.usps_letters', name)
+        self._packages_entity = account_id('sensor.usps_packages', name)
+        self._last_scan_entity = account_id('sensor.usps_mail_last_scan', name)
+        self.metrics = ScanMetrics({'icon': 'mdi:timer-outline', 'unit_of_measurement': 's',
+                                    'friendly_name': 'USPS Mail Last Scan' + label})
+        self.data = self.hass.data.setdefault(USPS_MAIL_DATA, {})[name] = {
+            'mailattr': {'icon': 'mdi:email-outline', 'friendly_name': 'USPS Mail' + label},
+            'packageattr': {'icon': 'mdi:package-variant', 'friendly_name': 'USPS Packages' + label},
+            'image_store': self.image_store,
+            'total': 0,
+        }
+
+    async def async_restore(self):
+        """Show the counts from the last scan today, or unknown, until the first scan is done"""
+        stored = await self._store.async_load() or {}
+        self._uidvalidity = stored.get('uidvalidity')
+        self._last_uid = stored.get('last_uid', 0)
+        self._modseq = stored.get('modseq')
+        self.schedule.arrivals = stored.get('arrivals', [])[-MAX_ARRIVALS:]
+        if stored.get('date') == get_formatted_date():
+            self._date = stored['date']
+            self._digests = {int(uid): hashes for uid, hashes in stored.get('digests', {}).items()}
+            self._notices = {int(uid): notice for uid, notice in stored.get('notices', {}).items()}
+            self.letters = stored.get('letters', STATE_UNKNOWN)
+            self.packages = stored.get('packages', STATE_UNKNOWN)
+        else:
+            self.letters = self.packages = STATE_UNKNOWN
+        self.remember_state()
+        await self.hass.async_add_executor_job(self.get_mails)
+        self.hass.states.async_set(self._letters_entity, self.letters, self.data['mailattr'])
+        self.hass.states.async_set(self._packages_entity, self.packages, self.data['packageattr'])
 
     def scan_mail(self, call):
         """Main logic of the component"""
+        self.metrics.start()
+        CURRENT_SCAN.metrics = self.metrics
         try:
-            account = self.login()
-            select_folder(account, self._inbox_folder)
-        except Exception as exx:
-            _LOGGER.debug("Error connecting logging into email server.")
-            _LOGGER.debug(str(exx))
+            result = self._scan()
+        finally:
+            CURRENT_SCAN.metrics = None
+        self.metrics.finish(result)
+        self.hass.states.set(self._last_scan_entity, self.metrics.state, self.metrics.attributes())
+
+    def _scan(self):
+        """Scan the mailbox and update the sensors, returns how it went"""
+        known = set(self._digests) | set(self._notices)
+        try:
+            with self.session.borrow() as account:
+                self.search_mail(account)
+        except ConnectionPaused as exx:
+            _LOGGER.debug("Not scanning %s: %s", self.session.username, exx)
+            self.publish()
+            return 'paused'
+        except (imaplib.IMAP4.error, OSError) as exx:
+            _LOGGER.error("Error scanning %s: %s", self.session.username, exx)
+            self.publish()
+            return 'error'
+        except Exception:
+            _LOGGER.exception("Unexpected error scanning %s", self.session.username)
+            self.publish()
+            return 'error'
+        self.schedule.record(dt_util.now(), bool((set(self._digests) | set(self._notices)) - known))
+        mail_count = self.get_mails()
+        package_count = self.package_count()
+        self.record_history()
+
+        self.letters = mail_count
+        self.packages = package_count
+        self.publish()
+        with scan_phase('publish'):
+            self.hass.add_job(self._store.async_save, {
+                'date': self._date, 'letters': mail_count, 'packages': package_count,
+                'uidvalidity': self._uidvalidity, 'last_uid': self._last_uid, 'modseq': self._modseq,
+                'digests': {str(uid): hashes for uid, hashes in self._digests.items()},
+                'notices': {str(uid): notice for uid, notice in self._notices.items()},
+                'arrivals': self.schedule.arrivals})
+        self.remember_state()
+        self._cache.cleanup({digest for hashes in self._digests.values() for digest in hashes}
+                            | self.image_store.digests())
+        return 'ok'
 
-        mail_count = self.get_mails(account)
-        package_count = self.package_count(account)
+    def remember_state(self):
+        """Let the next login resync the folder from what this scan knows, with QRESYNC"""
+        if self._uidvalidity is None or not self._modseq:
+            self.session.qresync = None
+        else:
+            self.session.qresync = (self._uidvalidity, self._modseq,
+                                    sorted(set(self._digests) | set(self._notices)))
 
-        self.hass.data[USPS_MAIL_DATA]['mailattr'] = {'icon': 'mdi:email-outline', 'friendly_name': 'USPS Mail'}
-        self.hass.data[USPS_MAIL_DATA]['packageattr'] = {'icon': 'mdi:package-variant', 'friendly_name': 'USPS Packages'}
-        self.hass.states.set('sensor.usps_letters', mail_count, self.hass.data[USPS_MAIL_DATA]['mailattr'])
-        self.hass.states.set('sensor.usps_packages', package_count, self.hass.data[USPS_MAIL_DATA]['packageattr'])
+    def record_history(self):
+        """Add today's digests and delivery notices that are not in the history yet"""
+        with scan_phase('publish'):
+            day = datetime.datetime.strptime(self._date, '%d-%b-%Y').date()
+            digests = {uid: hashes for uid, hashes in self._digests.items() if uid not in self._recorded}
+            deliveries = self.delivered() - self._recorded
+            try:
+                if digests or deliveries:
+                    self._history.record(self.name, self._uidvalidity, day, digests, deliveries)
+                    self._recorded.update(digests)
+                    self._recorded.update(deliveries)
+                week = self._history.totals(self.name, day - datetime.timedelta(days=HISTORY_DAYS - 1))
+            except sqlite3.Error as exx:
+                _LOGGER.warning("Could not update the mail history: %s", exx)
+                return
+            self.data['mailattr']['letters_7_days'] = week['letters']
+            self.data['packageattr']['packages_7_days'] = week['packages']
 
+    def publish(self):
+        """Set the sensors to the current counts and connection health"""
+        with scan_phase('publish'):
+            health = self.session.health.attributes()
+            self.data['mailattr'].update(health)
+            self.data['packageattr'].update(health)
+            self.hass.states.set(self._letters_entity, self.letters, self.data['mailattr'])
+            self.hass.states.set(self._packages_entity, self.packages, self.data['packageattr'])
 
-    def get_mails(self, account):
-        """Get mail count from mail"""
-        self.hass.data[USPS_MAIL_DATA]['images'] = []
+    def search_mail(self, account):
+        """Find new digests and delivery notices and fetch what they need"""
         today = get_formatted_date()
+        fresh = False
+        if self.session.uidvalidity != self._uidvalidity:
+            _LOGGER.debug("UIDVALIDITY changed to %s, rescanning", self.session.uidvalidity)
+            self._uidvalidity = self.session.uidvalidity
+            self._last_uid = 0
+            self._modseq = None
+            self._digests = {}
+            self._notices = {}
+            fresh = True
+        if today != self._date:
+            self._date = today
+            self._digests = {}
+            self._notices = {}
+            self._recorded = set()
+            fresh = True
+        vanished = set(pop_vanished(account))
+        gone = vanished & (set(self._digests) | set(self._notices))
+        if gone:
+            _LOGGER.debug("%s of today's mails were removed from the mailbox", len(gone))
+            for uid in gone:
+                self._digests.pop(uid, None)
+                self._notices.pop(uid, None)
+        # Without QRESYNC only a connection that was open since the last search reports what was expunged.
+        expunged = bool(account.untagged_responses.pop('EXPUNGE', None))
+        resynced = account is self._searched_on or self.session.resynced
+        modseq = self.session.highestmodseq
+        # When something was removed the search has to run, CHANGEDSINCE does not show removals.
+        if ('CONDSTORE' in account.capabilities and self._modseq is not None and not fresh and not vanished
+                and not expunged and resynced):
+            with scan_phase('search'):
+                changed, modseq = changed_since(account, self._last_uid + 1, self._modseq)
+            if not changed:
+                _LOGGER.debug("Nothing new since MODSEQ %s, not searching", self._modseq)
+                self._modseq = modseq
+                return
         _LOGGER.debug('Searching for mails from %s', today)
-        image_count = 0
-        rv, data = account.search(None, '(SUBJECT "Informed Delivery Daily Digest" SINCE "' + today + '")')
-        if rv == 'OK':
-            for num in data[0].split():
-                rv, data = account.fetch(num, '(RFC822)')
-                msg = email.message_from_string(data[0][1].decode('utf-8'))
-                for part in msg.walk():
-                    if part.get_content_maintype() == "multipart":
-                        continue
-                    if part.get('Content-Disposition') is None:
-                        continue
-                    image = base64.b64encode(part.get_payload(decode=True))
-                    self.hass.data[USPS_MAIL_DATA]['images'].append(image)
-                    image_count = image_count + 1
-                _LOGGER.debug("Found %s mails and images in your email.", image_count)
+        with scan_phase('search'):
+            uids = uid_search(account, '(SINCE "' + today + '" ' + mail_criteria(account) + ')')
+        self._searched_on = account
+        # All of today is searched every time, so mails that were deleted or moved drop out here.
+        found = set(uids)
+        gone = [uid for uid in set(self._digests) | set(self._notices) if uid not in found]
+        if gone:
+            _LOGGER.debug("%s of today's mails are no longer in the mailbox", len(gone))
+            for uid in gone:
+                self._digests.pop(uid, None)
+                self._notices.pop(uid, None)
+        # Everything up to the last UID has been looked at already.
+        uids = [uid for uid in uids if uid > self._last_uid]
+        items = '(' + HEADER_FIELDS
+        if self._fetch_mode == FETCH_PARTS:
+            items += ' BODYSTRUCTURE'
+        items += ')'
+        for chunk in chunked(uids, self._fetch_chunk):
+            with scan_phase('fetch'):
+                self._fetch_chunk_of(account, chunk, items)
+            self._last_uid = max(chunk)
+        # Only once everything is fetched, or a failed fetch would be skipped by the next CHANGEDSINCE check.
+        if 'CONDSTORE' in account.capabilities:
+            self._modseq = max(value for value in (modseq, self._modseq or 0) if value is not None)
+
+    def _fetch_chunk_of(self, account, chunk, items):
+        """Sort a chunk of messages into digests and USPS notices and download what they need"""
+        count_scan('messages', len(chunk))
+        structures = {}
+        notices = []
+        for uid, fetched in uid_fetch(account, chunk, items):
+            with scan_phase('parse'):
+                kind = classify_mail(fetched.get(HEADER_FIELDS.replace('.PEEK', '')) or b'')
+            if kind == MAIL_DIGEST:
+                structures[uid] = fetched.get('BODYSTRUCTURE')
+            elif kind == MAIL_NOTICE:
+                notices.append(uid)
+        self._fetch_notices(account, notices)
+        for uid in list(structures):
+            hashes = self._cache.message(self._uidvalidity, uid)
+            if hashes is not None:
+                self._digests[uid] = hashes
+                del structures[uid]
+        if self._fetch_mode == FETCH_RFC822:
+            self._fetch_rfc822(account, sorted(structures))
+        else:
+            self._fetch_parts(account, structures)
+
+    def _fetch_notices(self, account, uids):
+        """Read the status and tracking number of notices from their headers and the start of their text"""
+        items = '(' + NOTICE_FIELDS + ' ' + NOTICE_TEXT + ')'
+        for uid, fetched in uid_fetch(account, uids, items):
+            with scan_phase('parse'):
+                self._notices[uid] = parse_notice(fetched.get(NOTICE_FIELDS.replace('.PEEK', '')) or b'',
+                                                  fetched.get('BODY[TEXT]<0>') or b'')
+
+    def _fetch_rfc822(self, account, uids):
+        """Download whole digests and cache their images"""
+        for uid, images in fetch_rfc822_images(account, uids):
+            count_scan('parts', len(images))
+            sections = [str(index) for index in range(1, len(images) + 1)]
+            for section, image in zip(sections, images):
+                self._cache.put(self._uidvalidity, uid, section, image)
+            self._digests[uid] = self._cache.set_message(self._uidvalidity, uid, sections)
+
+    def _fetch_parts(self, account, structures):
+        """Download the image parts of digests that are not in the cache yet"""
+        wanted = {}
+        for uid, structure in structures.items():
+            with scan_phase('parse'):
+                sections = disposition_sections(structure) if structure else []
+            wanted[uid] = [(section, encoding) for section, encoding in sections
+                           if self._cache.part(self._uidvalidity, uid, section) is None]
+            if not wanted[uid]:
+                self._digests[uid] = self._cache.set_message(
+                    self._uidvalidity, uid, [section for section, _ in sections])
+        for uid, parts in fetch_sections(account, {uid: parts for uid, parts in wanted.items() if parts}):
+            count_scan('parts', len(parts))
+            for section, image in parts.items():
+                if image is not None:
+                    self._cache.put(self._uidvalidity, uid, section, image)
+            # A part that could not be decoded is left out instead of failing every scan.
+            sections = [section for section, _ in disposition_sections(structures[uid])
+                        if self._cache.part(self._uidvalidity, uid, section) is not None]
+            self._digests[uid] = self._cache.set_message(self._uidvalidity, uid, sections)
+
+    def get_mails(self):
+        """Get mail count from today's digests"""
+        shown = [digest for uid in sorted(self._digests) for digest in self._digests[uid]]
+        if shown == self._shown:
+            return self.data['total']
+        pieces = self._images()
+        images = [image for _, image in pieces]
+        image_count = len(images)
+        _LOGGER.debug("Found %s mails and images in your email.", image_count)
         if image_count == 0:
-            _LOGGER.debug("Found %s mails", image_count)
-            self.hass.data[USPS_MAIL_DATA]['images'].append(default_image(self.ha_conf_dir, self._default_image))
-        self.hass.data[USPS_MAIL_DATA]['count'] = 0
-        self.hass.data[USPS_MAIL_DATA]['total'] = image_count
+            images.append(default_image(self.ha_conf_dir, self._default_image))
+        self._set_images(images, image_count)
+        self.image_store.pieces = [digest for digest, _ in pieces]
+        self._shown = shown
         return image_count
 
-    def package_count(self, account):
-        """Get the package count"""
-        count = 0
-        today = get_formatted_date()
-        rv, data = account.search(None, '(FROM "auto-reply@usps.com" SUBJECT "Item Delivered" SINCE "' + today + '")')
-        if rv == 'OK':
-            count = len(data[0].split())
+    def _images(self):
+        """(hash, bytes) of the images from today's digests, oldest digest first, every mailpiece only once"""
+        images = []
+        seen = set()
+        fingerprints = []
+        for uid in sorted(self._digests):
+            for digest in self._digests[uid]:
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                image = self.image_store.get(digest)
+                if image is None:
+                    continue
+                if self._perceptual_hash:
+                    # A re-sent digest can carry the same scan encoded again, with other bytes.
+                    fingerprint = self._fingerprint(digest, image)
+                    if fingerprint is not None:
+                        if any(bin(fingerprint ^ other).count('1') <= SIMILAR_IMAGE_DISTANCE
+                               for other in fingerprints):
+                            continue
+                        fingerprints.append(fingerprint)
+                images.append((digest, image))
+        self._fingerprints = {digest: fingerprint for digest, fingerprint in self._fingerprints.items()
+                              if digest in seen}
+        return images
+
+    def _fingerprint(self, digest, image):
+        """The perceptual hash of an image, worked out once per content hash"""
+        if digest not in self._fingerprints:
+            with scan_phase('parse'):
+                try:
+                    self._fingerprints[digest] = difference_hash(image)
+                except (OSError, ValueError) as exx:
+                    _LOGGER.debug("Could not hash image %s: %s", digest, exx)
+                    self._fingerprints[digest] = None
+        return self._fingerprints[digest]
+
+    def _set_images(self, images, total):
+        """Hand the images over to the camera, combined into one picture in a few sizes"""
+        mail_images = []
+        if total > 0:
+            with scan_phase('encode'):
+                mail_images = render_mail(images, self._camera_mode, self._camera_widths)
+        if not mail_images and images:
+            mail_images = [(None, None, images[0])]
+        self.image_store.set_variants(mail_images)
+        self.data['total'] = total
+
+    def delivered(self):
+        """UIDs of today's notices that say a package was delivered"""
+        return {uid for uid, notice in self._notices.items() if notice.get('status') == NOTICE_DELIVERED}
+
+    def package_count(self):
+        """Get the package count from today's delivery notices, and list every package USPS wrote about"""
+        count = len(self.delivered())
+        self.data['packageattr']['packages'] = package_list(self._notices)
         _LOGGER.debug("Found %s packages", count)
         return count
 
+    def close(self, event=None):
+        """Log out of the email server"""
+        self.session.close()
+
+
+class UspsMailImageView(HomeAssistantView):
+    """Serves today's mailpieces and camera pictures by their hash, so browsers can cache them for good"""
+    url = IMAGE_URL
+    name = 'api:' + DOMAIN + ':image'
+    # Like the camera proxy, a login or the access token of the camera showing the image will do.
+    requires_auth = False
+
+    async def get(self, request, digest):
+        """Serve an image, or tell the browser its copy is still good"""
+        hass = request.app['hass']
+        data = next((data for data in hass.data.get(USPS_MAIL_DATA, {}).values()
+                     if digest in data['image_store'].digests()), None)
+        camera = data.get('camera') if data is not None else None
+        if not (request[KEY_AUTHENTICATED] or
+                camera is not None and request.query.get('token') in camera.access_tokens):
+            return web.Response(status=401)
+        if data is None:
+            return web.Response(status=404)
+        store = data['image_store']
+        etag = '"' + digest + '"'
+        headers = {'ETag': etag, 'Cache-Control': IMAGE_CACHE_CONTROL}
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            return web.Response(status=304, headers=headers)
+        image = await hass.async_add_executor_job(store.get, digest)
+        if image is None:
+            return web.Response(status=404)
+        return web.Response(body=image, content_type=image_content_type(image), headers=headers)
+
+
+class ScanSchedule:
+    """Decides when to scan next, often around the times mail has arrived before and seldom otherwise"""
+    def __init__(self, interval=SCAN_INTERVAL, busy_interval=BUSY_SCAN_INTERVAL, max_interval=MAX_SCAN_INTERVAL,
+                 window=DELIVERY_WINDOW, jitter=SCAN_JITTER, rng=None):
+        self._interval = interval
+        self._busy_interval = busy_interval
+        self._max_interval = max_interval
+        self._window = window.total_seconds() / 60
+        self._jitter = jitter
+        self._rng = rng or random.Random()
+        self._quiet_scans = 0
+        self.arrivals = []
+
+    def record(self, when, found):
+        """Learn from a finished scan, found tells if it turned up new mail"""
+        if found:
+            self.arrivals = (self.arrivals + [minute_of_day(when)])[-MAX_ARRIVALS:]
+            self._quiet_scans = 0
+        else:
+            self._quiet_scans += 1
+
+    def in_window(self, when):
+        """Whether mail has arrived around this time of day before"""
+        minute = minute_of_day(when)
+        return any(minutes_between(arrival, minute) <= self._window for arrival in self.arrivals)
+
+    def next_scan(self, now):
+        """The time of the next scan after now"""
+        jitter = 1 + self._rng.uniform(-self._jitter, self._jitter)
+        if self.in_window(now):
+            delay = self._busy_interval.total_seconds() * jitter
+        elif self.arrivals:
+            # Back off while it stays quiet, but be back in time for the next window.
+            delay = min(self._interval.total_seconds() * 2 ** self._quiet_scans,
+                        self._max_interval.total_seconds()) * jitter
+            minute = minute_of_day(now)
+            opens = min((arrival - self._window - minute) % (24 * 60) for arrival in self.arrivals)
+            delay = min(delay, opens * 60)
+        else:
+            delay = self._interval.total_seconds() * jitter
+        return now + datetime.timedelta(seconds=max(delay, 60))
+
+
+class ScanPool:
+    """Runs account scans on a few worker threads, so a slow server does not hold up the others"""
+    def __init__(self, workers):
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        # Adding a callback to a future that is already done runs it right away, in the same thread.
+        self._lock = threading.RLock()
+        self._running = {}
+        self._pending = {}
+
+    def submit(self, usps_mail, call):
+        """Start a scan of an account, or queue one to start when the running one is done"""
+        with self._lock:
+            running = self._running.get(usps_mail)
+            if running is None or running.done():
+                self._running[usps_mail] = self._start(usps_mail, call, concurrent.futures.Future())
+                return self._running[usps_mail]
+            pending = self._pending.get(usps_mail)
+            if pending is not None and not pending[1].done():
+                _LOGGER.debug("A scan of %s is already queued", usps_mail.session.username)
+                return pending[1]
+            # Scans of one account never overlap, and waiting here keeps the workers free for the others.
+            future = concurrent.futures.Future()
+            self._pending[usps_mail] = (call, future)
+            return future
+
+    def _start(self, usps_mail, call, future):
+        """Hand a scan to the workers, the future is done when the scan is"""
+        future.add_done_callback(log_scan_failure)
+        future.add_done_callback(lambda done: self._scan_done(usps_mail))
+        self._executor.submit(run_scan, usps_mail, call, future)
+        return future
+
+    def _scan_done(self, usps_mail):
+        """Start the scan that was queued while the last one ran"""
+        with self._lock:
+            call, future = self._pending.pop(usps_mail, (None, None))
+            if future is None or future.done():
+                return
+            try:
+                self._running[usps_mail] = self._start(usps_mail, call, future)
+            except RuntimeError:
+                # The pool was shut down, Home Assistant is stopping.
+                future.cancel()
+
+    def shutdown(self, event=None):
+        """Stop taking new scans, without waiting for the running ones"""
+        self._executor.shutdown(wait=False)
+
+
+class ScanMetrics:
+    """Phase timings, bytes and counts of the last scan, and totals over all scans"""
+    def __init__(self, attributes=None):
+        self._attributes = attributes or {}
+        self._stack = []
+        self._started = None
+        self.state = None
+        self.last = {}
+        self.scans = 0
+        self.failed_scans = 0
+        self.totals = dict.fromkeys(SCAN_PHASES, 0.0)
+        self.total_bytes_received = 0
+        self.histogram = [0] * (len(SCAN_BUCKETS) + 1)
+
+    def start(self):
+        """Begin measuring a scan"""
+        self._stack = []
+        self._started = time.perf_counter()
+        self.last = {'phases': dict.fromkeys(SCAN_PHASES, 0.0), 'bytes_received': 0, 'messages': 0, 'parts': 0}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time a phase, time spent in phases nested inside it only counts for those"""
+        frame = [0.0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            self.last['phases'][name] += elapsed - frame[0]
+            if self._stack:
+                self._stack[-1][0] += elapsed
+
+    def count(self, name, amount=1):
+        """Add to one of the counts of the scan"""
+        self.last[name] += amount
+
+    def finish(self, result):
+        """Add the scan to the totals"""
+        duration = time.perf_counter() - self._started
+        self.state = round(duration, 3)
+        self.last['result'] = result
+        self.scans += 1
+        if result != 'ok':
+            self.failed_scans += 1
+        for name, seconds in self.last['phases'].items():
+            self.totals[name] += seconds
+        self.total_bytes_received += self.last['bytes_received']
+        self.histogram[sum(1 for bound in SCAN_BUCKETS if duration > bound)] += 1
+
+    def attributes(self):
+        """Sensor attributes for the last scan and the totals"""
+        attributes = dict(self._attributes)
+        attributes['result'] = self.last['result']
+        for name, seconds in self.last['phases'].items():
+            attributes[name + '_ms'] = round(seconds * 1000, 1)
+        attributes['bytes_received'] = self.last['bytes_received']
+        attributes['messages'] = self.last['messages']
+        attributes['parts'] = self.last['parts']
+        attributes['scans'] = self.scans
+        attributes['failed_scans'] = self.failed_scans
+        attributes['total_bytes_received'] = self.total_bytes_received
+        attributes['total_ms'] = {name: round(seconds * 1000, 1) for name, seconds in self.totals.items()}
+        bounds = ['<=%ss' % bound for bound in SCAN_BUCKETS] + ['>%ss' % SCAN_BUCKETS[-1]]
+        attributes['duration_histogram'] = dict(zip(bounds, self.histogram))
+        return attributes
+
+
+class InstrumentedIMAP4_SSL(imaplib.IMAP4_SSL):
+    """IMAP4_SSL that reports connect and TLS handshake time and bytes received to the running scan"""
+
+    def __init__(self, host, port, timeout=None):
+        # imaplib only takes a timeout itself from Python 3.9 on.
+        self._timeout = timeout
+        super().__init__(host, port)
+
+    def _create_socket(self, *args):
+        with scan_phase('connect'):
+            sock = socket.create_connection((self.host, self.port), self._timeout)
+        with scan_phase('tls'):
+            return self.ssl_context.wrap_socket(sock, server_hostname=self.host)
+
+    def _connect(self):
+        # Reading the greeting is part of connecting.
+        with scan_phase('connect'):
+            return super()._connect()
+
+    def read(self, size):
+        data = super().read(size)
+        count_scan('bytes_received', len(data))
+        return data
+
+    def readline(self):
+        line = super().readline()
+        count_scan('bytes_received', len(line))
+        return line
+
+
+class ConnectionPaused(imaplib.IMAP4.error):
+    """Raised instead of connecting while a server is backed off or the circuit breaker is open"""
+
+
+class ConnectionHealth:
+    """Spaces out connection attempts after failures and stops logging in after repeated auth failures"""
+    def __init__(self, mailserver):
+        self._mailserver = mailserver
+        self._lock = threading.Lock()
+        self._retry_at = 0
+        self.state = HEALTH_OK
+        self.failures = 0
+        self.auth_failures = 0
+        self.retry_at = None
+
+    def check(self):
+        """Raise ConnectionPaused when it is too early to try again"""
+        with self._lock:
+            if time.monotonic() < self._retry_at:
+                raise ConnectionPaused('%s is in %s until %s' % (self._mailserver, self.state, self.retry_at))
+            if self.state == HEALTH_OPEN:
+                _LOGGER.info("Trying to log in to %s again", self._mailserver)
+                self.state = HEALTH_HALF_OPEN
+
+    def delay(self):
+        """Seconds until the next attempt is allowed"""
+        with self._lock:
+            return max(self._retry_at - time.monotonic(), 0)
+
+    def success(self):
+        """A connection was made and logged in"""
+        with self._lock:
+            if self.state != HEALTH_OK:
+                _LOGGER.info("Connected to %s again", self._mailserver)
+            self.state = HEALTH_OK
+            self.failures = self.auth_failures = 0
+            self._retry_at = 0
+            self.retry_at = None
+
+    def failure(self):
+        """Connecting failed, wait twice as long as last time before the next attempt"""
+        with self._lock:
+            self.failures += 1
+            delay = min(BACKOFF_START * 2 ** (self.failures - 1), BACKOFF_MAX)
+            self.state = HEALTH_BACKOFF
+            self._pause(delay)
+
+    def auth_failure(self):
+        """The server turned the credentials down, open the circuit breaker when it keeps doing so"""
+        with self._lock:
+            self.auth_failures += 1
+            if self.auth_failures < AUTH_FAILURE_LIMIT:
+                self.state = HEALTH_BACKOFF
+                self._pause(min(BACKOFF_START * 2 ** (self.auth_failures - 1), BACKOFF_MAX))
+                return
+            self.state = HEALTH_OPEN
+            self._pause(BREAKER_COOLDOWN)
+            _LOGGER.error("Login to %s failed %s times in a row, not trying again until %s",
+                          self._mailserver, self.auth_failures, self.retry_at)
+
+    def attributes(self):
+        """Sensor attributes describing the connection"""
+        with self._lock:
+            return {'connection': self.state, 'connection_failures': self.failures + self.auth_failures,
+                    'retry_at': self.retry_at}
+
+    def _pause(self, delay):
+        """Hold off connecting for the timedelta delay"""
+        self._retry_at = time.monotonic() + delay.total_seconds()
+        self.retry_at = dt_util.as_local(dt_util.utcnow() + delay).isoformat()
+
+
+class ImapSession:
+    """Keeps one authenticated IMAP connection open for an account"""
+    def __init__(self, mailserver, port, inbox_folder, username, password, health=None, connect=None):
+        self._mailserver = mailserver
+        self._port = port
+        self._inbox_folder = inbox_folder
+        self.username = username
+        self._password = password
+        self._account = None
+        self._lock = threading.RLock()
+        self.uidvalidity = None
+        self.highestmodseq = None
+        self.qresync = None
+        self.resynced = False
+        self.health = health or ConnectionHealth(mailserver)
+        self._connect = connect or InstrumentedIMAP4_SSL
+
+    def copy(self):
+        """A new session for the same account, with its own connection but the same health"""
+        return ImapSession(self._mailserver, self._port, self._inbox_folder, self.username, self._password,
+                           self.health, self._connect)
+
+    @contextlib.contextmanager
+    def borrow(self):
+        """Lend out the connection, reconnecting when it has gone stale"""
+        with self._lock:
+            account = self.connection()
+            try:
+                yield account
+            except Exception:
+                # The connection may be stuck halfway through a response.
+                self._drop()
+                raise
+
+    def connection(self):
+        """Return a live connection, checking it with NOOP first"""
+        with self._lock:
+            if self._account is not None:
+                try:
+                    rv, _ = self._account.noop()
+                    if rv == 'OK':
+                        return self._account
+                except (imaplib.IMAP4.error, OSError) as exx:
+                    _LOGGER.debug("Connection to %s went stale: %s", self._mailserver, exx)
+                self._drop()
+            self.health.check()
+            try:
+                self._account = self.login()
+            except (imaplib.IMAP4.abort, OSError):
+                self.health.failure()
+                raise
+            self.health.success()
+            return self._account
+
     def login(self):
         """function used to login"""
         _LOGGER.debug("trying to make connection with %s %s", self._mailserver, self._port)
-        account = imaplib.IMAP4_SSL(self._mailserver, self._port)
+        account = self._connect(self._mailserver, self._port, timeout=IMAP_TIMEOUT.total_seconds())
         try:
-            account.login(self._username, self._password)
+            with scan_phase('login'):
+                account.login(self.username, self._password)
             _LOGGER.debug("Logged into your email server successfully!")
+        except imaplib.IMAP4.abort:
+            # A dropped connection says nothing about the credentials.
+            account.shutdown()
+            raise
         except imaplib.IMAP4.error:
             _LOGGER.critical('Failed to authenticate using the given credentials. Check your username, password, host and port.')
+            account.shutdown()
+            self.health.auth_failure()
+            raise
+        with scan_phase('login'):
+            refresh_capabilities(account)
+            qresync = 'QRESYNC' in account.capabilities and 'ENABLE' in account.capabilities
+            if qresync:
+                qresync = account.enable('QRESYNC')[0] == 'OK'
+        with scan_phase('select'):
+            rv, data = select_folder(account, self._inbox_folder, self.qresync if qresync else None)
+        if rv != 'OK':
+            # Otherwise NOOP keeps passing and every scan logs in again without ever backing off.
+            _LOGGER.error("Could not open the folder %s on %s: %s", self._inbox_folder, self._mailserver, data)
+            account.shutdown()
+            raise imaplib.IMAP4.abort('SELECT %s failed: %s' % (self._inbox_folder, data))
+        self.resynced = bool(qresync and self.qresync)
+        rv, data = account.response('UIDVALIDITY')
+        self.uidvalidity = int(data[0]) if data and data[0] else None
+        rv, data = account.response('HIGHESTMODSEQ')
+        self.highestmodseq = int(data[0]) if data and data[0] else None
         return account
 
+    def close(self):
+        """Log out and close the connection"""
+        with self._lock:
+            if self._account is None:
+                return
+            try:
+                self._account.logout()
+                _LOGGER.debug("Logged out of %s", self._mailserver)
+            except (imaplib.IMAP4.error, OSError) as exx:
+                _LOGGER.debug("Error logging out of %s: %s", self._mailserver, exx)
+            self._account = None
+
+    def _drop(self):
+        """Throw away a broken connection without logging out"""
+        if self._account is None:
+            return
+        try:
+            self._account.shutdown()
+        except OSError:
+            pass
+        self._account = None
+
+
+class ImageCache:
+    """Content-addressed disk cache of mail images, keyed by UIDVALIDITY, UID and MIME section"""
+    def __init__(self, directory, max_size=50 * 1024 * 1024, retention=datetime.timedelta(days=7)):
+        self._directory = directory
+        self._max_size = max_size
+        self._retention = retention
+        self._lock = threading.RLock()
+        self._index = None
+        self._dirty = False
+
+    @property
+    def index(self):
+        """The cache index, loaded from disk the first time it is needed"""
+        with self._lock:
+            if self._index is None:
+                try:
+                    with open(os.path.join(self._directory, CACHE_INDEX), 'r') as index_file:
+                        self._index = json.load(index_file)
+                except (OSError, ValueError):
+                    self._index = {'parts': {}, 'messages': {}, 'files': {}}
+                    self._dirty = True
+            return self._index
+
+    def part(self, uidvalidity, uid, section):
+        """The hash of a cached MIME section, or None"""
+        with self._lock:
+            digest = self.index['parts'].get(cache_key(uidvalidity, uid, section))
+            return digest if digest in self.index['files'] else None
+
+    def message(self, uidvalidity, uid):
+        """The image hashes of a digest, or None when any of them is missing"""
+        with self._lock:
+            sections = self.index['messages'].get(cache_key(uidvalidity, uid))
+            if sections is None:
+                return None
+            hashes = [self.part(uidvalidity, uid, section) for section in sections]
+            return None if None in hashes else hashes
+
+    def set_message(self, uidvalidity, uid, sections):
+        """Remember which sections of a digest are images, returns their hashes"""
+        with self._lock:
+            key = cache_key(uidvalidity, uid)
+            if self.index['messages'].get(key) != sections:
+                self.index['messages'][key] = sections
+                self._dirty = True
+            return [self.part(uidvalidity, uid, section) for section in sections]
+
+    def put(self, uidvalidity, uid, section, data):
+        """Store the bytes of a MIME section, returns their hash"""
+        with self._lock:
+            digest = self.add(data)
+            key = cache_key(uidvalidity, uid, section)
+            if self.index['parts'].get(key) != digest:
+                self.index['parts'][key] = digest
+                self._dirty = True
+        return digest
+
+    def add(self, data):
+        """Store bytes that belong to no message, returns their hash"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = os.path.join(self._directory, digest)
+        with self._lock:
+            if digest not in self.index['files'] or not os.path.isfile(path):
+                os.makedirs(self._directory, exist_ok=True)
+                write_atomic(path, data)
+            now = time.time()
+            if digest not in self.index['files']:
+                self.index['files'][digest] = {'size': len(data), 'added': now, 'used': now}
+                self._dirty = True
+            else:
+                self._use(self.index['files'][digest], now)
+        return digest
+
+    def read(self, digest):
+        """The bytes for a hash, or None when it is not cached"""
+        with self._lock:
+            entry = self.index['files'].get(digest)
+            if entry is None:
+                return None
+            try:
+                with open(os.path.join(self._directory, digest), 'rb') as image_file:
+                    data = image_file.read()
+            except OSError:
+                del self.index['files'][digest]
+                self._dirty = True
+                return None
+            self._use(entry, time.time())
+            return data
+
+    def _use(self, entry, now):
+        """Mark a file as used, the index only needs saving again once the old time is well out of date"""
+        if now - entry['used'] > CACHE_USED_RESOLUTION.total_seconds():
+            self._dirty = True
+        entry['used'] = now
+
+    def cleanup(self, keep=()):
+        """Drop images past the retention window, then the least recently used until under the size limit"""
+        with self._lock:
+            files = self.index['files']
+            expired = time.time() - self._retention.total_seconds()
+            drop = {digest for digest, entry in files.items() if entry['used'] < expired and digest not in keep}
+            size = sum(entry['size'] for digest, entry in files.items() if digest not in drop)
+            for digest in sorted(files, key=lambda digest: files[digest]['used']):
+                if size <= self._max_size:
+                    break
+                if digest in drop or digest in keep:
+                    continue
+                drop.add(digest)
+                size -= files[digest]['size']
+            for digest in drop:
+                del files[digest]
+                try:
+                    os.remove(os.path.join(self._directory, digest))
+                except OSError:
+                    pass
+            parts = {key: digest for key, digest in self.index['parts'].items() if digest in files}
+            messages = {key: sections for key, sections in self.index['messages'].items()
+                        if all(key + '/' + section in parts for section in sections)}
+            if drop or len(parts) != len(self.index['parts']) or len(messages) != len(self.index['messages']):
+                self.index['parts'] = parts
+                self.index['messages'] = messages
+                self._dirty = True
+            if drop:
+                _LOGGER.debug("Removed %s images from the cache", len(drop))
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(self._directory, exist_ok=True)
+                write_atomic(os.path.join(self._directory, CACHE_INDEX), json.dumps(self.index).encode('utf-8'))
+                self._dirty = False
+            except OSError as exx:
+                _LOGGER.warning("Could not save the image cache index: %s", exx)
+
+
+class ImageStore:
+    """Pictures for the camera, the most recently used in memory up to a byte budget and the rest in the disk cache"""
+    def __init__(self, cache, budget=MEMORY_SIZE):
+        self._cache = cache
+        self._budget = budget
+        self._lock = threading.Lock()
+        self._memory = collections.OrderedDict()
+        self._size = 0
+        self.pieces = []
+        self.variants = []
+
+    def put(self, data):
+        """Keep a picture, returns its hash"""
+        digest = self._cache.add(data)
+        self._remember(digest, data)
+        return digest
+
+    def get(self, digest):
+        """The bytes for a hash, read back from disk when they were dropped from memory"""
+        with self._lock:
+            data = self._memory.get(digest)
+            if data is not None:
+                self._memory.move_to_end(digest)
+                return data
+        data = self._cache.read(digest)
+        if data is not None:
+            self._remember(digest, data)
+        return data
+
+    def _remember(self, digest, data):
+        """Keep bytes in memory, dropping the least recently used ones beyond the budget"""
+        if len(data) > self._budget:
+            return
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return
+            self._memory[digest] = data
+            self._size += len(data)
+            while self._size > self._budget:
+                _, dropped = self._memory.popitem(last=False)
+                self._size -= len(dropped)
+
+    def set_variants(self, variants):
+        """Keep the camera pictures, (width, height, bytes) from the smallest to full size"""
+        self.variants = [(width, height, self.put(image)) for width, height, image in variants]
+
+    def digests(self):
+        """Hashes of today's mailpieces and the camera pictures, the disk cache has to keep them"""
+        return set(self.pieces) | {digest for _, _, digest in self.variants}
+
+
+class MailHistory:
+    """SQLite index of the digests and delivery notices of every day, so history needs no mail server"""
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._ready = False
+
+    @contextlib.contextmanager
+    def _connection(self):
+        """A connection to the database, committed when the block succeeds"""
+        with self._lock:
+            if not self._ready:
+                os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            connection = sqlite3.connect(self._path)
+            try:
+                if not self._ready:
+                    connection.executescript(HISTORY_TABLES)
+                    self._ready = True
+                with connection:
+                    yield connection
+            finally:
+                connection.close()
+
+    def record(self, account, uidvalidity, day, digests, deliveries):
+        """Add digests ({uid: image hashes}) and delivery notices (UIDs) that arrived on day"""
+        account = account or ''
+        uidvalidity = uidvalidity or 0
+        day = day.isoformat()
+        with self._connection() as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?)',
+                [(account, uidvalidity, uid, day, len(hashes), ' '.join(digest for digest in hashes if digest))
+                 for uid, hashes in digests.items()])
+            connection.executemany(
+                'INSERT OR REPLACE INTO deliveries VALUES (?, ?, ?, ?)',
+                [(account, uidvalidity, uid, day) for uid in deliveries])
+
+    def totals(self, account, since):
+        """Letters and packages of an account from since up to today"""
+        account = account or ''
+        since = since.isoformat()
+        with self._connection() as connection:
+            letters = unique_pieces(connection.execute(
+                'SELECT pieces, hashes FROM digests WHERE account = ? AND day >= ?', (account, since)))
+            packages, = connection.execute('SELECT COUNT(*) FROM deliveries WHERE account = ? AND day >= ?',
+                                           (account, since)).fetchone()
+        return {'letters': letters, 'packages': packages}
+
+    def counts(self, account, period, count, today):
+        """Letters, digests and packages for each of the last count days, weeks or months, for all accounts when
+        account is None"""
+        starts = [period_start(today, period)]
+        while len(starts) < count:
+            starts.insert(0, period_start(starts[0] - datetime.timedelta(days=1), period))
+        periods = collections.OrderedDict(
+            (start, {'start': start.isoformat(), 'letters': 0, 'digests': 0, 'packages': 0}) for start in starts)
+        pieces = {start: [] for start in starts}
+        where = 'day >= ?' if account is None else 'day >= ? AND account = ?'
+        params = (starts[0].isoformat(),) if account is None else (starts[0].isoformat(), account)
+        with self._connection() as connection:
+            digests = connection.execute('SELECT day, pieces, hashes FROM digests WHERE ' + where, params).fetchall()
+            deliveries = connection.execute('SELECT day, COUNT(*) FROM deliveries WHERE ' + where
+                                            + ' GROUP BY day', params).fetchall()
+        for day, piece_count, hashes in digests:
+            start = period_start(parse_day(day), period)
+            if start in periods:
+                periods[start]['digests'] += 1
+                pieces[start].append((piece_count, hashes))
+        for start, rows in pieces.items():
+            periods[start]['letters'] = unique_pieces(rows)
+        for day, packages in deliveries:
+            counts = periods.get(period_start(parse_day(day), period))
+            if counts is not None:
+                counts['packages'] += packages
+        return list(periods.values())
+
+
+class ResponseParser:
+    """Builds nested lists out of IMAP response text and literals"""
+    def __init__(self):
+        self._stack = [[]]
+
+    def feed(self, text):
+        """Parse a line of response text, up to a literal if one follows"""
+        text = text.decode('utf-8', 'replace')
+        pos = 0
+        while True:
+            match = IMAP_TOKEN.match(text, pos)
+            if match is None or match.end() == pos:
+                return
+            pos = match.end()
+            opening, closing, quoted, literal, atom = match.groups()
+            if opening:
+                self._stack.append([])
+            elif closing:
+                done = self._stack.pop()
+                self._stack[-1].append(done)
+            elif quoted is not None:
+                self._stack[-1].append(re.sub(r'\\(.)', r'\1', quoted))
+            elif atom is not None:
+                self._stack[-1].append(None if atom.upper() == 'NIL' else atom)
+
+    def literal(self, data):
+        """Add the bytes of a literal"""
+        self._stack[-1].append(data)
+
+    def result(self):
+        """The top level tokens"""
+        return self._stack[0]
+
+
+class IdleWatcher(threading.Thread):
+    """Waits in IMAP IDLE on its own connection and reports mailbox changes"""
+    def __init__(self, session, on_change, on_unsupported):
+        super().__init__(name='usps_mail_idle', daemon=True)
+        self._session = session
+        self._on_change = on_change
+        self._on_unsupported = on_unsupported
+        self._stopped = threading.Event()
+        self._idle_lock = threading.Lock()
+        self._idling = None
+
+    def run(self):
+        """Keep re-entering IDLE until stopped"""
+        while not self._stopped.is_set():
+            try:
+                account = self._session.connection()
+                if 'IDLE' not in account.capabilities:
+                    _LOGGER.warning('%s does not support IDLE, scanning on a schedule instead', account.host)
+                    self._session.close()
+                    self._on_unsupported()
+                    return
+                if self._idle(account):
+                    _LOGGER.debug("Mailbox changed, starting a scan")
+                    self._on_change()
+            except (imaplib.IMAP4.error, OSError) as exx:
+                if self._stopped.is_set():
+                    break
+                retry = max(IDLE_RETRY.total_seconds(), self._session.health.delay())
+                _LOGGER.warning("IDLE connection failed: %s, retrying in %s", exx, datetime.timedelta(seconds=int(retry)))
+                self._session.close()
+                self._stopped.wait(retry)
+        self._session.close()
+
+    def stop(self, event=None):
+        """Leave IDLE and shut the watcher down"""
+        self._stopped.set()
+        self._done()
+
+    def _idle(self, account):
+        """Run one IDLE cycle, returns True when messages arrived or were expunged"""
+        tag = account._new_tag()
+        account.send(tag + b' IDLE\r\n')
+        line = account._get_line()
+        while not line.startswith(b'+'):
+            if line.startswith(tag):
+                raise account.error('IDLE rejected: %r' % line)
+            line = account._get_line()
+        with self._idle_lock:
+            self._idling = account
+        if self._stopped.is_set():
+            self._done()
+        # Servers may drop an IDLE after 30 minutes, so leave and re-enter before that.
+        timer = threading.Timer(IDLE_TIMEOUT.total_seconds(), self._done)
+        timer.start()
+        # Nothing needs to arrive while idling, but a connection that died silently still times out.
+        account.sock.settimeout((IDLE_TIMEOUT + IMAP_TIMEOUT).total_seconds())
+        changed = False
+        try:
+            while True:
+                line = account._get_line()
+                if line.startswith(tag):
+                    break
+                if IDLE_CHANGE.match(line):
+                    changed = True
+                    self._done()
+        finally:
+            timer.cancel()
+            account.sock.settimeout(IMAP_TIMEOUT.total_seconds())
+            account.tagged_commands.pop(tag, None)
+            with self._idle_lock:
+                self._idling = None
+        return changed
+
+    def _done(self):
+        """End the current IDLE command, if any"""
+        with self._idle_lock:
+            if self._idling is None:
+                return
+            try:
+                self._idling.send(b'DONE\r\n')
+            except OSError:
+                pass
+            self._idling = None
+
+def account_id(base, name, separator='_'):
+    """An id for the unnamed account, or the same id with the account name appended"""
+    return base if name is None else base + separator + name
+
+@contextlib.contextmanager
+def scan_phase(name):
+    """Time a phase of the scan running on this thread, if there is one"""
+    metrics = getattr(CURRENT_SCAN, 'metrics', None)
+    if metrics is None:
+        yield
+        return
+    with metrics.phase(name):
+        yield
+
+def count_scan(name, amount=1):
+    """Add to a count of the scan running on this thread, if there is one"""
+    metrics = getattr(CURRENT_SCAN, 'metrics', None)
+    if metrics is not None:
+        metrics.count(name, amount)
+
+def minute_of_day(when):
+    """Minutes since midnight"""
+    return when.hour * 60 + when.minute
+
+def minutes_between(first, second):
+    """Minutes between two times of day, going around midnight when that is shorter"""
+    distance = abs(first - second) % (24 * 60)
+    return min(distance, 24 * 60 - distance)
+
+def run_scan(usps_mail, call, future):
+    """Scan an account on a worker thread and pass the outcome on to the future"""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(usps_mail.scan_mail(call))
+    except Exception as exx:
+        future.set_exception(exx)
+
+def log_scan_failure(future):
+    """Log a scan that ended in an exception"""
+    if not future.cancelled() and future.exception() is not None:
+        _LOGGER.error("Scan failed", exc_info=future.exception())
+
 def get_mailserver(provider):
     """Returns the correct hostname for specified provider"""
     if provider == 'gmail':
@@ -185,898 +1511,490 @@ def get_formatted_date():
     return datetime.datetime.today().strftime('%d-%b-%Y')
     #return '29-07-2018'
 
-def select_folder(account, inbox_folder):
-    """Select the folder in the inbox to use"""
-    account.select(inbox_folder)
+def fetch_rfc822_images(account, uids):
+    """Download whole messages and pick out the parts with a Content-Disposition"""
+    for uid, fetched in uid_fetch(account, uids, '(RFC822)', literal_parser=image_part_parser):
+        msg = fetched['RFC822']
+        images = []
+        with scan_phase('parse'):
+            for part in msg.walk():
+                if part.get_content_maintype() == "multipart":
+                    continue
+                if part.get('Content-Disposition') is None:
+                    continue
+                images.append(part.get_payload(decode=True))
+        yield uid, images
+
+class ImagePartMessage(email.message.Message):
+    """A message part that only keeps its payload when it has a Content-Disposition"""
+
+    def set_payload(self, payload, charset=None):
+        """Throw away the body of parts that are not attachments"""
+        if self.get('Content-Disposition') is None and not isinstance(payload, list):
+            payload = ''
+        super().set_payload(payload, charset)
+
+def image_part_parser():
+    """A bytes parser that can be fed a message as it comes off the wire"""
+    return email.parser.BytesFeedParser(_factory=ImagePartMessage)
+
+def fetch_sections(account, wanted):
+    """Download MIME sections, wanted maps each UID to its (section, encoding) pairs"""
+    by_sections = {}
+    for uid in sorted(wanted):
+        by_sections.setdefault(tuple(wanted[uid]), []).append(uid)
+    # FETCH asks for the same items from every message, digests usually share one layout.
+    for sections, group in by_sections.items():
+        items = '(' + ' '.join('BODY.PEEK[' + section + ']' for section, _ in sections) + ')'
+        for uid, fetched in uid_fetch(account, group, items):
+            with scan_phase('parse'):
+                parts = {section: decode_part(fetched.get('BODY[' + section + ']') or b'', encoding)
+                         for section, encoding in sections}
+            yield uid, parts
+
+def uid_search(account, criteria):
+    """Run a UID SEARCH, asking for ESEARCH's compact result when the server has it"""
+    if 'ESEARCH' in account.capabilities:
+        return parse_sequence_set(esearch(account, 'ALL', criteria).get('ALL', ''))
+    rv, data = account.uid('SEARCH', None, criteria)
+    if rv != 'OK' or not data or not data[0]:
+        return []
+    return [int(uid) for uid in data[0].split()]
+
+def esearch(account, returns, criteria):
+    """Run a UID SEARCH RETURN (returns) and map the result names to their values"""
+    rv, _ = account.uid('SEARCH', 'RETURN', '(' + returns + ')', criteria)
+    results = {}
+    if rv != 'OK':
+        return results
+    for response in account.untagged_responses.pop('ESEARCH', []):
+        tokens = ResponseParser()
+        tokens.feed(response)
+        tokens = tokens.result()
+        for key, value in zip(tokens, tokens[1:]):
+            if isinstance(key, str) and key.upper() in ('ALL', 'COUNT', 'MIN', 'MAX'):
+                results[key.upper()] = value
+    return results
+
+def mail_criteria(account):
+    """Search keys for digests and USPS notices, through Gmail's own index on Gmail"""
+    if 'X-GM-EXT-1' in account.capabilities:
+        return 'X-GM-RAW ' + imap_quote(DIGEST_GMAIL + ' OR ' + NOTICE_GMAIL)
+    return 'OR (' + DIGEST_SEARCH + ') (' + NOTICE_SEARCH + ')'
+
+def imap_quote(value):
+    """Quote a string for an IMAP command"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def changed_since(account, first_uid, modseq):
+    """UIDs from first_uid up that changed after modseq, and the highest MODSEQ among them"""
+    uids = []
+    for uid, fetched in uid_fetch(account, str(first_uid) + ':*', '(UID MODSEQ) (CHANGEDSINCE ' + str(modseq) + ')'):
+        if uid >= first_uid:
+            uids.append(uid)
+        if isinstance(fetched.get('MODSEQ'), list) and fetched['MODSEQ']:
+            modseq = max(modseq, int(fetched['MODSEQ'][0]))
+    return uids, modseq
+
+def sequence_set(numbers):
+    """Compress numbers into a sequence set like 3:5,9"""
+    ranges = []
+    for number in sorted(set(numbers)):
+        if ranges and number == ranges[-1][1] + 1:
+            ranges[-1][1] = number
+        else:
+            ranges.append([number, number])
+    return ','.join(str(low) if low == high else '%s:%s' % (low, high) for low, high in ranges)
+
+def pop_vanished(account):
+    """UIDs the server reported as expunged with VANISHED since the last call"""
+    uids = []
+    for data in account.untagged_responses.pop('VANISHED', []):
+        data = data.decode('ascii').strip()
+        if data.upper().startswith('(EARLIER)'):
+            data = data[len('(EARLIER)'):].strip()
+        uids.extend(parse_sequence_set(data))
+    return uids
+
+def parse_sequence_set(sequence_set):
+    """Expand a sequence set like 3:5,9 into numbers"""
+    numbers = []
+    if not sequence_set:
+        return numbers
+    for item in sequence_set.split(','):
+        low, _, high = item.partition(':')
+        numbers.extend(range(int(low), int(high or low) + 1))
+    return numbers
+
+def classify_mail(headers):
+    """Tell digests from USPS notices by their From and Subject headers"""
+    msg = email.message_from_bytes(headers, policy=email.policy.default)
+    subject = str(msg.get('Subject', '')).lower()
+    sender = str(msg.get('From', '')).lower()
+    if DIGEST_SUBJECT.lower() in subject:
+        return MAIL_DIGEST
+    if NOTICE_FROM in sender and any(notice.lower() in subject for notice in NOTICE_SUBJECTS):
+        return MAIL_NOTICE
+    return None
+
+def parse_notice(headers, text):
+    """Status, tracking number and date of a USPS notice, from its Subject and Date and the start of its text"""
+    msg = email.message_from_bytes(headers, policy=email.policy.default)
+    subject = str(msg.get('Subject', ''))
+    # Quoted-printable can break a tracking number over two lines.
+    text = quopri.decodestring(text).decode('utf-8', 'replace')
+    status = NOTICE_STATUS.search(subject) or NOTICE_STATUS.search(text)
+    tracking = TRACKING_NUMBER.search(subject) or TRACKING_NUMBER.search(text)
+    try:
+        date = dt_util.as_utc(email.utils.parsedate_to_datetime(str(msg.get('Date', '')))).isoformat()
+    except (TypeError, ValueError):
+        date = None
+    return {
+        'tracking_number': tracking.group(1) if tracking else None,
+        'status': NOTICE_STATUSES[status.lastindex - 1] if status else None,
+        'date': date,
+    }
+
+def package_list(notices):
+    """The latest notice for each tracking number, oldest first"""
+    packages = {}
+    for uid, notice in notices.items():
+        key = notice.get('tracking_number') or uid
+        if key not in packages or notice_order(notice) >= notice_order(packages[key]):
+            packages[key] = notice
+    return sorted(packages.values(), key=notice_order)
+
+def notice_order(notice):
+    """Sort key that puts notices in the order they were sent"""
+    status = notice.get('status')
+    return notice.get('date') or '', NOTICE_STATUSES.index(status) if status in NOTICE_STATUSES else -1
+
+def uid_fetch(account, uids, items, literal_parser=None):
+    """Send a single UID FETCH for the UIDs and yield (uid, items) as each response arrives
+
+    With a literal_parser every literal is read in chunks and fed to a new
+    parser from it, and the item gets whatever its close() returns.
+    Every UID asked for is yielded once, with the items of all its responses,
+    as soon as each item asked for has arrived. Unsolicited flag updates and
+    UIDs that were not asked for are left out.
+    The generator has to be run to the end, or the connection must be dropped.
+    """
+    if not uids:
+        return
+    tag = account._new_tag()
+    uid_set = uids if isinstance(uids, str) else ','.join(str(uid) for uid in uids)
+    names = fetch_item_names(items)
+    partial = {}
+    done = set()
+    account.send(tag + b' UID FETCH ' + uid_set.encode('ascii') + b' ' + items.encode('ascii') + b'\r\n')
+    try:
+        while True:
+            line = account._get_line()
+            if line.startswith(tag + b' '):
+                if not line[len(tag) + 1:].startswith(b'OK'):
+                    raise account.error('UID FETCH failed: %r' % line)
+                return
+            if line.startswith(b'* BYE'):
+                raise account.abort('server closed the connection: %r' % line)
+            if line.startswith(b'* VANISHED '):
+                account._append_untagged('VANISHED', line[len(b'* VANISHED '):])
+                continue
+            parser = ResponseParser()
+            while True:
+                parser.feed(line)
+                literal = IMAP_LITERAL.search(line)
+                if literal is None:
+                    break
+                size = int(literal.group(1))
+                if literal_parser is None:
+                    parser.literal(account.read(size))
+                else:
+                    parser.literal(read_literal(account, size, literal_parser()))
+                line = account._get_line()
+            tokens = parser.result()
+            # * <seq> FETCH (<items>)
+            if len(tokens) < 4 or str(tokens[2]).upper() != 'FETCH' or not isinstance(tokens[3], list):
+                continue
+            fetched = fetch_items(tokens[3])
+            if 'UID' not in fetched:
+                continue
+            uid = int(fetched['UID'])
+            if uid in done or not in_sequence_set(uid, uid_set):
+                continue
+            # A server may split the items of a message over more than one response.
+            merged = partial.pop(uid, {})
+            merged.update(fetched)
+            if all(name in merged for name in names):
+                done.add(uid)
+                yield uid, merged
+            else:
+                partial[uid] = merged
+    finally:
+        account.tagged_commands.pop(tag, None)
+
+def fetch_item_names(items):
+    """The names FETCH responses use for the items asked for, BODY[TEXT]<0> for BODY.PEEK[TEXT]<0.4096>"""
+    parser = ResponseParser()
+    parser.feed(re.sub(r'<(\d+)\.\d+>', r'<\1>', items.replace('.PEEK[', '[')).encode('utf-8'))
+    tokens = parser.result()
+    names = tokens[0] if tokens and isinstance(tokens[0], list) else tokens[:1]
+    return [str(name).upper() for name in names if str(name).upper() != 'UID']
+
+def in_sequence_set(number, sequence_set):
+    """Whether a number is in a sequence set like 3:5,9 or 7:*"""
+    for item in sequence_set.split(','):
+        low, _, high = item.partition(':')
+        bounds = [math.inf if bound == '*' else int(bound) for bound in (low, high or low)]
+        if min(bounds) <= number <= max(bounds):
+            return True
+    return False
+
+def read_literal(account, size, sink):
+    """Feed a literal of size bytes to the sink a chunk at a time"""
+    while size:
+        data = account.read(min(size, LITERAL_CHUNK))
+        if not data:
+            raise account.abort('socket error: EOF in the middle of a literal')
+        with scan_phase('parse'):
+            sink.feed(data)
+        size -= len(data)
+    with scan_phase('parse'):
+        return sink.close()
+
+def chunked(items, size):
+    """Split a list into lists of at most size items"""
+    return [items[index:index + size] for index in range(0, len(items), size)]
+
+def disposition_sections(structure, section=''):
+    """Section numbers and transfer encodings of the non-multipart parts with a Content-Disposition"""
+    if isinstance(structure[0], list):
+        sections = []
+        children = []
+        for child in structure:
+            if not isinstance(child, list):
+                break
+            children.append(child)
+        for index, child in enumerate(children, 1):
+            sections.extend(disposition_sections(child, (section + '.' if section else '') + str(index)))
+        return sections
+    maintype = (structure[0] or '').lower()
+    subtype = (structure[1] or '').lower()
+    # Fixed fields, plus line count for text and envelope, body and lines for message/rfc822.
+    md5 = 7
+    if maintype == 'text':
+        md5 = 8
+    elif maintype == 'message' and subtype == 'rfc822':
+        md5 = 10
+    if len(structure) <= md5 + 1 or not structure[md5 + 1]:
+        return []
+    return [(section or '1', structure[5])]
+
+def decode_part(data, encoding):
+    """Undo the Content-Transfer-Encoding of a fetched part, None when it cannot be decoded"""
+    encoding = (encoding or '').lower()
+    if encoding == 'base64':
+        try:
+            return base64.b64decode(data)
+        except binascii.Error as exx:
+            _LOGGER.debug("Skipping a part that is not valid base64: %s", exx)
+            return None
+    if encoding == 'quoted-printable':
+        return quopri.decodestring(data)
+    return data
+
+def fetch_items(items):
+    """Turn the list of a FETCH response into a dict"""
+    return {str(key).upper(): value for key, value in zip(items[::2], items[1::2])}
+
+def render_mail(images, mode, widths=()):
+    """Combine the mail images into an animated GIF or a JPEG mosaic
+
+    Returns (width, height, bytes) for the full size picture and for every smaller width
+    asked for, smallest first. A single image is always a JPEG.
+    """
+    from PIL import Image
+    frames = []
+    for image in images:
+        try:
+            frames.append(Image.open(io.BytesIO(image)).convert('RGB'))
+        except (OSError, ValueError) as exx:
+            _LOGGER.debug("Leaving out an image that could not be read: %s", exx)
+    if not frames:
+        return None
+    width = max(frame.width for frame in frames)
+    height = max(frame.height for frame in frames)
+    columns = math.ceil(math.sqrt(len(frames))) if mode == CAMERA_MOSAIC else 1
+    rows = math.ceil(len(frames) / columns) if mode == CAMERA_MOSAIC else 1
+    canvases = []
+    for index, frame in enumerate(frames):
+        if mode != CAMERA_MOSAIC or not canvases:
+            canvases.append(Image.new('RGB', (columns * width, rows * height), 'white'))
+        column, row = (index % columns, index // columns) if mode == CAMERA_MOSAIC else (0, 0)
+        canvases[-1].paste(frame, (column * width + (width - frame.width) // 2,
+                                   row * height + (height - frame.height) // 2))
+    full_width, full_height = canvases[0].size
+    variants = []
+    for width in sorted(set(width for width in widths if width < full_width)) + [full_width]:
+        height = max(round(full_height * width / full_width), 1)
+        frames = [canvas.resize((width, height), Image.LANCZOS) if width < full_width else canvas
+                  for canvas in canvases]
+        output = io.BytesIO()
+        if len(frames) == 1:
+            frames[0].save(output, 'JPEG', quality=85)
+        else:
+            frames[0].save(output, 'GIF', save_all=True, append_images=frames[1:], loop=0,
+                           duration=int(FRAME_DURATION.total_seconds() * 1000))
+        variants.append((width, height, output.getvalue()))
+    return variants
+
+def period_start(day, period):
+    """The first day of the day, week (from Monday) or month that day is in"""
+    if period == 'week':
+        return day - datetime.timedelta(days=day.weekday())
+    if period == 'month':
+        return day.replace(day=1)
+    return day
+
+def unique_pieces(rows):
+    """Count mailpieces from (pieces, hashes) rows, a piece shown in several digests counts once"""
+    hashes = set()
+    unknown = 0
+    for pieces, digests in rows:
+        digests = digests.split()
+        hashes.update(digests)
+        unknown += pieces - len(digests)
+    return len(hashes) + unknown
+
+def parse_day(day):
+    """A date from the history's YYYY-MM-DD"""
+    return datetime.datetime.strptime(day, '%Y-%m-%d').date()
+
+def difference_hash(image, size=8):
+    """A 64 bit perceptual hash (dHash), nearly the same for resized or re-encoded copies of an image"""
+    from PIL import Image
+    with Image.open(io.BytesIO(image)) as picture:
+        pixels = list(picture.convert('L').resize((size + 1, size), Image.LANCZOS).getdata())
+    bits = 0
+    for row in range(size):
+        for column in range(size):
+            index = row * (size + 1) + column
+            bits = bits << 1 | (pixels[index] > pixels[index + 1])
+    return bits
+
+def etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header names the ETag"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in tags or 'W/' + etag in tags
+
+def image_content_type(image):
+    """The content type of an image, from its first bytes"""
+    if image.startswith(b'\xff\xd8'):
+        return 'image/jpeg'
+    if image.startswith(b'GIF8'):
+        return 'image/gif'
+    if image.startswith(b'\x89PNG'):
+        return 'image/png'
+    return 'application/octet-stream'
+
+def image_url(digest):
+    """Where UspsMailImageView serves an image"""
+    return IMAGE_URL.format(digest=digest)
+
+def cache_key(uidvalidity, uid, section=None):
+    """The image cache key of a message or one of its sections"""
+    key = str(uidvalidity) + '/' + str(uid)
+    return key if section is None else key + '/' + section
+
+def write_atomic(path, data):
+    """Write a file so readers never see it half written"""
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+def refresh_capabilities(account):
+    """Re-read the capabilities, servers often list more of them after login"""
+    rv, data = account.capability()
+    if rv == 'OK' and data and data[-1]:
+        account.capabilities = tuple(data[-1].decode('ascii').upper().split())
+
+def select_folder(account, inbox_folder, qresync=None):
+    """Select the folder in the inbox to use, qresync is the (uidvalidity, modseq, uids) known from before"""
+    if qresync is None:
+        return account.select(inbox_folder)
+    uidvalidity, modseq, uids = qresync
+    params = str(uidvalidity) + ' ' + str(modseq)
+    if uids:
+        params += ' ' + sequence_set(uids)
+    # imaplib's select() has no room for parameters, this does the same with them.
+    account.untagged_responses = {}
+    rv, data = account._simple_command('SELECT', inbox_folder, '(QRESYNC (' + params + '))')
+    account.state = 'SELECTED' if rv == 'OK' else 'AUTH'
+    # Flag changes of known messages, nothing here needs them.
+    account.untagged_responses.pop('FETCH', None)
+    return rv, data
+
+def update_camera(camera_file, camera_dir):
+    """Download the camera if it is missing or outdated"""
+    camera_full_path = camera_dir + camera_file
+    if not os.path.isfile(camera_full_path) and not get_camera(camera_file, camera_dir):
+        return
+    camera_version = None
+    with open(camera_full_path, 'r') as local:
+        for line in local.readlines():
+            if '__version__' in line:
+                camera_version = line.split("'")[1]
+                break
+    if camera_version != MIN_CAMERA_VERSION:
+        get_camera(camera_file, camera_dir)
 
 def get_camera(camera_file, camera_dir):
     """Downloading the camera"""
     _LOGGER.debug('Could not find %s in %s.', camera_file, camera_dir)
-    sensor_full_path = camera_dir + camera_file
-    response = requests.get(CAMERA_URL)
-    if response.status_code == 200:
+    return download(CAMERA_URL, camera_dir + camera_file)
+
+def download(url, full_path):
+    """Download a file from this repository"""
+    try:
+        response = requests.get(url, timeout=DOWNLOAD_TIMEOUT.total_seconds())
+        if response.status_code != 200:
+            _LOGGER.critical('Failed to download %s', url)
+            return False
         _LOGGER.debug('Checking folder structure')
-        directory = os.path.dirname(camera_dir)
+        directory = os.path.dirname(full_path)
         if not os.path.exists(directory):
             os.makedirs(directory)
-        with open(sensor_full_path, 'wb+') as sensorfile:
-            sensorfile.write(response.content)
-        task_state = True
-        _LOGGER.debug('Finished downloading the camera.')
-    else:
-        _LOGGER.critical('Failed to download camera from %s', CAMERA_URL)
-        task_state = False
-    return task_state
+        with open(full_path, 'wb+') as downloaded:
+            downloaded.write(response.content)
+    except (requests.RequestException, OSError) as exx:
+        # Setup waits on this, an unreachable GitHub must not keep Home Assistant from starting.
+        _LOGGER.error('Failed to download %s: %s', url, exx)
+        return False
+    _LOGGER.debug('Finished downloading %s.', full_path)
+    return True
 
 def default_image(hadir, image_location):
     """Set a default image if there is none from mail"""
-    base = """
-    R0lGODlhvgJHAbMAAPX1+JeplnaIc9nZ2IaXe7LCrs6grmZ0YrjMzf7///3///z///v///n/////
-    //v7+iH/C1hNUCBEYXRhWE1QPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpy
-    ZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0
-    az0iQWRvYmUgWE1QIENvcmUgNS42LWMxMzggNzkuMTU5ODI0LCAyMDE2LzA5LzE0LTAxOjA5OjAx
-    ICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIv
-    MjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4
-    bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMu
-    YWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94
-    YXAvMS4wL3NUeXBlL1Jlc291cmNlUmVmIyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3No
-    b3AgQ0MgMjAxNyAoTWFjaW50b3NoKSIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo1RDUwQzZG
-    RDkwOTIxMUU4QUY2NzlEMTY0MzUxRkIzOCIgeG1wTU06RG9jdW1lbnRJRD0ieG1wLmRpZDo1RDUw
-    QzZGRTkwOTIxMUU4QUY2NzlEMTY0MzUxRkIzOCI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjpp
-    bnN0YW5jZUlEPSJ4bXAuaWlkOjVENTBDNkZCOTA5MjExRThBRjY3OUQxNjQzNTFGQjM4IiBzdFJl
-    Zjpkb2N1bWVudElEPSJ4bXAuZGlkOjVENTBDNkZDOTA5MjExRThBRjY3OUQxNjQzNTFGQjM4Ii8+
-    IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpSREY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5k
-    PSJyIj8+Af/+/fz7+vn49/b19PPy8fDv7u3s6+rp6Ofm5eTj4uHg397d3Nva2djX1tXU09LR0M/O
-    zczLysnIx8bFxMPCwcC/vr28u7q5uLe2tbSzsrGwr66trKuqqainpqWko6KhoJ+enZybmpmYl5aV
-    lJOSkZCPjo2Mi4qJiIeGhYSDgoGAf359fHt6eXh3dnV0c3JxcG9ubWxramloZ2ZlZGNiYWBfXl1c
-    W1pZWFdWVVRTUlFQT05NTEtKSUhHRkVEQ0JBQD8+PTw7Ojk4NzY1NDMyMTAvLi0sKyopKCcmJSQj
-    IiEgHx4dHBsaGRgXFhUUExIREA8ODQwLCgkIBwYFBAMCAQAAIfkEAAAAAAAsAAAAAL4CRwEABP+Q
-    tTnZUi6rxdRmVvJRFfZkaCYm4uM6ibNQYNPFaezhyWwrOokFKOKAMLBErZNKfYSYROMxVflIU9cJ
-    RqViJ8iFl7ZQCck4FGPc1Y4p7rh8TpcD7vi8fs/v+/9+D4B7DQCChneHXYV5gm6Ig5GSk5SVlpeY
-    mZqbnJ2GWp57DqGkABIkISg9IEY3CkunFg4eSSivIFqvCxxkrBdIKhtAMLw3s1Aeu8plqkvALNC3
-    EwsxUlMNYTSsuSrXXzbUPRMADUbhrzY0wDAOayRtWRNedfT1dqX4jS6T7/d69fkCChxIsKDBgwgP
-    nkKjqhWUIiBq2MBxiwGOLA8YZCgW68IqVlH/jqUS9yPIkV0gacEY8YPYMmWnmFnT9m7NGjcK3nyx
-    qdMDugrpSpzI6cbbNRfXyJFrY6/pnIRQ78Dxp49e1KtYs2rdytWgERupgi2pEO6KOg1QYLirMgto
-    CTPT0piLUmyYzw2twkWL+JZlRL4yF86TVy/ot3glqmn5dlOON3JHF8PB6LRynK74vCy9vMceZq4D
-    tob+TJrgodJ/pIHkgTIoEyWomKxMO9MGWsOyiIFLMZfYwyYSw0J0jeGntiXVzGJhOkdihYU7qcE4
-    XGFOoXHYqSBCzNyyZdSS9p02dH0q50SOAIJfj2+0pdHu2ctPNF/Px9yqnsTSUO7vDlse5BIb/18h
-    fLSLT2l84NF90qXQ0TArtVIBfw79VQ4S0sQzDz0W/OWcUeD4BOJCjcVBgVKUSXaddyzuMxB8mriD
-    B1N4YLGZP9/Vp6MnocG4449A9jGLMA64AAxewWmQzIHQ5EeUC7FYWE41sazTRBEv7WKFB1E+cCRK
-    +w2J14FIQijCBvsMWGIuRRBBwgyJUPCVit5Yt5R5lyHVYos6unNaRlAuBhmebhSZY5CIAhLfIIsm
-    GoijCQVjqAtpsPCTbKqw0EQwWozFFxhwTZRpExX9cuSnNmhRqQhVXqlpNGmokMBiUeIix6jtXBMg
-    eYOW+EUdj2X3wKzkrbhnU0A+IhU3RX5xI/+bGVQGqSV01NcoHtdOm4+L2uJhS7RGXtnqpuSq0Glr
-    X5hqDg/QtFtMgygoZ+sWOYxb7qixuhElYXHgCocHUh1nYnkp5vmGnoV0d6xVgCh7kMOfHIyToATr
-    2UZOhkya5z9UdUvfxx7LV20f45HiCCSQqqKxlTJExK4wK2zKqi+8YOHfmdXgtSRLzKyknxCNsdzK
-    yx79V0sT+v4qB5cRKXBUFp9og/A8zzp24jcLezcIxAVBTHHVVmMNSsZPOuxZyJuUTFq2mI0cFddB
-    1pFgBo2JFZERVhpo6YeoWFnRXzVjg1ZKf3s57LftaGE3K6zgqySdhJoIT4p4xnNR5HZgN1n/1lqj
-    zDG3Bp1XVMGXTVHsci4O9RR6daDNCeium7Z6eJqMNzakcZhAKrgv+PacqE6EqQR0wUVB0b6oYih8
-    XZsiUajvYAF/b4CT8Tu6TmCbjpE8F21oHcKma0c652d/fnvXY6fXBXnAapawsaCobocjKLitiMk/
-    KqI2JPvvkS3bfADg6zzRrz+dLxMn+8eM7peofsmMCE9ixxWc8Z9VvMWC0TvLkEgSPSlJBza2UYsE
-    4BUMSykuBhP8TQ4s5ZO1RMY6VxvHIsS3PaRUA36OOZjTWEe+HhoQdtuiA8HkUbAYLoZFRYrYoarS
-    P5K5jT3D8oMCZgRA98Snin0QILUOGJ7b/wliHPTh1p8akYFNjEKJl2hi6AznpaOJJGgWCFyHOtQg
-    1dBlXxoEUy/iuIwoVGlnREhQRHIRRxKZ4xeZ+pmflFitGILIemli4/gWcR1yzIKHPuTcAoGYGSFi
-    BzKSI2LC9mQCRjqFD3Br2BPXM4AqXrGVsMwD26z4hyvKshLR+pgaG7HJ05yRf4hAyh9keB49aGwL
-    99hlaXr3xu5BaSNAIwsQmCfClmDwQ6+R0hD01qThgYUVOjCCMzMCzQxuMy8hEUk/Jik5pIyond4Z
-    4hYwmcmF9RJ9OdQcDscAymOVkk+d4aIT6cnJ0hjgoAhNqEIXytCEDsAAD3XoQVsJUVha1P+WMOoR
-    ADSaxVJcNKIQrehDRxrSiI70oyhtJbYuCgBiNWaBaCSZVpiJjmzOgz+4QQJsCnSpO/7uLDvVIGwu
-    kIPAxeUY1lzLFpyW01CR8D6CwckxKalPOX1PfU1JGNhSV0+Ask6VykSleEJZnjsdkYZbVVjBjsnO
-    +QVzYwkMI1eTycuS2Y6J5xPo1gDg0I8uFKQNDaxESfpRbN2BlimN5WEt2plIqBSWCqWoYCcbWMBW
-    dKEIAMAv+WCDTwzkZPEr6AKVRBtU3MaQVvDQEmRSs7G0pKZkSC1RZ8ECo96gCNY0LVJRqxv8JMEn
-    X9ncVIuCInW8YmlJZBE7e9nVU1YilX//4Jo7IdNPqsZvki+c4VWbK0b1xJSRzB2j/fRKO1TmA6MB
-    XGwtN8pe9RLUsPA1LHw4Ctn6orSkGu2RStt72JX2V0iGYMDDXsCwzjQvQEZSkxDK4osnoIK1tQKc
-    Hgt0yP/opwS7SBCCvaRgcNS2wUZTwW+J+uF5AevBGFIRd3+44vJNArrRvR1lNKdEHGLOnQOjByRb
-    3DoeMjG83cUReRvLX9odQot6sGWSN6rf/7KXo5EYxewssQDQuGc8il2ji2f0wLJFOCZUSkxFYus7
-    X0QpuB+0F0vIorJgePk5n0rzW+6VhFjVyTPPmS1x22pPgvK4Y5GAcSDiZ4opKmUw19tz//vgaSc+
-    H6t+3vUa6B7hRaoIWoFZxgRin8xp/z6WsbTkbyzzW+TREPMEoGvUfuX7X/Q6+VHAlGl89WAAARzU
-    FPjcU6w4BaUzJE8QprbIzMDY3r/BRAI4BpVaTgQJbMJLNi3odTqSFyqL4KpdLNTBadhplNVo7Gp/
-    Dre493pi9mW3KLuQaq7e4egUkUvc9hgfxnrYS9NlWiBYXq+oZ82oAZxxHxjVYqYZy++Ca0K/V5zo
-    ALemNUWwjAtQQpeNClAAAgSAChDkBQAK0EoCCAABSFoQLwaQ2QYgYAAXSkYHBsDxAQSgABn5ZoEE
-    kVmdnsuocgIuON18l55LKE5gSRp1IP/ZD4vB++j07qIQ03PucMVAcbchosLq8XCkLz3cVfmlAUQR
-    1gAi/NNQVjV8kZzFVqbHvSMt8tj9x+RRP/nrbs8Wqj+X5FVvNKSZLS9eBerVZ16pVBIfR8UFcAAC
-    eKld6AAAAQqgeAEU4LeIl0AACHAHi8scCApAgAAG8ACLk6cxGilSARyv2dnQDDpwdsUwDKTaC8Ti
-    EHnuFN9Qp+iiWP32fWa4U5q+haeHaxY4N6U93o37IzpakzzUSNsVKAm4g73tsdz6kjvtI7IfFqIM
-    tOitGXXLxT4/sfemex4m5T+5g0zWdi0m/1i0yV1zM0PjCIAACLB4esFlAAK4eAECUHr/comh4qFh
-    eWfxAAVwAIZAfyhnPdFSgBeXWjw1e3PWEGdgMznhHGMwL4bxSFKXJkV0fMX3gTNCZMLXaOOTAlC3
-    bEpjGcT3gTdWT3h1fQd1cm/3WPzlCCzlWA91ABW1UhlVapSAfZ51ByEFUYxQCU32dt4HaqT2P9PX
-    ahAVaHo3VpzEJ44wBRASdaHnTYJHf5P3eJoSLwyAfzBXcQAAMzvwAKHRefzHXsQxCpN3BwHAfxwg
-    Bp0iCAVoeFhoBsTTKl+IQYwBJT8gML1WA1/EbjMGP7z3gVYHZGZDabzjiE8iLA5ULk4zGKPUIuRS
-    NvRAZ8MVbzvWXPe0ZIuiZGi3Xj7C/2R9ZVkNlV6juH3ocXdPaF5qQ3DPd0tH2GopxWQzmFiadRo7
-    CGChwDl0lBx8WDNoKH8ex3+yggRrMHqPV3EZwTgW4HII0ACLNyh9UyTyF4CUJwxGgoaMx4ANAD1M
-    YE7EgyFLogwPxgEXaAFthQ2VaESMJj6KqIiM2Iji0YkZQzEleC8yUh4LU3VN8XC2oFweCIqyNBqb
-    xQcI8IsgExoBIH18JZESSQUgJVkLpYMi1V9wt3z+YwA6iC22g2UI118ipVgU9WlIqCiOBTIgOVHA
-    x0+mYDrn91wLY0HWpk6v0Vou53EEwHnLCC4DsHgOMHkXmCoF+Hj1RxMt8QABcAABeP9xB4ICisd/
-    zrhUzjAKofFTc7YBIUI9GGcSQLMmc1CQ7DaCKlaPxXePlZaPmpiPkyKJz1MuUjAYaTWQIgZp9kCQ
-    j1gZ+8Rdeqk2MaiLYYdQqgYjBPCEJsVXUOmEhqmKE2WY18dSmTYeCjeRvwRsHLeDvGhS+UWZWSYI
-    CfAeCoSGCKWDCIAAFBeHBZCaMlgjCLQw6wZtWYlBDjCU+WcKlUIEhoB/F8dyNLEGHsd5L0cFjCMn
-    2rh5TBaNPTMAhbdxUJlmaeFyCYhNGDIDQzAdXWAFOzF8GaAhLSgZajmeS0NpaCQ/eTILiXYrItZG
-    5vI+n3grqFYkRVKBIRRtTaEBuGL/KG95YnVQnz6kAVRBcim5kQ9FAHmHLQhla3igcJIZknmgcCYl
-    UX+FkfDhigGkmA+AoUl4Um3HmSnpfZFJUrHIkYTpXt2nUqoyCiB5AAcQh6yZmvs3eZOXf63JbJRQ
-    LWy0iXmxNxfUWgDwlDDnniKxca1UeIpAFriwjZ0HcyFSM4gQhzWWk7dJfxu3eUXzehu1eKlHAcrj
-    YdOhKxtxHHRYKJpIN+5zI0VEj+SplhkzXHIFV0iklyYoTPF5guVyMYHpFJxYGdGAXALKY4yCULfU
-    kAnFoLA4kZG5daPhUEJ4kgmlkbAomXd3LaN5a+5xa5YZqYaZihI6oUN4ktpnX0N4/18E1wAkB6Mi
-    5Zoz2pqp2UqpKX/z1yi7tDp9WZY6ZyG5gZNhaKXG6UwAmJTRKE094JQHAHO5mVSFwHLgGDGJUUaT
-    B5GmoKvHOJQwZ2bIuVsyYTPQAShrAgyOAUpKI3VF16b2eAKzAm91SqS1Vwd8WRvrWhl9yqeBOon9
-    6YKJ4IrARqj8NVGPtX1pF6oSyZiEmob7dZGxOKETigD7g7AcZTv1dVko5ZGLJarW11H9ZZGjFwAn
-    l5rzl4wwGocWdwACULIcm6oeV43E5jl7pwidOJdI9WCpBQ7WOgZ+hIYIOJScRyI2J38wZ6XZuQpV
-    eYyQ4Y5xBDDRKgioh5RQWZwpV/8z0lFTgVE93kMHe+pOlTR0V3OX5jpuyMSet2p/c8o74Do6dzlN
-    LFOXVBAOL/ufTrID91qWYTssG9ZieZCYaQiLoyFgCnqhlxmZipqwi+p1E4mK8zWEAIAAidmQaaeo
-    lhUfp3FSIQpqosaLexVMZadZG7d4sTqyP2kAmRUAKJe4AZh/Hmu6iUt/mVVlYKUsFjF8PKBNEEaz
-    HMc8dYl/hrd/5IBaaOiUP0mAmbVNwDeUuWuAIcIgTrl5wCclgrCNFDcNURe1C5Yc1DF1zNRomiE+
-    xVUxXdu98Fa2e+alYTsmECIoWGu1nGgGeQELqkWWkwh8EVSQLigIL9lS+FeiScb/ULLkoJi6UQya
-    drZUoiM6gzxIiyLqUIIpsBYLdpDlry/GS56jUprnmsmYgy7KucoZpBzreAlasiabuqJ7akB0P3V4
-    VeOYq8WzOBxgCD2wYc2IgPvHeR4mtFaZf/oyBNM0tADYEsuGBz7rMxPYqz9ZnLP1BL8AtcpzCuBz
-    LI60FMUCSlzrvVIcoPVqFJCBA83RNFgcNuibvlpojrrqvnP5BPQTry74r/i7X/RbawqloI3JrxfZ
-    uA3KqGi8gw58Cfingz2SxtDHwAdboJ8Kqf5KUa0Jq6MWfflHcoSXf6jaolsnf6JLDneIoGtIvLHK
-    wRMsFV/lBzf2NKzClTz8Rg1y/yZehpsdp7Ik9sIsV3j+dh9gsABiiKqbtxvEQIAwt43N8A7Ey3LV
-    6BERUiEVwAPJwIGp55fUJcJRQ0lTvMwrBr7TRURbHAcSUb5W47b3YjgQOHT1oAGBg6fctb9bd2Qj
-    usciBccgSVGN6biUCkub16ijdlkSypJ7UKEFnJITK7n+qphwB6KFJV8u93H/HIe5eaQTZbquqbih
-    +3FwWLJ3oHkI6pubVIR5UITxaRTe1Ho69ckF8ipPclgIaKRHJQObe6Uw5xvs65wXZ6TDckhOecuU
-    xxt/gYbzlwgjZBcSQiKxwgK0Usx++UnjkxTMHNTNJb/WpWw5dArUPDD9eM29Vv8hSxsi1tt7NdUC
-    /Re3ewI1MKi5h/W/sXiZjHmhkNXQJfpQEZrG0ue3Xu0H1yLOJRq5/UyxTRZ+zBeEACalCL2VExyH
-    MejBIit/JPuxrXkHL6rJmsd4mndlnDXRd3odPaAMPYdtqrEqOg2OLDerVXi8U+RxmwuUHyEPvTnY
-    9ANCzWjDUlpUHAAEpswgKhccd0ME8YpHWmMUbkAshybUtj3U33mUU9KXNKCA0IR6YxsNECQRVTtI
-    zCJliXN0NOmcA5uo7myajPpqHQXW5LwomKqYJVWwatcovxRRflCqahfeYhddVTGaaHgAJ5d/0aq5
-    CKq4FXeyBx3fsfqiqjkaCPD/14UXq6PLWRK9u4sGK0+yKj3lKk6TlLjppNEIOIpHeQXob4MjAaq5
-    pYwnOCioEUmpAPtnf0mAhlt6rA9QITiXcu3y2im4e+5DGJFxkLe94vmpnjTxH+JJe/SCKndqzZno
-    HM9CA95cfOOQ1v47GvsaGgjVddbdmN7NB6DLV4k5qS+JZKNod3cAywlAuZQ1WQ1sUoZ6URX1cffd
-    tKzschfMsRTcha0JowZ9yWv4lB7H1wjND2I8xmQrLhGYAwR4rEG6eacXC0HK4MobDChBhlVJDuqy
-    DcJqdjLTeR23ecPKlKiQ0z0HOTXeOlUVnixe6d5hlm6RYemKtUHRKS3EN2Ob/ylBIOMxlyq/By5o
-    yV0T4AD8amh3gKiTeXchGGiOkM/Nvb+Ty6nujIuS2d/fLZm1pl8LbKr2DFIFILGSi95Pid4WbAAE
-    4KIn16LtXCOunrixerJPKeanS3gbHADM1j+mvontedxgCAJEEyBCWpSiuyCfrB1WynL9V2cLEIcy
-    7aQ3MwzCykxNYK1DeXHD89R9434AwgaUXm4lbukI/2ht4QURNjrTcCARtwuHMQdWjY5ZMvHXYGLr
-    kB5tW57eQRRFyKBfJEt6nNV6gBG0PsdQXtZ7DFIuuqgYuVBiNesV26j42zDmdQcOINFj9HEgmZtM
-    BqMOPbK35uvYQF0kt3+hi/+gJkeyAh263h4w+xPp9DA3yS3VgJO8nFd/X6gWaJjovajh0fKGOkuB
-    iiCsPWeCOluzwCchh3G0PXcXLhTVV/dF64NVCZ/3C9PbKO4G2PlBtsAX2kU6mZjFFkJVZEDxgXm1
-    Nr6Cc1mEtfYHTX5QEIr3XVexEJpFExWSgkWihFpMybShGinkiomiulh3JrpeD83sIYyqcdiQRi6Z
-    B92arpqgy5rImpd/g+2/lKfQmFQjK4uXGu48UHdNAuZxP1vSTVBli0e8LQUzXe+clEed5pQTMVyz
-    YLLRWq+zstLY2dy+4H/3BkkCO0Rden/+V+0WhLJgzQPwS+0EMKS1qKD4j0j/1NtMZ3J7SU0vkfcG
-    AcPMOcB6QL/HsgZDEZQOwyK/kzqB4TUOk7WeN+S+Lc9Bdq0YAAbERmIgoDQDwUQzCaAKgdPREAgg
-    DpqG4FAgHAQBAhL1wmIRBIGAkMUSCAWEZbEOAAJtpT57GGjg4mgobHg4BOFZXHRwfHRIUEiQzIl0
-    WDBMZBt4CCh4eFRwdDkg0DtlUGVYUB11YCpwOdVsYFAAaCsNaGUwZJ30BBwoGIB0UGitXWZeJmSE
-    ZjQEKAz9iMbO1t7m7vb+Bg8Xly701UTMMV9IOFYwFyykBog+dox+r0X8LYd+deB55C3SJErsAjIK
-    +KTFkhhOQlRQhIPHCIoi/0osZFjmyAgrMIRQRMdB4iIfMoKcQCBEAq4GNxwyZAJjQMohVSzMpDLA
-    lAUEXkwZaCITAYI9WWYORTAFKVEsbaIUwjJTQBEAPffUEcDlUAZB+nTMw6aAwyhKolblcLdAWaEb
-    e0BtEGWvwBgAU+btayDWxptOWn/h4gRmgCpNrhzU/QIXUjJ8zZqtMrRoVDd4iUiBHZdZ82bOnTfX
-    a8xsVOgHBvXaYobW38FQohSIXcbKsYet/iQZrOdIr2Tdmlq1GovNAYNSH0lMMHGmIo7lIylSINFk
-    IcYX1fsw3+ABmzwADOpYUcnChgFBLoyHkFBTAoya6NkAkBPgQM82ScocBv9g4k0WF4GOJv2PqTjG
-    4GmqnjRoYyoD84CHmmm+MUsVg7bqwBFlCBMkqrlAwW0gSmz4YoA59EHNlgeKeUCO7kj8ZQH4CDgx
-    D7VWASaDEwUAJbdIZsTQltBKbECttao55B9vEqkGmnkw86xJJ5+EMqx6ksHLELXY0S6yB17hQbZ8
-    xuoQGbRAQ+cvSoaM7JDVdKwHGlFqUaUbhQA4rLwMwLuuOT0xo+iGmiByQT0W9hwJm3hgEYKC9GKo
-    KlGqYClDhAeC2EhE8zphaz75vpuCQCqGKgCoAajQaKiqlqoqCwHHYGOqWZLKIsGqTuGvgQQqC8cs
-    W8iirUhkyjFEJ1q/2BL/N3fi1KKYAkBpURURi3kDgGN7tEXEU5Yt7TVtXyOmrhHZlORHx2xZ4DV2
-    zjzrSUWiZLdddzWbcq13VlnHASK9stUeDqg1EcwOd5vkmF7NTKAXfg8py5GCFk5Y30YsrMzHbhRg
-    4qOvrGsoz68IZXJjOp9oYgYlUjrCz+Wu0yaekgFBDwgHiFDECSUmBWI9iCBqQA1Xb+LLKAkEOIKK
-    Gaqa6agAMiSKqDHGSINBA3GEAws68vALHgiRcWfXSArTzRdzToy2AGJZmZCHDbMrp9yCn2UiD0l6
-    OcdaFEJhOAGwvc0RXHFnqxeSQ5J0ct13Bye88IcXk/cXYNj528FC/EnH/xwMVQvYEe060PYRClG7
-    hZ20DK5F27eFLDcZshwGqDfFgeMG55eBmkA6RbHjWNIeKrIp9go2IhRlbXzIqjrp2iNiUqrujHRJ
-    mm3ewqGN5uppDZj3yAWBBq6oYr4Smhjqv2WL+ETApvabo4E1hnq6PlhB0LKbKV9DqzAayaX4gDzC
-    AAXzSDy4AYxTuvuLbgTzLLoxBh8iAsQ/dPSiGw1gWzoyGI0kCBmtLUYHFPKM4Ay3wXFokIPZwJA6
-    blG53ZQIGgd7xYz6Nq2/PaBcA+HRrs6lFvgRQnGsmCCNUsemHozJYafjinoQ4QCxKYo9tUPiBpaE
-    OwrM4CVKUM4QorCDbf8opArmMYnNLICROSGCIT+QiQZokgSgeMFAmoKZFpaQHJt1DynhGwoZ9pOG
-    OU5FEECTwxt7EhPiOMgbaxrIbjpQjvkFyW5ziQIn0kKWDF3LDdSY1wLkkoRYtIYx1eBZAtkkogB4
-    AmiZUEXfICGJZNBwW9uS3CtYuAFCftCVrxQJFWF5Qsk9rnKsgQwt75UvTKyCIGhCxC0e8TavVa4g
-    XYLT3jDIJtRZgjWWFMTrLNDHITjxPBFJ4p4m0rIzqCQrRjzO7mT5O51UQHa7S5RKULCAF0yqD9Ch
-    WXtugoRiiGEPY9BUHopwBRCYIApFIwasppaGMTAljnTMgiDOt6D71YH/ABHzhiiHuRvCeK1HkwFD
-    FARDynTAJw8ZJQTZCkYYsUErbyP1hR5kIYcBhAkSnDyRLEhENh0VpKYXkuSvTKSVUM7Sp4Xz4E/3
-    ZdHHuTQHnNMlkfJVsHL8sjFDnOiFbqmbHGRiXMl0Jg8R8kyIzYkLS2wioLJZu22C7JpWdMLsrjjO
-    4DDCA4NqiBETVYwWdCKtc1MPTBZlgEltIQxRkI8bmLCE/AxGA/7s3gtgdb442A8pBBDfPYGmAVU5
-    BQRZgWw8MKgNYdbDbvuaETPK5UlKdoKjPSBDA/VRrwR8DZFT6MQwgQMfkxZLR9YKFIsWx8ybeq1e
-    cFOqxIQ63Cixdbg0/yolY8SCNR7QcEuLwOE7xkIlW5iGFVYl5AhD66MXWlIf0f3NbxqTrtWEYjVi
-    gQ3mDAIQd3zxZMg5K6F04DEbKe92fY3vn9KKka/gByyCUEB5DhMKKwyhBEMbgnkES7SKocQY8DHO
-    z+qKnD98ISVjgF11tHCT/CQNe8VI2rKyoJSkqSpWZNjD/3JmUDFORURp6oYHGODZaQkpNM5iw/84
-    MJCJvKElONLHK1rrghuhqDUKY8yz9AAWgqx3Hrh1ocFM6dL3tcOXBlHGOm5IXC6/K6iz1NaF+oGM
-    DlFuEsGYx2u8Zpowa4mQzIjTULVGylOiSYYK81xWoxrK9TJijWclSf+gaNccP395mxng4kOEkBzC
-    6ukf7OOAiygGHfDANz39iWJ/GOAnk5mnBS0RVWBl0AaikKc64SNCEbFgEjXASlVxXErTWEWG+Qhi
-    VOejrGCfYjXAaSNMKCXIsZYxKjkk4ciR4MGzWjKiQpQuGXbZkG1HeUgcBWrapPiOLiJRt4Yxc4c8
-    EHIqa9hlcrfL0K9UmOTG3O1Hnw4SaAmvafYn3at+jUQStTI+aLrtHx4DpYZsphdfB+hYjlWJS9Tm
-    7XLrsUs5RKwkEHSj+mCBgX9RUS1IdEUiw77y3IUdVZmaR/862I+94SOj4l4MxICUAMH6oEqb9fhQ
-    AIdTWMXFVPPjZqH/oaZ/+dZz1PIAGCzboXAdgoC5ze4toD2GKLP7RInRs+WIMotO8tbqOwSYhdTR
-    53J3XV3G5YbOO6OwXmCAEYC0xzxyYzdq9GKqvUzTDWnEug6Essndbi21+pYwPY/O5wFHR0NGoPCD
-    I9F3IFH7ZRTRcYTLDDz+LTAAEvCnc9oswh4JlAQQ9QMwSiAlFPg8DSQ8B6NoAQt17ckbDpqcPWDv
-    jWSI9csli1BXzUoLRFF9FpJQHqttA4eslfJrgEsYEbkhCqUZJQZuwvRxgY0Yc1ikQTwwjxRLnm5v
-    Cwb1RBRb14iubrkBN2seIWWue9382aCq+wCfDbELBxk5lMy+WIT2/+ceRC+iyASL9PwYU6qlAzs2
-    L+ELJdIJmIKJIYDjN90YJRv6OzEZjtuBCJFwprK6IutYAiiiNEy7QAOLsHUBC/t6MnTKGE5jD644
-    DN15gupAOPVYjwS7wDogmd2RCc6jgQszvX9qCMiqApXDMFabAsiCo6TAvaQxkFVxiqUhg6yACqZ4
-    g5UaFVmwk44Zi4AwIAawrrkDOm9hqQTsmlF5AeaTn3JAuWU5BdO5pW6ZiyRAsrnTg+DRJAvhEQmi
-    IQ9QIGtAB1PyIcxBLgCsw/Pzw3fjBkAMu/ajh66pKFZImQo6BqzLKuAKiRxYr78xk4naIV3xET7D
-    s0tCQHYTBRtKG/+DKIsSqiaLyUN9qIomaIKacCInQisJYIN0OoLkyRgQuBwjqar9+gGL6wuIO4mP
-    eLQ7mUGbcDT6AotjeII4+h+cgBn/SgM6CBkiQAql+A/FApUUo72mSUIXMJ8kGAbKqgMGKRQ925JU
-    0rowPIc0/BZMAL4bcaijkRx8aEPAApoChASxeYE5oJMdOYe6AJrtk62D+YVokMR0MZQdmxI/PD9B
-    1AbIOZJH1Ibxawyzw4Ziertva0R4xCBGcpCtmza0uA3rAhIEXMNmA0UqwwQWIZeSFBNCiDwpXARw
-    CgL9irD9colEwUDYMbQl6UVLa8k+KZk8II4euBkgICu9WI4MAAT/A3EBUpuiEIgCAYmB7iGVOqiL
-    VjsobCSogqIjJYgaECAKS6Eml4QceVmH7gBIMZSjbxkpVRIGC/iEQfIRTYAPuiipt2vDqoytt9mH
-    vZAFisOas+QHadCtyxHIomoThPQ6hcwGhtwGQnS/XpIgQZKG6zKXBPQhWzwyAWwhcHuNWmiFNWEH
-    HqAEcwkXLyHJTMQp0zDJAPsukcIzh8GAhngGdPBAWBCZP0ErA4AFFqxAmLkJDuMdiTwqofwI5BCZ
-    DOwTdII0RHgBRquZiKivr7CRnSuP7dsCqIgKcFyCAui4mWA9k2iBT1AVnIC5gkLCe0oD6wkEpMiK
-    pIAeUwnHKbSH/yosFwSIMgo6h9R7JF6hKbuRDzRwoHeMBw3wnxeQBWd7BNzCgnmILjjZkNdwDfH6
-    vflREkkULkNptopEzD9cv3ZhJsLMKsEMM5VshynJM0KYESQDHcChP2e6u9GUHNbCz/68zFEKEmBA
-    O1vcPAtgPA/8sx2sgAQYFAXri9mxCIxLxS+jxb0aQUDZIgdaouoAFArpD8HDIpAAhwYRwqxwATX4
-    hI4zH+68gUlxMR50I9wLH/RU0wRh0/dwSqtoGvekBm+gM3MBmtI4QE1Ax04ii14YzaeThWKQl1Wo
-    i3tMjEOgEYPIhWuREaKyhQ2Yi8F4IVXyPr+TGH/wGvk5oWnYCv/H3NCu68TCydFnEkdPhCqrAyS+
-    swTcMMBM7ReDXERncimU6iwW+kTUYaaF0ZHhlM2vQg8lgo7Jk5l4crhregnCyh4h2JKOGQFQ0y/w
-    AB4hII5E8DTboaa4gkUsPRJ4mIqrqAv4IDn2+UrybAg6AL0pEM/Iihr0TBAxSBCqoAY44FIXGAoV
-    20zhOKUESIwdqSUTmQsCcSFDPIs94LALua5N+yc2sE9yKaZ/EJskCJQAA5JNs8+5QAR8yw1N3BII
-    aiW3GpJPBVn5XMnC4S03ST8S2VjPIjqCGCab6jt0cYaow9W1o09DLIy+qURO9DbixBRbQ0VR6Q5p
-    8oG+INbwgA7/r7rAu+qPyZPIQZunJxWrS6PW8fCdgru4nxk8l2Q/lgCaPRADIFwDESgEppEaoIgj
-    ERuxpKnXyrKfolgaNm2D+fgqOgjbItijKJCuh2SMF0KRgSgkD0g9TAG+lJqHkjISnHoNP/CWPAgm
-    McuAh62BcZxYbAGDZuOtMxGzykw+i0qq9glZxOSSdkGvSjzIs9MXCyUkf0iuK+ysvLuFrKKEoIwN
-    vUhV2ji2QLIx7rKzlLQcWIUhzS3ZZQU1FCgPziMBllEIy6uCzZuASSkDeMVN/XoLeDgMFSQBDvO0
-    /KqvIjCZ6TQbLZJS5sgAzOSGTMgFVGgKrexR87kKlDMBdB2K/7ZdVxRLQrJNX7iVW6+cmgV4ym4N
-    hCDSW9OxQ1U6QA5ApLsY3AZYFn5EALLzrX9gAkfKn+p6nEKVm7qDDJHCghgRnXrQgEkou1IaoVES
-    QBza1Hzw1M8lN8b0DMXUDAvNkrx4v1UoG/kkTJuCoZaYU64Bl/AiYVt9MzjbuzDZ28xRwNLNgAWI
-    AUyBOGR4Il8MFIy7ojtRNLyKuOx9MG56iYWwjk6rryejCQ0YMMJLsPVIj0sDOzmBBaDhAz34goRi
-    H2qggx+kte85229Ug2KzJ8nq1vuNW5zr0jVgAqVJmh4FOyTDTFYtOn81NiERvlagLTcuABUFBlLw
-    AgQBhTXTFv+2wR8M5kgG2GAsyFhHWGCp0g0aWpgySYdnslDHIQyHVGHN0FrOYOHOqOVxQF2l2tis
-    kaHW8grPiQxJWAxqhROMjZBK/kdXrbchRhyKRNUeGF4RMF4xZrsZw6YVEbAQSLtB24HJqE6+OsYU
-    9DQVlM7/O0EUCDgxuoF1ztY07oYEuDUZgIP5gNgQyBkTwwMT6IksWs+oYAqnSN+sBOj6EAEgLArV
-    g09sKkRk6LdR+prikzy/8wUbqDYyMIZT3q0X+UIEqKhzaaAI7gT8fAWPWoKWVRiwwdumMsRtsaqt
-    Il/NqpJ7jeXMOLfMcOHNGIVg6IyIgTHPQVzWNIQz0YQ1kd3/OQ2mfctYemFZfiWqGT1EtcFhzG0q
-    k7SgHmhBtbuUPgBTQ+YCF1lBuNiYULBnE6HWmTiORttBKKIilflVzDyObjrj86BpRCgx+RADehYB
-    79CnVrs1LXBXs2aK/2gKbITbt9WFN5VXgzqawVvo0KxRrcMxtxHhd+CkZckbpsaAWaCk46OfUWjD
-    e2SWZSidWLiA1qhTSWZQpb6kW6Ahz2XhVo7pmeaMms4MyfyM+7NDz+jUeiskFFaT1/yHXO5gHQHq
-    WzAMUiod0uno9yuXsjMN0HEFUKypy5EHh0iECUAGVmoMzOijrpAls8OAR9NmG+FURDWwC2iJecI0
-    57kB8VaB/998gQADC+JY5zOob8RbF1z4CkGwZhcisVG5p6lb0qckT6kYCiSYgJ6ZOvBBn8oqbHeN
-    W3hVYFwj0KnQMQk06ompkNAVifj+W1WgLdjaXP5Zlja+C4CbDLfYvt3dCrHJgwIsO+Jgg2JYkaGK
-    oFxCC0uYDB7gtaP2btneDNr+qVuOksnJ5ZBsISIRstEQTV29uqoyDOAezbVYchDGxH+bRIbWKhvh
-    neq0ALZbBJkOu0bYOT/jgBbktLpK2oXwLx/AuBugbnGeuCMitPZipbB2APFcVwvnvQWHQaSIAXNN
-    MXTFEVlYCgFZFT5uV+ilA8hykOjBuS9ZyDp8AS0nCRcaL/+x2BBiuGiMJg7YCoNAGGpFLdBIFba4
-    kYrLHinUQF8jCymge9Vj4wYmEXIgt3VSZZe1QMmrQtkln1l/29l9UcR4UWmBsTt+hRMSouqjmocK
-    8Apr+yklKpmPuSsU4K8vrlZMY82xsDxp4UVlFaNjFWPvrtKFCAV59QnGYon3pIOjmOP5WBUmVNtD
-    pzm3VXTL4oI44F4DB2QHyfDHhBQ+/VNIpK64/AA2oJpOR4bZ+oTiE/VihxTB2ih+UantS5hVrwYy
-    oHEK6W0dyirbtvWQH7sOdZKDeUf8LG8ZHohfL4hK9bfIUUTvK+HSaRhyhMwMLkDSBD8vsrWFWC4X
-    ea5Z4pP/gqsYM8aB3ZBmx3MInnWCjUFjKVLOQRJjzhP1PI9fGYCsbgWBdD10c025wVbTpMk9rGSa
-    I2TTQIhX3EsQ2DuajpvNaKDdbSPpukOLg20WYiBDoPE3uHnCFNm91bEBYosPDhnUZSuGPMCaUhIS
-    QYCtHXgzfPg/RgSHUBX5yrfpYMd0CRqXETozTQwdRMbM8btxCIWEC+GczqlC1a6xn5tqGLKxzll4
-    VCbu0kA0cD6HxwT5Fj4IDKIGnbDeSyntghuP5uWdYsxeA5i8pLedRgG0ctqij7hnLXAIIJSHh42D
-    Vyu1EwgDn5ABe8KDgkLTomBXpZGDqZhWOKAPZwxbe55l/1idFruJ3AqBuxDK7MAgNRLuhQfYI9ry
-    ZAhgEpAwCDnhubRYEzZPQQzX4ChLwyzKCgxBMQCPIonhMz4/8OcYMnrBIxKoSDKbzic0Kp1Sq9Yr
-    cqjdDoES0C7cEjEUCW0iAd69hglFF+jWkdvbz7pVftP1i7NayJ8DngQc2grInsrX4FYa2tCAAQDA
-    iM/TEpaU5lFD5YIBZSXpCQ5m5cOJTKXowEMqrMyJqWzpKGmuLSmH6OjkQIhAgMGBAIINAYLApwyB
-    gMBBRQFCdTF1sTE0dIBAxXBFgHg3OTf08jZCcwACO2t7e/NNlFaOHkDBzeWQQshamYJlJi6YeJSI
-    AYAABP/yHSjwYAHEQhcsYAgAAI4HMBMyAEBgAgcLF3ASDigBoAMLMTwwBdECYhPMmDJn0qxZkwvO
-    IH2+9PEn8gyaniLdHGpJJM/QLTnyNDikBmmZDmAW8CsEtN6HFofsNXBU704HAKIchLBk88o8Jp8M
-    2FAwj1XbIDJEIchVaVLaXTf2khKVyi4oWHIcAPsxQIABstMOsE0A4BiBiyIGIGjYjppHAgaqERO3
-    zRs0DcPGfS7tediwdR7rVhKHIB8veirsFSmprwU/RXVIeCu5kMMjPocXUkjRIU0OEg0TCgAQNaPP
-    B89k5GPU4o8qEyWMpwzTg6XRBJeMnC1v/nyn8+WXHOL/l9MIz4jxG70A+uaoIYg5+BUdTAiPCI4s
-    BRBXe6wgnwSFuOBCRFldB5F9icCQ4Ad24KRCBw485Nd4RYAHRCznxeZJA4cBNlcln9iyyiqlVJOC
-    c5/QkosDt9B4EohpaSHWK3PZ0IA4xWy2zAHL2JDLMpwhM0mR1VTzjTbdlPZMaZ+V45lFrS1jQUfD
-    xDMieUfgBMMSMvxABk/XpbEACRj4ZtxVRJQUgAaycJEGPhrMQMBDbmQ1QUImpGKdCzVWkFA+Z4oA
-    xA48BWGGPWGqNymlVmxRKRRgJnFheoxKCmknTZEJw1WdCsHPE3c66IgRTaGkEYUYvbGED2ZkBJUh
-    9ZCZ/9IfaaQ6hIwHwHkppkeUeVEQZTWgWSx3UWLLLrQcWQkybM0CzIwnWDuXLKq0mJcRhI2yFiUO
-    GMmYNscIEAwpDXgkzkJOHnPZOKdVee823Whw2qFakuNZNbBZ8slKWdyZ3JmwfiEIIEWUoN0xKsQJ
-    SwE1YHADcvXh+bBCG1D16nUVKxTMILSxSVDH+nx3hMJFFPsyzFQQG/MV7c2cLA9KoOrfhRoaHEcT
-    B+PxAgyLYuRgHXGK950WSIeR1BseBKjFr4TMRQkLV9H8A7gDNxNZWry0qC1blPhy17StMGbtjGdz
-    myJbNSCTjw8jOOAKLJOUe9gAB2iTATzydFmvNQJU3P9OvVJKGRq+5tybZUkCQZPBOPJ4l/MPcRLV
-    USW6LRyCUyAU0NvoDmWI6ujJNMcHfQoQVJFDH0PHwOuRdXWGybQ/4zds34EHawtbCz/8qUAPv4Kp
-    xl6YxKI6G3/nrDBsSrUTZHZwoCJw9NOqCk7/pNSiDHSvkj92QPLUT2o40XQLfllyn89bAw2CJWKN
-    ItcNNkgrCmL2UzLjXey3NmnRgm2J+QsM9PYsRonrF2OBxbr8Jg1utCMXDajYDFzzGsa0oyKnwVLj
-    uFEO1CjOBvB4xjfUpY4UEayFysOJY2zAIKYIAgYdOYGbWDEm3jhjA9AZAyy6UZFXROV6H0gIDX4j
-    kkT/1BBlNXhL835AQ+JRcWtw4EQTPlSFL9CDAzhgnte4yJ5H4QAGFSqEHr5wIBhoaGE8WRAcp+KG
-    HTRNEUQj1X+8BxFF0LArNuuAFBfEpk3hQAs86AglMDceJuQAXFSoRD+C9wMW4A8WC8xR2q7lF721
-    iC1kUyDbWLTJTArGAQgBTs7cdphEUqAyfmuHBpaRorucAx4IMMC8iqEM0oxmcVXyZb5QMwxLvKYy
-    33DNuizXQsx5AYadkI8YvoCCCxjuIn98A3Oc4ZCHoAkfGBiiVrBCu2EuZI9pusQFakAiPTzAQ2Ko
-    IjyLdYP4MWGe9PTUTLS4iae5jAmf80ka39iGg5yT/3xdCc7p/qS5QPijUcATg4Wo57t+PupCIajR
-    uHCWhZq0qymMYuYsRnQtAIZ0Wp0cqbNwYVIbbGtQFd1ZA2tkv4Gxg07NOYy6ALCAXGgwYNAwgDIQ
-    k8J/mcZKJCyqN7T0DCfFEmyaIhgSFsor5PRkUdOExisiojVYuOkCOkWaCwgyOiXazANtogE70AgG
-    tP0mAUf4wKh8t4N40nVS84TJJfQ5hUXGJK9R9GcfDdoGqRnUobnq2Z/YeIfAOvRpEQUaGZiww72s
-    Ij3MtAUuKEqFnbKiAY7pwcCC8K23sMKTrEDb2I6kWgC21C76s4GdTqGE/lztBmf7hEcKII0nCYsG
-    jv+hFjuQ4RpcuqZeJFwcMEdjVBFuwwbqahLlPFKW2LgwWTiIU4HmAJURlKBizxjArRgAlNr0BgV6
-    KF+JxDHWG5jhEQsYDgYc8jkd4MNipqNngyY0HhXVtb/luev63OJIRQ14r2d52hPoUFDDtmdAb3xw
-    fIhyOkYkqL1AwZ5hW7YG8wGFUQnSbCHf005VhKhuclEgbD3hhEv0AyHWcpkIzFKjtMllFP8zKY9W
-    dNpWrBZts3ytawflnvTg0pNjCcEq/baQWjYnRRhAxmtqmrhjHhW5Vn4cci+DDtAcgwZ2wcQIzKKT
-    CgHCQc8x8xrESpCvZk9Dd+kq3f6xBCHGN8SPSMj/BD8CUdcRZ5jGg/Ai9Rpi/xJ6E5qaiURlZjyj
-    bEFZc+VZbspnxmgCRCmjgtCBZmVmoJyxvf10in3WpBFSvQHTTAzncYyHvJ4tj2to01BXWEAVWdhG
-    WyfZSwvC1oyoCHhat6yfjCohCba0xNVwkdaJSLxjH6EUGAEMKWVdEcB7hkJI9yvLMKKEjsewq28a
-    xIzigpkve1WpHSGMBju6vC9tzIA1gW7C7C6sgzM/tETxncgk8XDFAiTxI/No1HtRCA2HaK4DrxvG
-    K6JJmIUcZpvx04h3CvyzQlO8ig2uwsVfCD65iokLBYKUHsULPQtfxT7m/Bgh/NHe+LG6e1+AxHFM
-    /55YN3QYCGkoOKs/iqKBzYZreNmLtaQIprLk7SS3nJYBNiCjsdSoAJuhDJQJSMBSFFB/OwfyLMoW
-    yh7jSLX8S8EP2LN0a8UvAa7RQGuKxA6E4BRe4YgGaiQI9y2VZsvIXa6+0l2ZY8zAS8lkCdE3NWrt
-    hvOHfVBznUQlvR+MrBvy1UivFjDWbxonJ+p9hkPI9wDHFwc4GJr3P/+avHpUvPSp8uJZSF+F44ye
-    C/RbJnnGNOozgBUgOH8E9E5OVZXX3POpJopVCr6mmV/PV5BuuUTN4iMMfdZ11lIRMh6QgKlzYNk1
-    KBFd9MeWEaCALJu51pI8uT8WYcu0cLGftgrII/9XfDLobpYpj1jeAVfZRQ5Geka6EU6AdfzNHMag
-    kwQ1SbgJU5VECXOlg7xUADp0EHWZhT4RQiPsXuGhmQ5khn2BDnJwTQWUREO001TgzgV9Ew343hak
-    08O8glzFGJ3kwysciH5AXOj5hPQsgRoBQvKYHg6q3k0smnV9kbF8ACPdSavMUq14nEZcWB0QTcst
-    RYMdCBsgyMrRip2t0UGUT32ggTmpHH8kghTdXs7lyIzVhYbIlLhMS4nMU7XgRd6Y3/bBxSgBBmX8
-    xYnMoV7MoR0+22oB0EP44EnQE+np0yeoHTd8Q+C0hghhiWdIUDWIGyMuF760w2EI0dwdQ+f4FZj/
-    icmuvNF1+Akf7ZFyHErCPYcmlM4FdOAaHMJdKMRvkGAX/EsHqkQqdJcXPBiaUMg5GYIZ6Yem3SAO
-    9iLNtMDNucSZ1JPvuVWOqMx13RMPAEVeLZHz3JOkxGD5wNwQ/EmvOFhVSZpUCMVWKIh+/BHyCSOI
-    jJYZHJ0lqACtGYCOTZ27DID4CNskpGEuUIYNEMaSzKFMqVay/ZYpcBYd6sUqSEGiJUFr5J9w+d08
-    jgOUCJMFSKLjECAvEWABLiJnUFAy3cZ3OODPWAfAceJ1mFHfXQytFJEx6hZFWEQYEE3F5Mk24RwF
-    fJOgKIoezIA2pSAZBMgd3VweEM0eDY0uGqMv/wbly6yEZxnEX02P8TTDohQlPfGA+KjPJfSe54UK
-    X2WjCFxTSuzBDxXWUDzF0xyCHoFjOCbaXSDDoCDSXciDOvqcr8Wht6TCkXhLImnItxCG1S3bSYRZ
-    1M3jXbGCzy3btOSIX2TRo0AK83DNJ6zLUjEHZKgDwVQClUiQO/Td44hbcjliuqGdKyXJYxIlUYqJ
-    fdyi7FgjP0yeQ9CGU7CJbtWAOr0TBViE47FiFzyMNySKSniEDBiOTX7lzUGlytxOFQZIFAolcWKK
-    U95JXjGBW9lTU84VMJ6BRmFEhyTaVnwUS7iAc2ZPb77KYQ2IYfmEHUBFfayAQz0WDC3U4kVL0P/l
-    jd5YxBnYhs+IRV9QC7OVIT/WhSrgAn1On1lyAI4tiSnYhZuRgkzhgl0GphIkHSck2odYwmFUgzTw
-    C98gCbophFm2XeME11FJ5JXs0uQojix1pqM92myZ0S06RSK0gSooBFY9xAe6Tl2MjgWg4G02xJqx
-    WqAMEWGFgUmkjgdKYxF1QQMQRopIH3eyQcYVp5IqD+rJBOlBY9gtAREIASTQinNOlBeFga2Ez4ip
-    kfZYZ2QVgYfABw5QSKTlR4Mo2AvkF1iiSRqB1YQYQXsUgYmKXPFlyBXtwrY8xLWQwtH5XAEMAefc
-    kFjgJ7T1hVmSwhuwRhwCgxg2g5EZKi0IAef/GIbVweigxg9agkgp5akccMAYMYoZMEc3UBPjzMv+
-    UUu6dEMljI45JBe5/RIjQqg3LE4HedmXtYuYhZ05aSKqUZh+bJ43YMCPMowDbMfDFIBXumnplIBF
-    dA+ouBW/oZBxYCPtKMSKAsDNYc982QoR1I8DDgKA+EGSLqm53swmtEfVuAcMOYj2LI3dVGMNlRx+
-    JYgO/oMEhEc/8cRW4Osi/IkLIIdiVWO9jYEWkgV8SFSEsRpFhSGM/EXmoMBFFOoptZSz+SlfoIj8
-    wRZeGJlOyYOg1qMqRN+tDYAmzAIysJ18xg8cbMYRCBmUqmsgfcLolOWWGAMsMSCphkZvBSAj/3aD
-    uckqUgVV0KJbNXQJayRbFoiEglSYUlRIDsCXBegGw7SJbyyE4a3VtNZZIQBI7dyXpkGEcmwAL2BF
-    FsYaRMwBB3THdexEvj6juS4pumKBzAYNIoBjvKGKCDSMsXJBEKREklYVo4WK03KkcBJsgnghmpGP
-    +Ezp3gKSF6gJ9AALHbmZaXENrD3A0b1ILrQUXZAWtQzmS4iWj62lGYKqkY7hgDaFsAlYbNSfzqwn
-    pCHlwwnYodQF7uJs2iXJY2gDkYSDzzJXRAbT3dmqm2zZvNgGq/6jmJQM5AUj8A1CSEbGj1aYY5Tq
-    WCGA4fEANd3b4gaRNLjJeU4f/qlCopRcqf/5RMDiRDRpHtzGbXHObc0M5EYij1RlT9FAlRmYGdH0
-    pk7ECsJ4YEBhQlzNbBGRJ5qQytCsHM1lzD9BmCN0CJl4WN9GzwTzFZ8iG0ay57S4WKJW6oqY48QO
-    UiGplkMkClvIVNHRGl+WCAIIakckbUe8Y6dMAqPJL6h8VBlUxjJQAztMx5GsBouegzhMkKyCEIfa
-    3QF20N6FhpMIsVMJjmSFjj+gby72yutkXgKfQWaURFJlbYmMjjRsU3fM23DgW8/wBukkCgl6JYN4
-    6xZYJYLxDPzWVRdIHBbMg1K8b/EUgq24IFYqzB+UwX6pL4P0Ki6+hPpOYxqM6UfOIqpJALz/fgeF
-    QIjHndweid6BMI9WceT6eoA3TghtzZj4ZSwkLedkHEkzAEH6xUVa+BXU1SPXWaoK0JiZjGwp8Ej+
-    IIAPRkdAFg+nzJbY6oRbwBI7NImwyADh5J0Sb8NQ3V2GlhsPd4SUJYkrUaIFPcEdDU2o2e+tjJVF
-    MAWD8IYFyGLW4gMOFQRXtC1v2Fcf+q1H1GZJoCA4+vGuDCz2DE0cje5s1bE/PwEk+W3YSVRqVtj+
-    qpGqMEUEtwqlqekg7BdSoJwlvq0AF5E/euYbo+eqpEHOYAJRJEEEyqvkjuvB7rGrsdT3oV4XYMiA
-    gq7TzUjmDmMPsB1s1YgYjlb0wR9lwAIv/1sSrcE0ZTxcruUnuIyhF4WqTDIPCOwS1IkDBSSVAkYD
-    OvRfUfnSv0Az3En1NPvpLskLXuJxIBnCrNigLkoFkkVD7OAKnhmOLC6FH0yTNGgr/45qx5hzTrgq
-    wqVFqUzpqRzEQG2hrZRaIZDRPxd2PTEn0GCEH1KYHxGs5GIhxN2OVOwm4w6FO7lpwL6BJUpSRYNl
-    R6UkNRoh6PDDX8kvGZRZmzF2HfzRM81aKzhJJukPB69fJiEjQ4fUHfcIyVpSPYYU1zzLJOTjjLyl
-    AfMYgFWPD+qEEvwAblYCNDwGOJhQLDXxAfrNufUSVs9Ll60CDzs1ZazLiQjaRDlFVRxWIP/gQ29A
-    4D9wF0wSx61cR5ugd1qTwRXVzm9cSPceykArxfOgRN8uoYP8L4gZtvB4ahPw4oEPmVEsHql83FFY
-    oR2wbS1CNB/xE4JsdqOQyTIt5UwPsGcxboNYch35ERB+imIhQSNoz7z1a3mOiobLZCeM1C0BqNRN
-    Kp6owL8N43QtGyzYJS/cRS2nWKtSFvzRyE6L6ReQcmzj4R3OYQXg1mpcQNJOhDI0sTEE4Ko+ZOIA
-    U5Pw7jO4SyxpAGw4NWD0IMtoYdRU4TaPk26GF09E2RC9AuskSKCURD6QdKF8IuVxACDcXH7LuTNl
-    IJWmXKG03PApgoAT+MsemnrQb8fxoN3/LjY9yVsf/K8hV+dSYjDL6IDviFpPhNZROlqrTFTdcCWE
-    UbAfUFIPUGfUXJigSxFnt5M/rJg+E5R9+FiZ97Wqp65l1U+NQEuz2FPr0mOI6MIaCvkrbGHIpqEB
-    vLQrlA0niZ/VqV+pallHUAM2PyidLGKUWLcjjhu4IyDQjkaR9MYT564Ms9AOgAt9I66/7kFl+FDT
-    io8JopBzvDHytEk4ZJUdrYkzDKtuzkZELEEJDCt7/R6FvW0OsKkX3sqaAsiIKToSMLp5yO8NC2Si
-    6SD7rPt13mTjIizsafosrkE74U7o+c6o40zBbHbCFJZKoHp0+McNtxqsU9RgZxEIXKFb//PRKZXt
-    9TQjFwGzynMN0UtWKdkCdHJqbMFsGv84avUp+Y2NazlXbspdDNNJERdJR+CsR8gd44wQdsPqIo6G
-    K5GDkwCgMSAtYHjHmU9gYEVF923lF5AiChUAmkuPKhrDNuU8IHwCnaU3t+arq/7GhEgyX686BH6k
-    Fzr2Ad+8xOMPWNtE3UqWoyfB5PeczXFnHujE00RNGADbruLM5ouK03gNx8uk1zig6bs8V3oBnj9j
-    JyCfdY4u26tFgKzJy/ue+OjXhhPwq4NWrvmMKbnoePqKczgGuvpM0nuR6jIwqphBGQGHYLzsMf44
-    1/AbdNdABiUEhBaX/tQS8joi4iDO1/8/CSVy9/9xv009SWQMA0J8trpzPjBuY2OF0yqATEMJq3f9
-    RhVDgHPpgUCIIOM1r6QEKDBMKJ5EYRivAYZMCIBFWVoGpAAEAB0KD2uRmBiPCWWi1dBJVs7Gg/pQ
-    VLFZ7Zbb9X7BVAAgXDZXHdb0+sFmX8tu64LOejyDCr1rGmTxPQAYABocFghxWBjo6IAkGCEdJUIU
-    EgBdFi5dFjU3WVRaGIlAGZAYb2z2NodYJBsnkypllXCGipgUF5tK/wCJGoD4bHybWBOLfT0ynRSH
-    0ggHociwYIPaJKgUGakcExaolKpwimwYsMauHQZfDgYCBHwAEgrgBw4QEE4A4McIEN7/8f0TIODA
-    wBkDA7wzqCEgwDEPe9zLh2/GAHkF7g0QYBEioQodqEy5M2RHLWZ8nlTQA6nYgwwFSBCoMUoCgwH0
-    TKDooEyPghglNMhbgSyGhhlWbuQAMYiERSg5WvWUKjVXKpPmuJ3RuhWLSK4V0H0Vm6Va2bGTEhkr
-    Us1FiqfJCCGAOZcuzAAFEubFu7fu3bow5cotgG/wgICDCQcMjHhw48CKHytGDFmxYQSWDWe+jE/z
-    AM+fQYcWPfrzZtKhYcC4nPo069SuPcOwOJu1xRdetZSF8qgXM2rVpOpOU0VFJWkN8mmMN0bhPngI
-    DhBIyByfwgANE854d/06ZBnY7Z7I/7ex4hgFAQq6Q/Ci47SQVf488bYLGZ4bTqw2sXAiQwArxY0Q
-    ASMMohsgGSo0MuGEB+rIxYLo+ktBhUYQvOsuDnJxQhYicskFvgwbWAuKsUj0AjetHiqRROEmOYs3
-    X4yDZSc1/GDFhX4CsIwyyv76yy8f7aqLsCDx+nEuv35M6Mgi6UoSsCUt5CvKvKYsssopqdwrSyWt
-    tJJKC6X7Usktv+xRSjHLRHKA4bgAQoVJjDNpkyocqWQJJKoxgs4j0HJCLnsOKICQBtC756560Nvo
-    BfRo+Ge7HSFT6LnxpMugIIqk2+cAGghJFAECCjiEDIi68uAOpSa4qj4g7ltkQ6ZKwP8ABUkmAOCl
-    l3a6ZIRYaUjkFJ8yKAGFVG64wtZ23BG0mRCNiAIZVqrQZAFY4FBRRVNPPCNFa79iERux0EoLPz0m
-    VGWKQmo86QXlEJlWgkL0KCsTkLZ1L1f8/kCKvRvNAQAbOtAwZ9pmoQBBCAeA6WMdPoSgYjhNBh2i
-    k4kptjEHGzoQwgVDlkGJjhArvi1iTRTRWBN3fsg2G91M6XARLJSgNc8lqr3mzXfP++eATQct1LDs
-    uosOhp05/dRRgy5ISAbpNqs0n6Avoycvga7zQCF8ZGrPXq92KYm+3li9OEBzcMLgQjWUeCaGu0Ad
-    +aQHfiphAF/jTSMmXGlSAW4NaDv/1YWwJ8bK717wsIbba0H6atvDtdKtZjS+ddgsyA0xGKpf3iMk
-    7XRRuoA9QkDfZFSw3B5j3xsjNv0hkQc1nY+RW3e949tEDmSI1QfdxYN3nYh4GYRTB1mZ0NdR3fjP
-    awAkeORtV512513HvSMpbnfdA3oM7MPbslCBBM/ftodzks3TCLE7ggIIBKNAHdWZIoSW+yeggfyB
-    dIyG1GPoQe4oErrTgQaTPtKlCB3uuVgIakEEObnLWWtRQQwgBKo95UEBFpBOUyLWG3fESllEiNF+
-    +jMyNz0gJrGRVk8Y4TEc7CQ+JYMT4w6nMq2FRQw0hGEcuKeFOlGOWjx8C0pMlau6/8mJDzkylWxc
-    04DsrW5dD/nTGJCBxH21zkBLhIhtlGcg4CHPNqAzUCiaRwgDGQ8iyrtRIEyXCdiR0XSW6B3oTDcS
-    3XUAeserIPRQF8bpHY91ceFUA/AUviTcqRo+3F6MyBeSoPHMagOhSHekVp1NxQMejiQIAhAmkEoK
-    4CFME8hmGNI+SpnuHfXjZBk7kgVbIPBiK2nCWhoYIBJWSjoc0BAU1BgsDGTPRovSQAlooI0YueOX
-    tiRJCB5wgQ1A8RK56AlIgNGsZQWRRhS4obX4cI4ZatOG1/SC47bwQskBx5DOCpwyaPEsq3GkA/0x
-    yno2YoOE3CBThJLOJd24ABIoM/99hCrAC8xWy0OE6QKCaEEPDPJP5JjgHYiQ2nTicg/QEXQDIrhA
-    MV9ghX+M4W7XidintCOTLAUiL/WMVjIJ8IIFJEtJ69LLepSYpYccyYhW8oESbSoIDxghBi8oBfkE
-    ySLwhc8bMnsXA843A596aiIJwdokP1WQyWjSiwMx1Cl/FsrxdKd99hgIKQGyUTi2R5X4YaVZ0wXL
-    VtYqoHz7Gy4bEBMNCCpXvdhgrGypCCzIla6bcIQFJTiUTsjnXHdIVTN/Y01vloiaNdRaFha32C7I
-    jAstmmAPx1mcU4gLE/MChmABoQB/oFGMpyTEBq5nADrgRQH5GJRhbnSPF+CDEDD/YU72SLAo2/Ay
-    rjJ5gT5sq0TzaGSMJ/BAmNiTNYR2aoyfGmNrCcCA5MzWB034RxPVwxxBidUCBbDETjRiRCXKxDP+
-    6AENDOOPBWzUM596QQEscpm4Cmq2FvljD2x3A3cMIZBBZVG1gjohEVGrttchWs8c+TTtAIRRPiDB
-    JPfDD47W7zr0QIhlMvA0TVbEIKazcHXYSKpS4WFCrsKlB5PCE7sBpW1vtUbcpJMNT0yhbGbrQC+q
-    AGOYYgIIcMtJCnqjrlJMoC1A6Jg2JqhYyXIlo/YaIFmrEFnJWvaGujnGLYaizrbcSxg5+kY2bHKA
-    GhwCIdt5b/rC2x9e2mo7VRtB/z9R2w/7Wih18HCBRpCjndaNNnTISZ+El6lEThJqjA7Ai0/dawG5
-    TIcP8rspTD6XPu4mBGFqzFFPY/ralF7XAz0Va6ZHcJnmcmcw2g3MGEXiE06lw7+tDl9SSGynQEwE
-    fS9wQKL2U53tjIGY/KiOQYj2pYJoxwcgzdH9IOQoGhDEtNtxB6dmaK/c1WkcxhFwh/ir6mDdxXoM
-    tJVRNsCgFtKBmLGahofgpsxdwkgCu9plClSFkhA0ExB3yMLjKvsMbXWTK1KO9ja74k1xVrkay7DP
-    NHsDTZJ52SuCroEl6mGBfiYELDoSwE7EaBlF3eW4AxDBPqgD2z2j2r0kkAtEUP8bCAMlDVQrXTA8
-    LOqvQkA0AZ8CnWLEnLynoRYmDgAdJ/OBlxb/IQZy2ch575y+Q69LAOOl0kOuExsxcgbShgFM1kSS
-    AJSNob+u9jpw1gpaNW4EOjAdRIEmRZH79cAw8ONMpBTD9n9ggLbLueT85BIoJ1bk2P8+RytgMR9X
-    NesY1HOCgICJFJPAMm56t0J8MFbjDWQ5B1TQ5bo9YQR3hztV9BFGCJCh8CVvQcplwI2IHftv1Acc
-    hlRuvbyaYDDQYqI3bmtLjloQEiWKWQcNkO0CDBCAIHjOHRyhh6bl61oSwnkzBSWuFN9r3hj8czCk
-    7YH0KdzenJ/StcddDwwURYX/fPgZju2wxPUbfXQLjpc5/XSBR+WS0uLDAFQMODR1pFu0f/bDeYYZ
-    1HV3LNR+gBu2zi2+7gALrpVU4HUKYVJ05B8MY1OcSjoWxQIe8KL0gquUrT84wzI8CqG4imngzzO6
-    w7cKCMrEwAYCSfBcBdY8rxW+7SX8Ja30RK5kYgIEaxF8rpSC5fGaoV9iZZl0D/CKYpcCJN424Qi1
-    TGWWrPS2wt9UL5XOIaNg6AqGg026BQ6swcow4cRgxFwkxkbEC41QpneMSACRQ1DSawZS7noWDLcQ
-    oAKSBqLuqiKW4byYJi54i6SCZT2uwxC6SyNMp232Iy+WyM/kcA4HoBdOLmKE/66eOG0fsqeCNgB4
-    NuLZZCUuaIkGWit9bmsQOCi+9GLOpoZ0OmC/BoWorIDVhGMVg2ocWEJ5oIPsCKIgJIoDZ3EGzusy
-    6qcH4I5K6q7YIAO+euDDfm0NDyK9zIusUO8HyoIFOaSZiGBvGGoGYQ1jGg8FcLAOsDEICyDFFgFg
-    4kYfRgYGebCicNBluuaHjoh2SAQE9s1aREz1uMk9ssmbHMFFaEQ4uMZgTAIkdEAP6sMX3Mx6ducQ
-    Xkc/bsPnoqd1Poe0Xgd3ngcQEKaLTkdXoiciM1J6EEEKmMgSsKgXXEc/mMh2QoSZrG8QQmcM1CiV
-    kKdWxupzikAiRYWJwAKgMv8qqC5LN4Zqe5SwGQ4hUTao/WirzIRtBnwgu5Rj0QIivmjrLi6jUWjr
-    +mYAJ4wtR0QpWYKOnVSPZYIsyFhhESLMxgIEFVgAsDIFTrhRD+ZOVvxGQ/TmbhYkWlghbu7CZijP
-    ZZBAsz4CJfRqK1yv3/jtC6IQBQfopArrmmQEXLbwv6CJ8JogV4yAs8CSuJ4lCiCyz2qHI1EndAwB
-    Is+oEwxSCEoSNIFIHhzyIe7Q9mKHZDSkVRgwYu5IEyoIGJwnNG1vdziBE8zloLzhNiakeayvoMZA
-    J7nBWwCs1eYjRBym7M4LfnzxIODBqZKmSNLuT4pO0ewrMqAS/i7qfRRCBi7/oNjSy6n+gb6ikGU4
-    i2IqQC71zjhg7QHyQW7whAUPwQYx5JUMpggrQvcwYQQ0IEcYZHzSIhwTQRLCAT7CUnDOIDCfcDC7
-    oDANU8TccbEWs1vSwKgmobAYIFXk5Ma8kEOeRSMExYt4jSNKEo4gxnoQhnZcNGROwmSUJ3dgtBCa
-    ZSHVaHaoB3bC8E52KhVoU1pUsEU7wY2EFC41hndWoRM65jffr+86VJB2kifHCQfthGXAsQIMTSbK
-    TAaMosKeg5+6o826g9fiwakyA76a8jkZAiCMQjsQggCGTTzbB9q6sic2xyzBkhn+YEDKK1AYxJXO
-    UpmCApGOQbr6AwOgoWso/6BsNkJyMHOl8GofSQE/YqYRAgkLXrALmDAd8G3fnIwwJXT1Cogup6FT
-    uQXdyAIB4QAzdyDFKDIIEkgUlEfyDILFglBBcnVXN9FsqIR+wiRXlaak5hBNKqWkArRYlRVLyMRC
-    nJUvgORKtARLtARaJ6NHKsxaHYMuHqMxhEQymiSl5qVDuy5ysCAfc8NxGoFWDrUYaus5dCReHxAy
-    MMMDfXWq1lQxEuJSkhI0VqPYfPHtBPbtUFQKxWEtA4QWCrSzcOBBNuAm6EpEx+uXFHVzlrM9o+MC
-    sucHv0Eu6QpwaCyCBAFBk8IGTqwVkKBa1ElT3yNx0rVF5AAezcBcwWBUIf+0drBFslS1J72OG1Rg
-    L2E19p5CKUABN3ntIQo2aWWDNkJjNWKjNchT1ErjNCrDNDRjYB8wa6u2M6xWaofkMOj1NDKjM8aW
-    akVtM842bAcWUuYVa+XHIupTqHTIQfdRLT2oGr6y0XbmVhfiVk1gaXQJWPt22Oinb4FtTvtWQRJ3
-    adjwokJqOQiILK6sPoPWNzoUWCYV4eIKWCUIFgpPLsPtblcAhGRlB35yV95BG4sDT3/Wc18JB1O2
-    VEIm35KgFXHIcMLAZjk1NG9jsXYhnBAQOKjlKj4gndCp8zbGjToiIA1udmLyAzY0ZVKRd8RyYt6F
-    R0OEYzwmRBoBnYSBEwz/b3egoEY9xlWKYBdsYHZU8MskRBl6IROSdGKKIAeN4Ee3jApgSVqMlEhf
-    VW7vjW6f8SrYlYh2dDaYFmmPNr4QmCMUuL2W9kQ/40RlQ2qX1oGj1ikh5aYeixpmlVwQKIFW6QoS
-    JBNJZpaAaQbhJDJ58NiYYS997IRVUAl9DC/E7D+eMUYeYZXICTFnJHyZ0DjBYIfKQHe34FwcsrFQ
-    9SvC8VODl1rqxkPFRa2UgZX+4I4GhRT6xV+K4xJUwWFqUyRGZxpUUBD8RY1yLyycTBDUKFcSJ4rI
-    oFNHZApBhhA+UyPJwByYl09DL0SSgk765VQQoQJMkifugxsGoQ0adgZj/xd/r5R36Hg2/8aD/fdc
-    AZhAw9GF+KTEnGkioxB19KA9UMKKUWmUAWmsJJRJ+8gwDQGTx8cFnWE4cEIfzEFdekcu/WMqPtds
-    OCB3VPAK7iawAq9h92k6JHl4ieUah3TgONVlv0BDadYLeswMJFQMtOBcTPIj3iOJVxULKWd12eRC
-    0bVKXc9uF6EsaQETIJNZKMF4k1RV0BcS5jdP6VaVOuDInuVux0EbNgueG+QU/stxcgBfrFliBuVQ
-    21UbAroquHGJ6eNj6uNyruygqwKh19NABZJPy5VunTmYcyBmEKmVp6JYXDQtUsd12FhXVkBHywiN
-    7HhUsWiGkGdUbMhfVv9CZqlNXKK0PUvgB7rHTsyhCHGlnyOBBI6CGPpF3TgvjqmgbHSCylJYoVGo
-    2pSaWyZn9FJvg6UQZ2dE4bQZfLagG9LmssAnOXfYZjrYg51UncFRZrSBHQ1vVVK2qkNmCenNNekN
-    GQaMRepzPQcaRu95CacpDP1yTy2GlsEysAdLB1+kcKj0f1+tC30y8DaUjpihY444EFRpJHXlRTlZ
-    DGLaZkE7yigBC+uzaG9pB+VGQpQAKzSxIiToXlIhDUoJBSYGpGQwHbCgKACI1X4DM9EZecv5mUsk
-    h6z6yVBwdeiyeboidGZWuI1KrCmHrDHLrLWhv2Y1nRl7ArpGIBHbE4b/bJLvxSOAiHzpumKIJcCI
-    KPc4m8vINwwPu7zDUrCl8aHh2xZ2AH3LtRK+WpAaSGZad3uSm7WFs3fpeVGxZaVrr+H+4JRBeZpF
-    ezfYhFaY4Jhe+N1ggY5JcK5GAAXwWr9/QkA1QQ63jQNUe6/AbU0u1Gbu2cgOSLhXZHz0prjpkZpH
-    No4GhZnv8XZjVqjWYESusA2Ok0pvOq/fQgeOEAccIZ83gZ9FASxdEciv0BoY9F52QhTqAFtaCKEJ
-    e77huVi8ZcIrW0dJxsqb/K91gVZtYWGbKX3L20Chgk/nGtsslXtSAcrr9stX4kDdBBWeGJxGokZ7
-    uLA+S8xXoSUC7iFN/9kgrQfgZNqGxgcLZeYYalDdkCJlPUK3JehUK7sCPsVsDMovx0sGdIJBAAZB
-    dGlWWpeH7nlgEohcPhUMDnqsv8nF51lUow2buWAKxDtxQrVNmhgLL/Trbgb2jteb3XpBJVmTG0sL
-    0GG6o1TwejlAhvcTYgHW9HhZPAiL/SqjI7WYof1n02YJrBRWwzxh08XIXRBETMyVfeEWDjW5SSaw
-    8TvwhiKZD9BJ172V6gao0KK+F5RwRETM2Ve1cYOaGND6XNS4I2uDuQBPgEBwhkPdOFyxeWDDlSlU
-    /FMR7ipCnuXL0MMEPG6V80U+qzGfGWG01YHdlpNP4dMMaNkJvHqylP85yHH3QUll9SBL11v2DDYa
-    iHlbnP3LqNKayO22rnH4Rdoiib8HcnAhuIXDWSScgMd8bOD66fVzBX0lo8HOYyT8lZRQfv0xcFIW
-    Kj6kvddx2o83eA0OPvWz51e+vQHBXUQeJWSdLpd7M3H+qmmo0UsPHoUX2E0YVw4PTj4lRzACxDXB
-    UTdAne4TKASl80YeJzYlJJxJfNRhVZB3yaO5DHrDDqJ71mv+8xXn1l2emSeL5rX+v/RA9Fkx6GH8
-    rPi4vzSrQYTs6Of+fldVS5UaZE32CGThoscl3Mk9cNyEcKKitEuMJ6TdtANS3B89hbke9oL77ZvJ
-    lbzbr3rid7NBoun/u0MoF1aJ3tWOwU3ohqjcmfvVfVxkVR3r3mVPpKXB2Ao+W9oME+hhN8bFQCFs
-    i2jbDQICKSWIAJre+kkiEIPCMByzAOA6OslidsMnFA/XMIrD70lZ0jASLtimtEgQH8ym8/kASp08
-    B/RZVVyz1+4VAA6Hvc9GpkFuVtcutvvdU8Pn9LWSl1AoFrAS0bGHpMdH1FciB8jHJ6Rnlda0kxjT
-    hCIVY2mJk5NEIpQEeMl5h7fXx0FJEpMDpPDnkleJxuDA1zpaladH9HJ5ZIJixKgXujlo6qSYrFyr
-    14pnGLOQFUmnBfVCnevsRuUCdLTMbOorBa7k+jxJBsBkBuY09sD+/whl7eOaygDJgCAQMhClD7MB
-    BAoaLACgkqEGBQxOeKBAUwmCBWsA8BHMTEMQGCRS81GKD4odnTwtaEQvpcqVLJuIEfNgCRR2gJpo
-    yPCIWp2dcZjw/Fknj6FI+U6e47FgQ7dX527xSEnUiL52QYRoWvXtxMkerPAA+YSuikhVU5lkxTrE
-    TSo0CfHQybUroy8hVXO0KslBWhEkTpr69avLlVwNnwDphGPtyVE8Srax6fZDU5K/QgdfRRLWKxI0
-    KTm7HON5ZRYgfzzPogWgwIGHI3khoUjAQg1blRmouBA74SSlACwYBIhx0kYQNjBt7eFCV/LEN9Ao
-    bwk9evSX1B84mv9p3eYZeodxOeWZGKh4OJEx89oUVqpnoFB7BLNZNdNVHKyI5Iv0A3MbN+OEOFFF
-    32JFcDbAADSxkRkbC5FDXwNbnQeOZjksFVR6ZBH2R4JqbTEeFbBg0l0WIq0iETDdKQFNaC2BpiI9
-    o9nlTXPWAULQBQDp4NUGHwRQYAEDsLEHQwYdYMN8DSCwWkEIxbSXBjUW1JFHWbhlh0033PCHdFpu
-    mQZ1L1nHnEsz2mRGixx6t0eatoCHyHg7aXNXSTqMqEE2xlTSZjXtgaLODSItI1+JIwWyyliEnXRS
-    YCgCOKFZjObFTCn6wISmXnOQMA4wGSn0RzCapqkKJG6KFQoMtWj/uCEUbkJS2TKOufGCqdAgoUhm
-    kvKl5Ts34CSaYb/4cEIPA/jTEQrPoDEDlAD5xBgfKjgEEAfbzZCkCEx0GoNqvzVH32R5fJdHGRA1
-    xmW55jLhJUwQfQGmEx2kZEUzJjRXQiPXzViTqj3hCweFamES34INEPWVgEGdeW8V//0iq6KKnpOU
-    kWgxSI4UiUJ4RFyPVvwVCpkJVW81g1zSjFRxYmvXolnhOOoanbQWCMtvgMEFs0/ZfG+e7kXalL2M
-    uZzmX828mtyfiVrxjq5XouGgPF1sp5JaekByQgn9xBaTa7V4MMBGBSBoyLAHucu0GQ49xIReMaQW
-    Qg03DAogGEwv/5UYDop8Q9Uh5+79CDvpYjcP3+3kRVSbCPsLpM4u10UiVjgQTNiq9SiMSGLxpbzT
-    WhIzLrEnzgxWGF5GqjLZGxAW5l0PtnwVXA67bCMVyo+3vDh6SJlg6WPy1MyvqDc/cRjIDgaPTlgG
-    2/FdEX0EhnTgg2siNxRKRY3g1JTQpU8B/+xCsgMNdf2PgvM+oD0IAizLROFItm0tjA4QaNAFtses
-    EUIq4kIm9uV0YKLg/v9frrIJYl9rOFz69IQzpjSGcxvbwGTk1Bj2TO53+FrY41yxC6fkB0BnycFc
-    vsG4kdyOLCx7Gefo4zHkvWh4OrkDOgSCkQ28TmN14krjUigep/9IhWWXsI8baEZACqYlZwe0QzCM
-    wpTxoMoOhGpAWHyij7JB7wplMpMXPma5X6yiN27LkeueVaDc+OUSz2rbkoqogN6cbR4su5L2zOg+
-    +iGpfRT6T+fIAcA89oqC55KiDrSRBi24rB1vG+JjBLkzZdTlhBwYBp0+Zbzu+EQLlPwDJWe0A0cx
-    Cj+uws/I7rg5qxQKUwk4QpqU10EPmiROpGgVIWClCMhtgk4OIoWhZsnA3IFtGsbYRpqSEQoN+aRd
-    OLskSYbpO1x4qpM/MdUSefEnVEWkOfPYgPPcBZXshCgBlKAl+QQAgETFLAm3KVAIIDI0IMhDNsRZ
-    yjcrIgKB4MH/HQQ4gD/sN6hg9IZIvDKcJgF2E03ocaB6rANtqBAJeCitO1LswEfmkClGzsdTqvQF
-    0er4k8qFkGCWeKUyG9g5bpVIIhrU3BE8RxR8BEEHPqtdCjW3v5cycH+mnMMoyrPSDNlnQTjsl764
-    gbNkpqNqQThOHWJnU9YtERBlutKu3hWdx5yGiV+hZUPYwYhcvBMgFPjnpJLFEQMBICz7NAgGkmGl
-    8hVkAAASKUH42U8vcAZRC8gftwiKV/+FyKdB9UJ3IkKfj+w1YqAE5aP+CFSISE6xfLKbynyBuqKB
-    tLDzCcMG3mDSbmkIsO7DLMNadwJPFGJjqexsNXrhvjvELJh0/0AY7wpYxI8ayahJFYI0M4YczHI2
-    NAGVjk6uBTbzaI4CJ6CGB/7xAAPRhwlPUlIGdJlcKK0GIJwIUwBWc4GEnOJKbLMIS2xRtzN0wIp5
-    LW9L9vqGvjSjG4mJky6ccQsXNuM7swrU5jwFsBDprJhD4yYq6Ee4JkL2dQIm6nxEihZGspQ2sBid
-    nbJRMIiSDMArZcTtKDYfmZlOZWQ5TIF7mt6fDrKvjJUtx3RJHkMYBU6DMOVddJuUuFZRS2xwDjrk
-    JCF3FNcFyZWARRoqhNRUy22m3acEDoABxvr3BjMIgY/kQk0EwFNpLqIcIWds3ixDB5FuCoQ4ETMW
-    E/XsI5GqXv9ISnZLyeSBRJ8qhX6Bp7CLJELFJCwtME6oKZpqpT+ji6WkWhExiwHTwen4oyWVE6Jl
-    bkpeFgbFKAmrFBKhd5yJYq2JRdvanLwjX+g9nTiMGh5YjQxgtDLP8WpjJC8Yxqn04FSTYISxwFqh
-    AhXILqSBIY96VmCtUTAu2yrCIz/hwSUVkMCPdquUJ2XXqWa6X77IxGotSxtetHvZit/Qn9b0zJL1
-    IU98AazmvQxKpwk6k9Ncc1JRbu5yBu4zoCcrDHIbJrP2lbWjW2M6z1IMh92794NUgdUglfhftm0S
-    iD8c2cR2iSaIk62hGYMPxa3wMiSDQR4UJLDGQdUJ9yjbI87/M8S14CjWOwaj9hCiBaY5I7oTqBH6
-    hi3lEIBgAEzTSxpvQOsKVJMwHPBNy502tzJwhrxOkwfRp4302LpJKrS1A+eaXjsHLXVxIAXLSonG
-    V3eyI9bwDuW6AybLzWHdPV2/zCeYjp/kIaiB2u63p/5QFTAkIdB0CDQNDy4XECu8S9mRuMHR++x8
-    37vsrhMfxafHoR/IKA0O6Hd+YI3f4rKcIgAp5ZXwoMaWByDYzOJmQ2ROAPFGoq5oYKcNvFFR20DL
-    EdPjLQ6SDnstAd6gUiAKLsheMFRtUEMYxM8iUUg/DWcaC09hR5DoEtEbkvosNAUYDHZQX1J/K3XJ
-    AehJ62xo/y/TZr5N8c5oSY1LTHsq7DWvIZwyNGFTCN81FmPe3slgZX6pxZm3T04QFQjfu2HiKr0e
-    2mo7GmNkMAzbBX8qtkAWBiE0pQWqgQHf4wLjFQmwIQIAgD74ISRTJlov4CTwNAAHCHAfgDVkE3RD
-    R4CxZ4IzEQYGooIUqIIr6DdfYhbLsSbXsXLo8g4D4wg68RIuqCuAkDpyR0LbJXctFSb14DP2kg8T
-    1kQrpYT+NwzR8Ekp8y3sdzGN4YSN4DO3cAPg1USJQlgsZR/+twviYyytpDookm0BYx9QiBTCEFGW
-    IEvNFwdVUBZoFjI/A1skRj0ymIcch4f38WBOOH5K4HyBcf+FaUCCG9cF8zYrmzBUpeZAx2UD2vMj
-    pbRdapVkT7MCHEEvUUBNwxElHqQKYqMk2uFxc1MmvHJ0J1heAIAAr1hs5SMb7LN5tUgBAZBzFKCL
-    BfCKCMCLvlggXfOKAwCLtxgbmxcCuIiLDVGLEuCMyrh5xRaNu7aMCECMwXiNFBAbFIAAqRGM3ciC
-    BWKN4niN10SBFAiO6aJK5wgAVfAOk8KOYVAebMGOBYJV1QFfF/EH9shc4WiNcgYIGfALB+gOKdiC
-    YeAwrIOHBNcg88OGcjJ6hxVH8bFIc3h/plAY3xFqfFRlENeHQtWGGIILDHYORaEZHbUfQvMIQMZ4
-    E+cJj+j/hdHwTTYgAAdQiaHSABIYAGQgZQdBc9ulAT3ZTliFA5k3XSJ4Bv1UNjixiqyoRxToG/7g
-    DwVhT/YklVMpc1gplVYJelASG17ZleazlQdAlldpliBQlly5GmSZlmzJlV/pEKA3lWcTjSBYk2XJ
-    PjK3eV+5l7T2jDtSi1DCjbuoi3wJmNF4NgfhIwiwl3p5i3XpY80IgoLZNX9Ja72oi41plsnoI83g
-    QOKEQSpFkaFgQ8PDJ35QmhKhFyR3BBYZeK82cvNFh8nUEnVwBYY0IMWQOTBEiGqGKmQwXkfwCCkZ
-    U6vJdKXJBMz4LO2ogR3wawZxTS4BgjYQBQLFRduCYGYw/yxSeUapGFCeET0l6JRa9lbsYz71VJaJ
-    6ZWJKZVmFZfmOZlwWRFX6WNduZlieZVceZXuuZ6xcZ/umZ81uZlzaU+b2DZ5iZ/7uZ4HGj9hOZZ3
-    SZ9iWZUFmp8TypbtKZ9fOaBZuYnmY5Vv2YHQlAwZ4mbPMBaPJEsP4oWVtkqkA1oSMSUFVDLxgRGn
-    cjOccUy16YMbYg2yYKNz1gyZUyqW8Sm8lApdAGSryIgx5UmmEhW2gQGUR4GYVBUU4WME4AVCKQId
-    dCX9gBuZODgmwEXEgj5L01RxtXhNOZ4ARC0COpduSpcrEJ/zOZWAGT9wuZd4mpXYhaeByU7/OaAO
-    IZlQEv+VF+Bz/Lmh8ymW7jmncemfypihcSqodLqZPlef7Rmg/qCfGDqplKqgYDmgfLpgq4UtA4Qm
-    AziRhHEYgxFyDvSi9mY6FaWbrkENUXQu1RBRCfcTeFFakEUSs4JEaxBFVbSKDaZxnaV9r7MAwxJG
-    5xMFJLoHFLiNuHgjoQEGPnc+SpAX8nAbFUGdZkpPYyN04vUFirimWbZPAmqV5rOX7SqZk4kbdWqn
-    hDqog5qM9SmogwpP7TmLimpWy+iMjBk/eUqoZ3OgZ8mv9Mqf+7qffvqvcxqYnFqnx6iZGGqWVemm
-    c+mM7Pmp6nmxAoqlI/krF2aaptNvJdF0rBqRqgqbHNT/aYzCMs05csFZLnUHs7rKEyQHUiJEb0QT
-    nOZ6BaLzC3dYaEgUEdojredTeN6RGkpiIFGgN00wHLnBA/MyMPpwNb7BViLYNbvmNtLDFqHBTfeo
-    puf6PxYwoVtZAxsLqZBKsclonxRri8foEI9Zp58HjTm3sXR7nisQryDYl7yIi4zJqXJKt/Dqt5T6
-    lzvCl3SKn4frjNK4uJrJsIY6rY7LrrOYsWG5sAiajBmqueq6GgfSYGU4iN1HKjhUFHdRqh0VhR4j
-    csx3InZIOmvYaLZqLjarhqQwdqbDqu52mnSRGcOKVfQQffVSPCo2COQTesOCAdq2Br9WJNWpIuWT
-    XaXh/1Dr5GRdVRYu0TVs4yNl4DcCFW1mO23pqq5nebheubjneQHE4peCSbH5CrgBW2y+GJjwNAGM
-    u6ig56fTyLj+uyMbAa/7qbEKC7kN+rjv6ovSSK/42qFyOq8BfKn966AcW7DH6L+UWpUiYBile3al
-    UnuH5hiAsmC58EALtimxYBdLmHbilk8ifAn5U0M0GH/UBiSuQjtoOFkkZASe2CJV8J0q8WlDA0sd
-    lT3N6zYMVnxCZi3PAw/TSTVLw7zEQWXPQxA9Ep1WQqynULzmi671BKF4Ob98uWtQAqFiLLHqeaVS
-    yb/sa4sOXKka6p+SSrfa2Ldw/K90PIvrqrB7265oHP+oBTu4kvuMHauxk+mul8qgiyqfGyqvBAxP
-    yCihbBl6yQHCo6U/o2Qfx4NKQxCaw0Yq7fZHhFKGH2UeX8ilVFEnWaKHe4I8f1FtkkJZq9CSjUdN
-    aroNN/UxJxRdFFgDxaMFFOgjziVSTgCK1TQ46HJdxszF++hkW9wOSUms5QvG5sU2afmpFmuwmqrB
-    mBqoBvygFtynhvuW7OqhfEuwHoqVD9uofvulyOjGfIunfbupc9mheWqvfJzHHuu+AYqxhquhm5vI
-    bPyemnq9tsB0tqtuszSGKTaQwrSyc2Fhplw6j6jQk0UJv+LKJXZetJOzyFbL3XsmWIbDVEIepcWs
-    WUz/NAmgAgjRTlDMXHVbdEyTAc9pEc6DBmPrxN8qLk/FGTddttfsP00rwIO5i8uYmfU0uORoj9/Y
-    i8FImPgLoPBrjGbcXf2Kn+sqlw16sPj8z3KJqfT7uBmqqWk7xmoLoVq51hhLxvp7oB+6mekpp2L9
-    oXjZzop6qPeJAA+gogzD0EQFdafKdNfGBX9kGa1pcIiSfwOZmvpTFpWAWDbMkTkB0kGxCIYFMLc8
-    TSwxkjgrInx2cvZoIuvVEMUcelfWBDo5D+IV1GDp00vj0sYY21w8NxFxxUQ9bV3LjwqVLuj4I5Tz
-    jmzRBKPgNNE7IyxIHU4dTgrw1D4CBuVIjJgZjd04/wMBYN3ciI0NvIvDOAPS6CNiFd1dO7i9CIub
-    N47pjb/5u41Jnc62qNTQGMey0Y2Mid3D6N3T3cCB3Lfv+q5X7cjPCxYL7WiPoxwSVg7th4Z0trNC
-    120gx21VE6xVeyZF+ATxkECXDWaJrZrztV4/zRIY3nkCoXs8nBrADE7iZQnUAtNYCg+rHT+xLdQ9
-    zWsXrhHnWaa2nYoBKc26DcbOk3WUkBmKw2cgVkqPYlnWJGfy2HhMgRLcGtTqAn/cMKXUdxQuYRti
-    EIxjhUEOcI7i/SUG6dryyK1t0eEy8Rla3oJP/ZM5CY7EyItPW3gg9wm8ijlHBbOesyihNTrd60cD
-    zv/RXKd3jTcLdbQOVKbhBsVnnTPhSgBtQ53miuFvU7cHyVUD2+nap/BGML2TXfB53vU8flMjuIg2
-    2MRyZHlG4tvFPJDbPu7qe7WI6XUga5B3eEd4pjp8cLYvQRtiA3cpCvkTxqpKdQ5pgbXnx4pvb9FD
-    DyjhS/COdrfYDH11oYw8tKQVE905XyGCotg6hsaqGalwN/wFiJ7ol8Lhh4J2Cod4KyHiTGKSu3kk
-    lz4BmW5NHxDeAPHFUhtWqq6dZpXqF65WT4ykT+UFre7q5/pmE0TlYDIagnYiIARMgSJ8vf5TLekU
-    akB/c3Yc1tYptWKioMZTSJBnkDVoqvQNR2NLgGL/EkkxJw5PDbUwaEjw8eEA2kLhCVU1FK+LQlPw
-    POgeCRWn8sMTrE0BGRb+4rruMuUuWTCbQhuEm0QkHX6jGMaAOr3LY8z4Pcd6E7KBAezAKOiyArVt
-    0xSYJF8LPNE1lbUNHe1eLmzf9gY/nLuedAkfSAeuO+lzhS0WdHm0kLTu2LTwFVwxQFrTuqgjPKKo
-    D7Mg0hKPPbVEhhdCDlshOrOqMYsEFldI4hIWOdNnebIQ2FQsV9EQFkoB2CQL7FJBN9LRh4meTsDH
-    Y4iAV7w7e2zARTwSLfzXXSKgHBzmvLh4TWUDViGg0+9SPkfJJW6/Jcif/HB/y1AvbXQvgAgkfwoC
-    /7R69esFB/gOOfhSgDLjZqJa5IiTPzpzYSvwhpqoJ+Frwn7XXv76AQeBhmLTpAGBve5dQBpu8CiW
-    clgz2igQ8J6jSl6c9VPUYS8UR9JTGKZRG6ajQG+TZ/qikqTUHYAQAsBjNWw8CkcfMBcqPgABwqAQ
-    zQAawWngQMVci0+BjxCslZ0Asll9Tq/N6LY75KbXXSL17mPTWYR1uqK7kQQUhoUFnIWVBQWFBcNG
-    xxQWhRxIlEGHhEdDFYaXBkxDUkqWz0hH1c5S05VDS1bSxpAEyNdDyaWQk8/VX1ZESyYhlUvXJhoU
-    lsQcHAWV4k8c22VG51GMVUCJOxg9cI9q6wZvm/9nbjq9XxGAAoEwMpbSp6gkABELtKkx94GMFU8C
-    vAOyR8KQAQQUEiiQzqGbOA+rOHQh0eIMPxJIfePQsRuvCSQyJru4IVmMjxUODqGU69bBP8ZcOJI0
-    IaSDR5g+VaCJSJJPS4WG+CSKgujPRUTmHbpQhAEHlA+s5cIR1YQrIYdmScoJSyUfoaei/TE5RNpY
-    K0mlnhCWlGTMVpBqoKkSUVsGcXxepKzl0xSDJRj8/glil8ZbGVVJ+DUa+F2YAgCA/kpYICHDkCdQ
-    wAkAuY0pJ1Om/GgzxB28MCVVl4GzWkJr17E3FN4Q6YI5DeEMyjYpNerNLkVYerpiJZrMJZx273r/
-    1lITtU3UGNAWnojVUEe8kLHcgFsqs2FzUlYzq1QUthSHAoOltMCD2bIrpAG88l2USsQXtOKaS/cC
-    bDPEg2ovCQh5Rri1NsGAnCb8cyO/DBQTYZxXEnFggM4Uwgc6XjqzTEP3cApIigwPaEgjchIK4542
-    jMNQIQFO5E02AFWrcUYcNTjlKb1k0G03HI9rYL0CvyrmLHKKWcatXXAi8DnnwgEAlAHQKAI9Vxpp
-    UjPzWEgMh+BgaXI3D27p8hUXbjnktxuidICSw44z7i2lQkxAvtqQ4XGGGm+kQUDvdOBEmt8YBEQ4
-    CL+ZkMsKLVCRih3eQaIhC28B4LLHuMgqmksX/2KoSvqMgDGAf3J0zU+LUDWVNVBlcCGBPFH4b4CE
-    Djjgh1Jv0iPVNYqrklYMqEnGC/vEskIKBBAREYAmc9BmBBIJGKgABCyTwjJmKUjhUiuEqHSZB6rk
-    ltZLaUWgShXIZYosjXwiq71HYnG2SArcQlRP98hrYZhgx8lEQWJ1tGLgseqaZ5o34ctAq1L6a9HB
-    MgBl8wZHnLkTwUIp6XbfjGpAMGJxxLFlFFgUACM1kfTx8J8gwrulsh5MTIOUKzyNDGIh0IBCgAOA
-    MGzVDCpa4zdXCQzQ6JIu3ZlnhhCIqIAAOuMZHqkDOJcODG3VemuZfTSSmwEQkDoMUnN9FRMnxv9G
-    LQpqyDuTk0UGQG3OM2jYpQMEuNZ771ttjbHCZQDQGjXCC+8bHqcx0dKBURCtEBLIld3EBQY/IaKF
-    TcyMZImniKAvUZiceC0/PJvqVoNcOgYaZLi3WkR1HRHZs4vQ09mBk19weLSAEiRQkbTb2pRgiio1
-    BOiCy8IA9fT/RpP25vxwzlHAGqj3GukZrL9IbtQOhydXCQo3nPAA3kCAZ74HB18vIOuAx3vUSp3J
-    kB7ERw2BMnXyHJRNGOAenjmtzwaa6IAW0nfArSHgFSsowODGBz/yKa4D/nIcKlpxB8pVTimYc9sn
-    EJGDCrKrdhb5mBcgFJT2rS57ODGTB/lVPez/rUQijxiTyNpGAQzFo3c9YMgPXlMkS0FhWiybzREa
-    GAUyxOF8C2nVBqQgQBxpr2gxxAvRMGLFVNlvbRj4H+H69sXUlIEAWytbrfQmI/Y9xAf228JH9PUY
-    8d0Kf9raTrcaUAEGGJBnDVGBXUjAiQQYEIEIJIB5BLk1LXbPVgVICgfVVMEuYa4C9WohLlqCHlws
-    DpI6EmE6PrYS5ilKhWponSu8kkJRlqWTdGjMj7IWAAnN4QmW6VkayiQrT/0sXKR6xxhE95YjYmYG
-    l4HijKTYHSxWkYoa8I5qVHQr8ckobxDcGxo9goEGam0Ac5AC+rR2IgsM4iEkiuMB/jHBXuQx/47w
-    KEB2CrGdaMACEmPUWiGLcxeoSEgzXJPWIPVGAIZB7pA+WyM7B5Cuc+HRF5mD55kk6SQW6s8lslvA
-    BHrhwUZY9CADo13AaAC7cGJAHqbz0m0GtEwcqa5jXbEgCpYAO4/khU6la4obWrkOR4CBkSewyQc+
-    gCFaxehZH/jCzoBgA5u8RohCbE3A3CGGJIbSCFsopqmS+ZCrrgEOuizDNKdGtVmFrVo+2Jq5mqgr
-    5JW1Li+Ypq2CQILZQExVRlgb+ggwoIuqDX2kMoolKvcqUgiOa8aZ3VVcqi0JnOsIQWDB+bg2rYVQ
-    i1yqoAZL0aAPvwngHyt4BH6EMMFKXi4uGP/kiex8MQzcBeez8+pNVpVpEOoNa1OhrKEathpX2PBg
-    qxCD6wVM+wkYDCpohNBMUC7m0U/WJQ5GAYcFNqMQqcwOm1EAqgz8IbWGjMAPmWInXegWrlFRpwpJ
-    qOr0vnYREzzktg7xZmaLKTetle96exDsrSJyWQ+0tZ291cBcNfCYyHgTr5TQ6yIX+iZkhIhxKxiA
-    3hRYUnqlc4Ifq4DlAJA3ng0gLBZah1v+oz6WhAga0cDkmTZIWnGYiRa16ChgUHoT6a7wSclElAMa
-    cNBu1Na20nvNenfL2xEsyJTfgKl2lzTB+dQUQjf6oAlqiJPouqMAwN2AFn713iiMZgDh4Wb/huCB
-    RMbO6akK8dkZknEahZR3RhhcDZsdst50HPKbMmiw1vCRQvFk05xx1dUazclfkQKZiuf7Xp0P8Fac
-    bKae9DQReHBAnHl04BErkPMWbFxYnEi4fzVOtFgaMDUE2IIZelCEmZpCTwHUSdLyWUILIW0e9Txj
-    QoprVsdMiI4/nVfGBnmVDBZ4JA7o+A08ZsOPd6uo6ASHP01Ib25mfdM+Hm+VbAiaJnonlQXAgcoa
-    0EJk+ES8Xg5gcSgJpmcKw6m0wehmI+RhmkcJA5hKRNd0gDM39DxYJybwmqLUbxkscKEtxpvYJq0b
-    NlETAAcYMABCasA0x2BoccsC1qVQAd+s/7Av7TrCJsOh2SEAcHBhVExQEpRdJvQ8JxXQ4rj3Sdhp
-    NSeJvyDCKahTpq0xqr8/GMIPqisMbUCw7w90QKM5k89lg4ZPZ8cbt/X2kwUWSA6XtKSnQXdykHnk
-    3BFy40eIbcqBP/AUSV08xsQMN53XqJATnbtbY3b3f5LxImlxdVWu1fqLfwjlHvsHlV3lm3wzYGi3
-    zvcB0/S7GrSQYT4NXKT/fZ+G9YzjFdCTWfWdnwZZ8gq76hkBJ3hyavXT0vYkAL4xeugO1DSTUTy+
-    06IA7YE799lOMCMH1zkY6PQCq5WA3hpKWpdy6w1DAgXEv7uGyLED3Rveu4kTRkG2DoyZcf+Rg8QJ
-    8vEGGhzwjgfL6u/xCLsMyq0p47wmeaSi3X+ggHa556iZFlm/VulC9w20lWsCQIAGAG9NUY6x8GoY
-    /f4Dnf4q+zKcYLQp+4Q6I4DMoadbMjFUSBdtcoD4yoRYohj9SI+l4CyA4xkEcLEbSI62CQtJSqcH
-    ECT8uSgt8RcXQBDA0BfUmwr5sD3qaagNKhjfG77b+w/CAEBns7v+kh5ic6izMQT2mRAOeb4QYAwO
-    i4rjuINZoqvN0r7moSq58Tb7E4MxuqvRmb5dWpGqGrMtwL93OyaHEMOfe5j348H/Sh9f4iK1mq86
-    UzMneh8BMAwbpJ6qeQQ9m8MVcLjM0Zr/cog9eGoFBmgrHBAkebI2BTmI3yKCRniHWwkADsMdYJiE
-    VIg9FlA9E1QFxRGeFVCoknG1Q1AYwUMRQQSXy1k6GwwevDsLxcs1NCySxPMYieIKqeMLkckdI7yB
-    WVQMPwgYJsSMzhgAo5CuJ/jCJ/K+Fekut6uPdlu32Tg/YXq37uANpTu6lhGd1yDDGcjD+mKnvxsc
-    MPyhHNACLMSaqdmzG0lFbqMaSKivQzMEb+rDLTgOC1Q1LcFDW4FEBWgrcfsDa1s+o1jEV6ArOUIt
-    xSnFCiSOBaizOVw9xSGKrlOB+cGTEOMEEwI2NWiCRkCELgg/GrQ9jIAcgfkCuuAR0AFJ/xwUuqOr
-    g/rYF81Jj1qUgVxoGOEQQvQSB0YBDw9IgYPgEBwSqrajF985u9uaByG4jLM7nvpAynD0nRU5KmmM
-    yjz4gDiAPw3oN0Jjmu2DJv/DwQnwxjr4uPgptv9QxwyommXwJt5RAMDLHPSBPMtRNeZYow3EgTHS
-    LGi4gDEZh2bIySEYmzliKE/jj9wbCkPDh4taBvXQuM9zsQ6KiZTjHKUABBRSMowsv0BAm66bD9ig
-    wY6SSo1QqEiqAcuzpItgjpEhheijviCTFCOASqF0h/PzGcbCE37wAcuoguIAA7TzyuaJLNAMzlzD
-    RqQzx++RgM7QJi4iHz4JCcThhuTUrP+8+z9AqBpK25oHWMhvSsBb2SwGXDEPiB9QGLw9GjFB2JKW
-    aBNTSgGyor/kCC3uQJHaY4AGQhzGaYkDw73oqgTBfEEPWoI+usg6EBAv+C6YoCkzSJKIPJ2mipOh
-    +SHVWMALHEhl+IuJu8lamEQ8IhQuo6uGIJdveKocagi6IAK4kxYBEo4LWyPyMzsmEk4YdTbilIj/
-    KRX4WiSRIpwuLJDv0cHXOBdoSjsz9NELyBQba4BD2jI9mhJEOLw5GUZUCLlMYEvx/EkAignIKTFH
-    aglT+KoA0ESiCDG5aEDVrE/620+xWJNE3BQ1XbmhOEGNExI7qinMTIlQ8SiP4aSENMn/nJm++mAD
-    xHg9dYBQblApEziKkmuBCmVAo7SIEvhAcTgODsiOF5AbX6rKnyINHwCfooPGaCw/pNSUDcgUUY3R
-    1SGgGcnKXPGmcnQCHS0D7iHSD3vO//s9NchKnpQ/INir9FiANTooR3OO2ePSrPSNDNQsQFKTl1JM
-    0OLSaJBDBEgW8IjT1Uo0Q1Gqsby8UXsTwmKEG2AERqDUV3GEoQhF0mmCRBmpjOykRCkhLSTNl4hQ
-    1yK1VVhTXRmBSjqLX0u8VnwAQHoy4rKEv/uHhAAfAWmgD2lV4iTVaESQPkIAGClVkSoR2DTVUw0y
-    3vgfGbk3EHjVueAZWb2ANbImYwOE/8c4gCO90X/qVWiaEq/wl1YjAqkpJA7CLgtRPmbtT2sQy++J
-    Ap28k5zLnA3CgLHxTqVIE31t03qUvUd1nN2bKVH0pMtMrojkBpqR1xfbOqMxvVfboBhTLuuiC9lZ
-    i6cwgYq5G/0cHiSKGlsikNMYom0kGxRVNs4IUhrgrqa02CjCg4y9nw9TztfwWBoQy70rA6mpv1o1
-    S6Jt2cjjmwKcDvEUhnrpK0UgB9SYMo7BsC+d3MZYvoVyG+IgHKg5KPXYBNZcMAuqqAIp2gWqEEWI
-    Nlrz3L8YBOW4AcgsD7IwIUl9CKolOpOQKjWISQwt3HsNB1UsAdqLJNtDldsyRVeRBP/qKcYqQbwI
-    w9Z4uNsV+dSNKoLf0V6RukJbgUO9jY1/GzrZ0NjFzUcMkEO5c6xSQckMqE8S7bGy5CoycJIJkBpz
-    2sP34ZoCvDFoEjfwbAlEbcepIV3ZcbiXogmKa1M1mUmxvJUogIY2nUGzkC5VjaSngDRVsNC/KFup
-    8EcOYED6CDP4JQufU0rInIETRlcKdQOhmcbhYqaequGvC+Hx9CmVKN8bDoguYQ0/ad4XhMLcowEo
-    oJXu7BFuGQ0qdKKFUB7dPIMMYYgWwUbuuYfxzeLteR80ArwkmhqFpbMkzjoxes5jo0oeO2MR0LyU
-    66KyorT4UYWdtCRHcqxUW4rBe0D/7bgcO1GTn8jK97k4O8EKRInb7zGxmJAC1BqWU/xM+QzQYvBI
-    ZYuJMmgQnPkCFfVM3o1PObDK9jODIgA0FvYclDS2kk0SMPEPBJ1YzcKQJt7JayGmu7WZb/uyUm2N
-    +kE/Ld7lcUIfa9KjXDkcNRgjKznh1+gbEr0tNKbD1hiBtqq/eTAct2KguYml0HLMBahPgKo9QxOA
-    G2iT+ezj9JiJ0Qtgpu0gz5EBOwbWBlSKmCkAZzCxPaFaDUK5mUqyPKU2TiIC4GXJCvpa4Etb2UAU
-    Lps3ZTMPIDbl3ZK5rqsSZxES79uzs7LdyjiiGiBH7zU4detBNAjVkOVlkA6XORMp/2jCwo/rGzgE
-    A2gm42Hy2zPWZ45GtBAQpMdF0u6ZGlPgnkMDhkTVueW7y+xTzK1BTEsgmUjTxZuap8KBF9HkFAHd
-    SgGILpoxjSvgmS8lV6d94SNJBnMllgBlrO2lG9tT0bkq0Hb156g9mldUXCVDoWazLt2F5IRWaDjA
-    tSuIVhHj07+zFomdAIusjAYL4+99Ueu6wjESoK3KlLzFrZDm5baK6rP02wfwpqoKgSus0/qFDZ2+
-    mT7p1w1gNMRVAUB+xJyGpvpjmH8Zma6Yjr5ZOAhrgLLatIP5Wpp4TwU4WencCYp5hF+iYzaEB7gJ
-    ClOQCyt4RJ2IyBfsKGeg02ILGP/H8d0bObPpzF2yrN/Q8Ux09S3T1VdXscmSkBgR4EmlGJNqRG6q
-    TUe63qqvuBASDZFEAeyMxiYTqa5tXIiK/TtP6euhJGz3++jGXhU9C2Oe1Sx3bMoQ6Js0EMWSrdHq
-    lghGe9+qvmlxIzBQI9M7qApDcADH8hvJkgJGM5H7bN0NiA48GJv/ZTmRWZCWwgAMQ1kSP1JBmI5L
-    gab0OOiPtKMYrtXPCb/MVq0zK1HPgbOidFgbjwanQ7lp2wishS18PTHy7pUl6+z0tr698J/C4B+B
-    5iJS+bjFbiAgOKsMgNiNHqaF6Bo6C4MwKj7//u8c4VgNgCaq2RoD9wBtSvC3KFn//d2mevMpQHhw
-    Nr1pBNSMQZwazGXWMUk9f9IadIaw4BqBw4MMYRSTJlHx2TY4t3px6lOZOJauAP1I4bBdxlYy4xhS
-    1aLOIJfy+fD057ZzA+0CxVwN8A6BzmGJgl7FSu5n9J7yO3sBB3lr+ysbobrbNhpcK2xR74vYqjrR
-    xeYzNs/ibq6y9GnKiqinjZrRYtuqwymVGvmNIOB0gvNzcHHEPYoo1l6kqJuMl/KJDx8kYTRqIibF
-    mXCE9lSIZCEKOd6N7WDxt6Q4f+SBETRtWXFhoqOTIhE4iKkPhF88uyCJ2+q56c67JJJroqvN6Zb4
-    z0GM7C7vEbf1fBgWndMuKOfX/8yeclkiMut6ByQOR7qQm67koifO23rozZP3lItg62aXjcHJN74R
-    Xz+HaYiHgwZDH4Xms4RZCYyjADIK8Sv4JmbBHe1cpLNlYAmMDlgZHE+xZf/Vhdi1dRGqamSuFqlX
-    3figKUfcX3aReDuWL3QFUE1e19+tkR+PeBTW9fROdX3FUx8m+N3011Cg5PMgXl6me4XGIgrMDUu1
-    DGMXqbBxBxOpgV6C4rjF4ohekSZ+M8++eRxpwwxIn5SmaYhP3H3g8KGfje+QhnGmgAJX+nSRDOa4
-    7e3sC6+jgLai+K6jaZVLinE70LNngHP88sk9hX1+7iLVJn4me2qXIQDlcRu55P+vtvNrF/wf89NR
-    N2vEmH4dIYL3uHsRw/yfh34qx4ubYC1tUJFk9r6GQNjB9bLK/7spbsqYn9tUuXzux3nAjV++QVzH
-    j+1cB/r+hYABJqXv4vzabr4tijMe5RE4y+cxy5KMTqIU5pHAeKI2DB47aqcHwJPpNQQmhmjHUogc
-    mA8gsxAoBYGJbMHoMTQXTqNYzBBMCI+ZzcEgTIRxuZH7bsT6/b6iYVu8fRBVFBoeTnQUrbTVTbm9
-    jXV0vMiEMTZEKfBxdnp+giKKGooBAW2KFaQVVPUVFDwUCMDyqRIIEAxwquJu1RIA536OoA6PgCIn
-    Ky8zc8aZ7A3Y2Oh6SpsEEFr/aFsEYCmN7qFGtrzMwNgUOCh8sTC8w78vPJcMuHi9s7A8iKQdDBjJ
-    kyeMkhJn8j1gECPgigfriGQ5gODBlh6T+kTS4O8ALTKLyFwQcmBOByPF9mSUlKHVEYEt62zDwLLV
-    IW6jErXJGXDKojM8VyChUsckP08s9RwVk1TD0k5Jq9y8WWoEDCBiBngTxgcrrAEFqiENAGwWJwBZ
-    CdDaI+tWWk5WjR1rJncu3bnXRvIJMK3ExE96S8yKCmAAlgNawoHKpImEiQEp2gEFykDkCXiRMwJo
-    nHHng41tMVS9NAkEDAaEs2Qb0Hfu3xNSpmw440FkNjIp9YCEnTJmbkFCITmF/ypQcKHYkHw+Goqc
-    Sh7OH1ogqymT1PTi1aUrJa5dDBQFM6AQ0zDglq+taAnxAbAWF1g9a4G1Z3oL1+c9bz1FeV13P//+
-    4k0IwAc96YQyzRY3eYNFLsX5AYopI9zF0Q7t5HNZAxuVUICFAdFgAgBh6IZBawFw5tAIti2SEBQN
-    nIZFNhfJ1Vp8Q3lU0Ak0epLbIzyhpxJmQDViFAUcaFfIcYMc0chmSpYIBoifYGdTItfFJGWD2RUZ
-    VUsluXSVEvWJFwCY4qVxi1Z6jIcLe7+Y2dRUceEXg39z+uemU7oAgGF5YuyFFygDjiTBIWl+Q8uU
-    F1TZSQzfKRChAArgE4+k7/9ktlcRFQIFkWZHvDHAeDYg4BVYMUAGUBGeIoCALFnM4ZWY8SUjEkkZ
-    iFoHZQJ89AmSKjE1QSQePWKGIiViWQUgRe7oURl/KCIGijCRA0901CFKrZUridJHllq+NMhtD2Cl
-    BaxkjkkrMHoRYCcv8JkXzIvJyEmnvPMqxYxeuNjAaroatIZNeob0iYAhaRqGi5S9EqEoMV4AyhEA
-    LmySiHfdqRewbx5g1SdHEtDxQMPT0BKDChO4+I3JhaEM4J6WIVrAFqqSZ8OsROhpowludCnJxUwV
-    OySVxKEHFSlRJgpTc7i1kpJyOtrWUG/TWWlBOFNruW2WOjtNrMeBlgUuAe//mocvK32IlcaeTJ11
-    JjIxnESv23Uuc1cWJyv4n4H/FkKZHF95Ol9h6UZZrZ0XiMxAv/nqkDA/MQBgM4BpVej4Xi9+YFjB
-    EdlIeBce+G2y5RrfvQGmq94COgGq6t0nFkAKUpIROG9JJRFvbHes1b0OTlcbnNJ4GbZWAx+88Ec5
-    jZwGNYDNlFeDfW1NmV+5EozaxwejxTL5tf229rovgwDd3wsQn+PlDv3x94YBfu11Cq/jPeimaD5C
-    gt+/24IHh/dpXBKWn2xDFVQtwAHeA5/kQDcRTHXmG5cDHQMvJwDg/AETWsPdlaJGCiMI73fzsg2z
-    WNeQ3w0vhCJEjEwyoYL0/+ilXBQRRvM4MR52baVsuHCTWXDBFhdyTANR2B4Pl/G/YuRODwMk4DeS
-    Aqiy1IQw06BbAMREQqi5RQYziENhLOWQGYRgUav6XlqQYJoCAkg0gyGgYQawCRGww3Dga+BeYAEp
-    PFzIc3MbCRj3YrKKwK45y0qR8ZBiiEjURGi+wqAgccKNhBmyOs6CDUpUUoUnlVApRBpWimgnHZwI
-    LWhSs0m1LOgHTGoyeNyhSnpuMbgm6uIVnVDi9MhkpnKlCRjQi8bX7JSfHuJSGUG8Ci++0cRvfA1M
-    G5nVD3+GSZc58BsCk5p1+FCVdTxIBwmooePOc4F4VCUB4ErQ11K1snaA6/8VTSzbKwT2Kw54ajAO
-    UY0ZvbCADAiQiGwEzAO0KZ4CqCqfoTKVV1RVgmDOwlMue5UuIJis2LzkSj96HQgXWaIqJcqYHdQj
-    kRKRqV0l40i5CRwSn7JLRXYUeG/Sj1K+Yqca6iKHSCGCXs4WJmCMRF1jGRvZTmDLeOUyp/BUHKLk
-    MhiwDCZ3nhJStjDgKa8AjpnNtA/bHmQVBwwmnwCZpOjK8Uyn4jQeOaIqEkLwTCh4wSIY+AICmmjS
-    UBmVK+L0Ct++Aidx0GGCbOOHAp7zrOUICzeHdNaRNIgbzEA0rxSsUtMsxKXINEOjE9QpUUU6lezx
-    DIXhWyUr8hSYWtgQLTT/fA/5ajBZPtyHsTmNWFE+6h9IEo6nggtcIBHBPkadw6lvzASFxvoFJlyV
-    Kt65j1Y5gVEndac7LgDnNfExVh+57rZZhN8iXQcjDSjkrRXSn3O0hqKI6oQzFeQU7nhyqMF+13VM
-    wkRPjPUt3/YEWhzYxGtIih8RaOCtnsBpY4GmjNCqxaVXSdenxsQ8d7VnG7FspUzKNK4MQFa0OT2G
-    ad1GWikIp75PbGQ273EPKHw1uGHtwRkptFu2QSoE7OWdk+Kb4JJY+B4fvKZWkdAByHhAxPkxRfYu
-    IxtpvSEMJP0gVRUm3p5S1JGMVO1LVlpCYTUlwslZFnNeV1gX50EK8J2U/47jaiHszVUKUqZyOc7I
-    3MU5JMxaNlGWMQBf9/ZUkMeVC3571UShAm4V0VCQLLsbCwUF4MBeo0+DFaxTBvs5vhBOhn35QIYo
-    RModWWQU29oRwBF4OMNhRa2Ve0tmND+CyjqC7m2zCQ9zYBWrZsYBpPZRXMi45GLOMcYMbttBedyG
-    g53YtKER2VwxoBpRJZIBFCDzjg8vKlLyqPCGmNBUrKbRHbe16pdD7WwMtLkl+lksXDB9AVHJQqVI
-    wdMrxlWxsUxPalkhSy3EctlAo1sPgE63iYgciqHlzn4g6AKMe1AJ2SqXKsvO7WwpnZB6P+mWf90Q
-    Rm3rgRxseMbOvk+jTf8tukyR2OFrW8ekI/gcQ5/3J31UBsRt+47k+CTY9QY2MQBeCXYUG8tOTQCm
-    ImPsLyt84XASeAc3k/FknDgWuZCGClma57KUjTzassXX9NyZsRid3T2UstLVPWgHyTeie3gBE5qw
-    4U9jOJs6SGML9A2Pq06IuGIQ9scvoAmU2NUdBTezOxEND+/ElsbBbbWZ14HynQQlZ8nFgzK8gw+8
-    f2TFzJr12sXxHY0Ty7gygZHVWw4C8FRluL7ebdjzEY/lzoAYGAYgl+UR87rLHOb0HXyI6GVZT3Gk
-    LO47MISCbk33jASGSCE6TZsu2h0G+kE5Z+pDPhEPhScbt+u4bXBRXo7/FHdnUSt49Bsnv5iFXbgY
-    MS/GZVrQaskguvgw2G3z7y2DEURquMJOtJMqxIQn3B39kdLE24FfknZoovqj7xjaGbJVijLHE+fX
-    2d9dLg8ED1+MARtYPQEWaR34yQPbpJiMkVzoOaC1kdIUQBo8ydd+NE74YIXRqQcwuAmESA+BsZSa
-    gKDOBUPP2R4P7d6/9IdTudBSRJseYJ0pOAGHbR/xCReFTEryUcVzcJ9lFCAxAIE0wQC0sSCLqd3J
-    bdgTLIoOQhPFDVtVRIGvLZvaSYYP4tYzTQhp0FsPNNzj0ZjreED8CUVC/EBzWddFEd6T8V2czCAV
-    Flsk6NsP6paHUYVT/+HDo0mREGbdA/JhBS7OiRChAzzJC85FnuyLtpWUn6hbA7yH7IlHZpEPujji
-    CVJiNJTTdt2XwplHfRDiHygX3AHQDxqfhtUbD4KHbkEK3IXdCgjfOuTWfTTBVRkcGGhh8/GgDtTh
-    oizMD55D+qUdwcHYFerWcOVHwoEVHZ5CYVVd80HGw2DYXxlavW2Vy50Qq5Vi+VnhOxGh8bViyYEB
-    Hgbh9XlhqL1iH8oc7xUDb81fXbxQ0nkFuMxQ2ASDnkli7XkJuPVZJfpZo4xbMO0TUgVTt2GLoIWB
-    QInTq1AAuiwFfIGC5QVXKNLg8P3aPThe+wFf5pUcwFEehjVgwKXiKf/OouVR5HMcnwuUozdGZIjx
-    gLI14yMBYzaFWD7cG9dZ2AR4gcKtJAhADEUiRBjyWs4MBbP4oM4Y2u48wD3AlaA5gJPJwwLeoReY
-    HVhBzOadAvJh4UhymDlqZahlz4wFon7QXH8YYtLJAjza4/FAomStCWadS9LpY9NRU/9UEf+4SD69
-    At+kkxS80AfS2S/hwjIRAlqRWVOgUT4kjQ9sofBpGPlJynLpXipmJPZtX9tNTEYGIwVmIS06yS32
-    20lagij23+MdowcgQDAFXmQ0Xss9GqN8AQCU5thEV7AJIA5ESgbEXQp8ywc8GojchmxknI4El9P1
-    HpnNoIgJoRB+n2X/3ptnht9kxoMS8qFwbuV0uk2aaKBYTMBZ8kvs7QstydJJBZ1bvqXS1VAyEdEH
-    zsdYBMYAnYtYNFHn4Fm3rct7vidaoM5d4hOq3KVZhUp/+qd/SgAbJFclHBVzFYIEqMZABSQ+mRQA
-    XFVFTkc6DQkrsuIQfkhEOpWvQWEwnlwFlGYJphMrIqYTVACLXOJRuUzpcAS+xVjkSVwTgp+sBWUU
-    yNqW0Jr+UOBw5mg6eqP18WFd2VvoGV8W9RuFeKaojdJ0TmcK+hCCpoHRpYl2rsR7kNvsFYaUXpuZ
-    jOB40gvuEZpnAZPfeAP6tGf1gNtG0Jn0jFMv0Oe42ZDNzI2aiCAZ/xHQB5pUfmIFWozTuZSTXb4n
-    EcUpny6TsQxGAAiMQQ7UOIlJtwnKwNgCLDBAUGkefKnGI03TUU2AfjIofhLdB+bZpUQqO8GMFogF
-    YMzpXGaDFBUOdNaW2cXdDgBlHdwBtf3msgQiZJFK3bWh9wVhEN5gizYgED7GsCWmkfahHsSckmLV
-    D3SiXIzHGH0WLZVRelDpz5FZBnwoFqjQp2gWM9wcl7KPtbnQ3HzN12jreyhq2bjnn+KZmHxouqZr
-    in6NDCkQMNnQurpe56APnGYWes6HA12O9CiQqcqRjWSWCLqrV5xn9YTpvOZrQdCHe/anoLDnmprM
-    WORLv5YrwyqIy/+4zJzCJ8AObEzhw/a9UYqRpHJNpQvc6BtsAkgojeDxTo7ySvwA6XqxZNVVGMRI
-    mTv5mjt5JhZZmOWZX7IyKwuOWbKG2h8+iJg5bdLCD9Ptx3h4ylp6Z3cihZaeCU6px9/o2QbGI8eB
-    61w0qxAFrFnVZ9mEijidS0Bu7Dgl6rwe5KKqAtzKQp7t6Qm0qZioa6JabOn0q3s67LzCp7m+7cMq
-    yJuayb3Wp98sLvgM7pkyrMBWUcoAE7vKkeqgDJuqa/UALJn66xxlrk1B5zD6oJOQ3f8lhvE8Wc74
-    wAxgpmgA4Gc6WVCAQQ+WHYthCjYdm6/aIkmywJEqa9N+5Try3pf/0QXV3q2bpNMkUs9MfaVRmUnq
-    sQkHLkONju3E+WFZyELAdiy8lhO+ti3f0qffqoqi4tOiom1ALqovkdP5tqe5mRXD/mnapmt6msn9
-    wuuaul4v6KmiuovkFixaKKi/ouca6ctYkBN8ypG5KXBZtaechun6jq+5pYyplgAevZzIWcg1aqOu
-    VFfHxRcOwNMMMJSZ+d01SoY5TFq0OJ69QWGohaZkCO/whlYRVlvZQsmjzpJSiAVXAF31tMVJmEXB
-    gCDY0kdi2Wr2MoPx+rADlU653q/Dwuv3kirjzq1Z3SXCki/lSk+qdGpf9tJ8OLC6zi+dqYmhCu66
-    zq0t2Gu7qm/8/5brm/6pYUxx4/6pueKZi9Cv/NYtA5+MevZCqsiSLYgF0fFn46ppGkBsnFaE58Fk
-    EgKjtCRGk3yEv4Ulr8kuCjNjFVIIC7fqw1VfJTAKVSJgypVyctow8uLwfLWyXPQSlM5QD7sHJJ5U
-    mYwgK50bE+fSXPnFyPJP0AEw2u5pGY9EvkqxFCPTm7qIx8qv4JKqggYqvSbuK/gNg+6pECcqqVIx
-    Prkmg5pNiqJvFtMrGWeFDPWtN6grGhMueSioHWtpICfuwIapHeOZ1pbxHAcwNc9lweRZCEiepExy
-    rrWOjzieQzWJUp4EHark0K7YB8DdpBGpCsNwF0gexMAAGbShKf8+pSnrqNn58qVJZ0i/8khZYFm5
-    zODUAN+UhdYaHe05A3eKJy/PCfaAAqHQTei6i1+KbhUBciD7Deh27r6qp3syMxor0HykrxLkryBf
-    Lt9Ssd26Cjbzrd92sVkhLC7zMVqkpwX3KzDJa9uqqHlubv8ARlBfbJySq78ic1nfkWMEIMH5H3Rw
-    F4lhygffWuyIdPFKpI+WGl1zCWJOGvuhcl8rmghcgiSnrLK535vwqB/KFl9/tFKK67zUbc9RaS6/
-    6dfawhDQ9J9Ndh+UZlor7sVS7hJ9zjwRbL44db5gMCO7deViQ+XWq1uX6dtOrhS36caK87lkLqu0
-    a3o2shwJLMb/Wm69AgjdFAxgAIgdLbcRmyn+Um5OB0YcvrDtulyR6cZl4PVElZ6JwC5I05ijoSQ5
-    lGyPRkFmAtyGrnAOsJw+7G57f6FjR+9IkbTucUJYao9ZnAv3qumB8XebxNB8zPRnz4sT04o4fYU+
-    7VM5Jajf6jPnlqoSiAlso2epLlAGhwsGD/C80uXnOK5ZJzdfNuzGnipS37PnwukCyaXj0PPfbC7/
-    MJCI25Fa9zPBenFxH+ziFl0LzBYI4ODpZjdR/kpc+Zpe4V0ehbRU5kDzEbZYHaUr7kBA7+TlNabI
-    Yd2MoUIahd+niZgChkCSwkm0RbZ4n0IUbe+8vFDY1rL06Nl4/3zstpaOfhk4CiJ4vWgLTQgNxwTV
-    oWSqhB5VOqWTQ/z5T6WTaaRKf2IzPoWKT7BToKuGVLkmGKOON8Wne6ZoLwgUVJ+LpQtspluuqe4T
-    4EYEPEuwiy+RGpe65MwNIS/3PGNOX1Z1goLvoid6oprTc+pDASah5UlcDoBEdOWk3i1ZkDld5ZkD
-    qZ3i3XnVEqaurovm3C0hFKiI7rGwjCl7d3wVPgRrKzvbY4NlSOco8pref7VQ1kpPZ0nxm8NUtNZ5
-    L985D4UX7yFYQqjA+XnLhsgJ58EYKCNJobump0SqqkiAKRi6EUB6qkzA+SasOC0ThCh4oppBdq6x
-    /JZVXX6Ix/+siqGiTsKmSjWgilmhCq2jhaDw+f8wDsrHCyYF1S9yN6kA78WBhiU0R3k7grOcpsxC
-    Gxbd1reHFa/GtVwrrQxKtsyd4qr6eLff8LMF4o6OdLzjTUImmSqoAteoReLSeZbOI7WmcT6+e38w
-    KbstPddRtGScQq+5HNpnCvyxgGMi2663PfctnEhXwAIMUpAyWAU0ajqtiGEWVEUVgTbCZBiAKqpx
-    gdG7vd1lnWIX28ux3LJZRu6CN0jsFssiVgfpxMYRTnd83dEG4R2aMtdRKGM7oAXIYG7dph1+mucj
-    afy0/tKHduvHDTlRbVjMgraWUrpzfTCoSxoX+NcDf12c0Rj/8KRcA8Vy/S6H/RoxpNwyDj3Pl6Ln
-    UbtWSmX7gR8htMBdj59clyRjSp6yiVjiQ99yxmT3X3fO6jrkUzJIJ4Rk/FszDhnWnDCyhhmVfaRD
-    pJFUOqXPJiEELLXWU89h7HgHYOOUSepIpUuvjExSLrG0jLVoU3t0Odtl37eaAYlFX0EgOAQGAxAR
-    ECAMCAWjDikgCArPImBLqHqBUS33mlav2W33Gx6Xz9kURqPBuOP5fT+fAWViD49hocPFQeGvL/AF
-    5cVhQY8RkMEnMjMz0QUyYRFggCEhgZIyb0SBkFHvtLFk8LRVLxFxUg9SVdZwZLIyD6jhgbAtry8Y
-    D0QYSgdg/zlOOE8PiMGh1BRXweXzYhmltCjzASTFl1exteTF51OzByhlB/Ld6OODLi4qzInMB0Es
-    gJUrVMSIGXAFQIGCUwYuPIgPYkSJEylWVLOg0S+N6nwBWlBLxCo/EkBq6qhxmg53K92pavCh2qc7
-    sradLGSp0rkENv1oS7Fz5kdJrlCF/HVpxx+ka4wd26HnAx8jfPoV87OU1NCrJRNIbWDtApF5HcaF
-    kMQH1p5RkTCNXUckno55auxZLHNPB0E0aQKcEfhFYYECB7ogDLMXsBgBAew2jljXcWTJLm/OFFlI
-    5CEO5tJxg6EN9Kx0bjPdwtxKmiFMLDONqJUIFB4TItcOXf9F9LRaWLdEU/Jpa3SsVzB6i07q7HSb
-    Uw/w+NgTlXmRl82hIZeqsgfRQCWbNxAUFgjpsuU6o9Oj+a3KrNZAhiOLnQNdvI4hP0CQhGEaKloe
-    fhEjOD8jBsCvCoT64k+yBN+oT8EGmymrDRN6WSU02mj7xpyngAtEm08o+FAdVexQTxs7GlErFdbE
-    keu8bWbD47eOtvuNMktuk2CQPNA7gUcKIgFqFp509MlDUowkJceetFlthFZ8+OOLZp7BBzVWWomF
-    NjUKUWe1+GAwC6xUthFzJfBUZAsuBeabqKp65suCgDYxOIgKwuR8gIqAAgjgTn0KupOgMRwc1M07
-    CbXIHkP/u2Svq+jW0kWjQjDcY7VSJP3pyFpcukOeEi8DpMMzVUhKx5KsQWSzoCKp8SgczRFKkd/W
-    W+8n7S6rDQZT0flDTHlE0GUp5pKhTjqKZukQoxNnYURLPELcIR7SEHHtMyNZ8lXU+OB6sCJFdyAj
-    oSX6g2KKOgsDTIu+/oLivn3W/PbAAg+dl1t6E2RQDdK6YS6kT6tcCyhgoFUEEF0jSZZYSGxyBdds
-    tWVuJk5+Yg+smebJSkjM+EB2D3V+XOmaTxv5rUxCroREHlJMrIDU5pxpsBDYqow0pSsKFmFgbclB
-    hJPXRMU223DU9BYO8N4YTAAnrkCiAHPlDPQAAQA9jM96/5DYYl17tR7n3a3fAC/RCCMZOckTPzwP
-    hmSX8gTFDkFC8uxpvBHBjvNkcTg9Q26hQFYygdyObhPNPhtWSD2eFlZNSJhZKb5TeTwVhK+sJQjB
-    qYsG8wZPyYU3pYKkQI0rcYAvA3sQN/jMnIPeFkKK6HFjMMbuRKIJAgirZwApkji3iEARI2K/3dVQ
-    2uvI8C1e7PiOD2IlhFO7DEcjaVSLVqNSI+kz3khq0pCeM6WsGrw/xnK3Fin+yCcslXJN+lwoOdya
-    vVE3su6ciisuGuYffsA0r4QVmBmvg0NchiGMNi3DEk9Bkgny5x535MxDjhDfBAm4KOQNhh9XUFcU
-    qgaFAv/oTlwI0UuAiKAQ25EQCgFAAPLo0zUWqqGCMHRHxq5Cskd0zIZaGdlrwJe2iLXEFNKa4KZ2
-    E7NYfcJarKphSdznLE90IiioMwENIwWl6JAuKa5Azv8awLLGEDAqXiTCiYDWgWRdER4rwVaOGkZB
-    vDlQgHZBmQbj9IT3NGMLTJgaEwaTNSBQwYRxqkcADoC1cREBAYU85AuvMMfkMTJfaEpDyazkkbfJ
-    zGIkg1Qf4GepPKTNiDybosWqhzdMqiNko/CMtawhMlRc0noSTF86VFS2Kl6FKBbUgTQiJUZftU4O
-    MSTWkzDnrDKK4DpwUSO0IvhKn6lAiKwp5R11KZkY+qD/CXakJgD8koY+4okAK7TaYgyyNNtxwVB1
-    Shok13BNI7iTnTnTgNGgZQNKDo4QH+pF9OLHC01tMoio8lDiTmALvhFnS3zjoSk/pCnHKTRwnfPc
-    WLh3thFMiwQEnV/dTOYvtFiuEDb4gQ6WMx1QqUIscRwgzrpRgZeNcZe4wIQGKLVLm0YnF0K4AemA
-    VVA3vmCgsurETMeiIHjWKwQ+AIMS/HiEJICAeL1bSFPxmIQOjnMJRGPkUcNDzXgGU0U86V7Anjea
-    aZmKrAEVwa8oSq1UlWpX15PimbjRViw5Akg0G0atjKirumZLJrd8BbVU5iS6DBZnuxwmPlqTFDQq
-    lQ1T/4pOAx2ZxvQUUII/zd55nqgIvKzIml5t5B0/0BcUKjULiyyDacspoBPyzoNaOO1XqxnJ/cVB
-    pV47k1gTIdGRqCitFjMBDFZ1sKCkQhZ5mOtPPdlFhFYRcAwM5SaWuwlX5iRxHMhcGoYlDS4dR7J0
-    0IRjG+iG7iADc7mAIzWjqFmwdARW62GmJBsk2jUM4IMIQpcWYFvCgizGm1KQVz3CQFXaKjO3FUmw
-    1ljDvRr2YiPs4wYr+6mxzEazNKJTBE+iN+HqnqmnxMGNUloZgnSQhMJlepxJ7oe/oozKHuFFr3d9
-    QszpRARTn3gSHYa1S+s0R71iKYmNcQQ5Ix/5yIKLb/91CTW6NiREMUwwggll26cw/Ad3VQhIOvOo
-    2gMjmJ5ffCGGwbMTIentJC1G896KHNwXKwKwE5iHLb0bt/U6rAWx2ueIE6oHCd1Vnzk0I0ez+5mM
-    Ihl87qPEPTDjnGMwy8ZTkvFNU1MsYSwHW7b1gzO68uOEQUI0FDCVLOKm5t58QxISyGfPHjivOcMB
-    DIWk6n0AhM4r/KMgXsaTbAVFYCx/2baKUFCYGVymp/BZYzYSjY0wg2IZCXetcVaBjJRlWMtOcD0X
-    HajITuwWVnHWr/2DK3UNFjBDIBMYUfHusa87xpc6lrvJkU6zu0Rs1Tmvi1QBRJfEHd0XnUawnOzQ
-    spz/xerx2iuxbABBYIAJr8UQcrY7GMw+NHiG35UheLoGNpM2ThEyHxslJgv4lhSmFmjD+Udcgc2G
-    ePmLO2timh+rMHQ9ge5X+HWTJP/wT17lAnH/r2ZN6Q6UnrFFZFgaEOEtZkh3kBV7y8V6Qgd6wrah
-    HbdGfeQPXsQfUIm64tn3jwfSdaBa69qCGHipedTPfzXe8S65HR8fJ6nJeyO4617loG/lJa4MTjFM
-    ETdtnMnNlV6+CbccKUxON3lubjbtUF/sNWYO0tVb4u3JvfUjNmI3pzwtLGK+u7wwlbfoJdX0oY62
-    lYWQxDhMKg1sSb4z1QOWqXvzvCIXJ+b0pddchqcE/0Ga/T99gnivpZouXSdEtleFuxF4v3zGJrwD
-    nIIRkh6nshPhBO+poDQvNWOWnd8wMyi+aOFBK0rzdG/DM0HLhHT0oyNPDKhGzv1lqck2SY1ASyMo
-    ptF3/KR3ywFHquk3isAT1CZ+Fkt/dsLIDA/RkswckOv+IOdaWOioQgFAbmcg8IMxvGmqECKQDGzX
-    ZKvtlo+rnI8NKihWPM9nsmIncAklpoKLug/DQMzq3iaOfkZ1+sl86Mz+zi3lPAy4EC91cgY8Sq7g
-    bgvMuIg5FCWZ5AA2gObtUuoAP8kagi1Tcu8Ks7B9fGF7zCELWeLpdi8NzMC0DAVONC7WTmjswkDK
-    lv/mDJTPBAkwDp/vYd7LpprHZGhoJrhmjG4CZcZCCL9wVf6ljZAQTJbJnoDjCG1JljpGfJDow1Ks
-    /u7IjMpjwToAgf6HKSbNDaiJgEQgBoQsgjIr2NzL/fbmM9AGz9wu7QDMm9KFy5IAA43gPphqDJFA
-    CkBwDndRvNhLO3LlhhIK3/ygLOyIi7pIljZg9k6Mo3hgBjJKn0AC/5KQp3LgEKewi6BIUiSAb+BL
-    VFZgcVDhEv4MGlVtCHpAGBwn0wLhWFRiCFbjEoYF9ETv/9pAp4RNdZzDSaJhGpjxu+TiHEflBkwx
-    gnYkGqVJCNzuarBGhHRHFw+ECzSOtdCQDbWKFy//8gS9auk6RRpxaAKGjirmY848knJgUOg4kbja
-    h0iC5e3qwhNhDmGEIhNB6V9mcH9Q46aoATWsLRiEhSeL5RrDzKSOEYHyxylWyhCFCWIILhqKjPz2
-    xxQxas7aTEJAy0Es0gMFbAt0Ddf64viC5/eALyyLb8AwclCwclAICCQBKIfga6g0gkk6IodmzOWe
-    0smuLR9z8AXcUtiaA5RaDn4Obu6OYRq84CQBaMfIKN68w1TmbTo8rRKcoR7byb7UkiiJLhHsclGi
-    0u8u6lRUhFDQsgiuRgoCoiEebiz/CCDK0oMIoDSPTyG0QDTNEiJm06juqJisTV80bF9a7ih9SLlW
-    /wW8buwkH0svBfPaAA8qr/BF0K8bYCSuTAHFpEgfj4EUWqeL0uwLcpMl+7CL5tLdMEcZJLP1rAOs
-    kpKaMIcpX6b5NpO+3CvF5o81QhMicgcgTNMNAQIEJw6/NC5Q+gu1tKCQbJM254BAIeIupdBolkGC
-    ctAz/tI7moTkou0oX41U5pETuyr+MjKxjIbNaMEoUiIeB29IyKfvbmhEWK8BnCAzSaoPPJMD1C+B
-    iIAQXipDbcw6XkYZhnIy4SMMbWvrzisQPoQPNsQ9J8gGpIcTJkF7BM3YSMcq3eAeXAip5IDsWBMI
-    FjLidEDA8NMNI5IDz65AD2V5QssQu0TGXnJacv9sliRl5RwAARO0St8gSifpTBdPgjqiJ1kBNLTn
-    RHMMHJZwABBgR4gpEQ+m0Wj0JMwLORoVsibL894J7JLnSNhBC0dxKUzxEHur7gptAqFU954sUVzo
-    QMFJKw0sd5Jv7RQDBPFLeBrCNbH0Kqk0nsgBbMo0MkoQ7NQUVYAKNh7wTePRsn4Ut0L1CuSUKLfj
-    b5Zi6U5jUsZNPt+DAfBrHNCDvA6V5yyjCHDDvORx0qLBUEpQhujP/ZIkU5nrTbPVbGwyV8wEERdk
-    VNukVAlCwLyM7C4OCFgLDvM111aV+MiUVjcubJpsUn2URkPjOEEGWNdqX4bVIur0WBMO5MjGDkb/
-    JBPLKrNepbPm0wKa4CXucm7iLxYmYVuJ7smKiR245iUo80yTBwVhDkuOKc5gYa94rnE+Qj49xF1b
-    Dda4ZnkOFPnEdMqubEvJrlVlC0B3wD5/jV5wlZ1KR6kC1jEgNgTcNZUska7UJn0igzd4ElldthIH
-    j7MmgBO0z4EyRArpYR0+wAHGMUYxRxKrsLzChx72DyeMMzFbz6YykQ5HZQ6k5a+gEvrcYdtG4zWG
-    UUdwhHBPQGLw0SyOVErjFWhZa0spdz8LYl/hpV8zkOLsRWoh6QJAIHSL7REcqMxS5TacFCbd1HEt
-    wjcRs2DXgDSeDTDjs0UtS08daDOBCRObg25X/yVOb6u7bsJ/EGJ4jxJBhfNvYY5W6i1h6eZG3CJj
-    OAtm5UeSmk9aIjdeG8lmxgHXAMJAzmBLFxJfsQlzzVBA25CFnBYfbrQToRbhlBcv4UPcvpMrhOga
-    XqllI4JhguVrOZQ8ko6TPpUdQrQ7kyov02gRlvArBK0rhqk97ZZ4EbAPIdN15LdYQZMInzf9EEsF
-    XCmzgIov06M9qfYLJDeAVGoZfGfLgK988+KE/nW1zk74uomR2Bca4C15G45Q9EVSd3YZHWFnFAF1
-    glj6cjh0eiMK7bGrzCIPOep3MRinllFS6/C2WAAGMidFXiBYzAQFguFl+PEOQEBOii5/yPhhS/9X
-    LEYqYsFQl4TIAiZEOg9vZEWjqOCsrkTNKiU2HlpXPrb3DcB14hQJVk9ITqAMa9KJ1zSuFmUTknBY
-    DigYrHiYXv7XYaGAHBLW0vBWSzhZMhoT6cz2DQzhiD0ZVG+wXEMRgBUuau+EV17CUQnWj3FMg3XA
-    VXBIZJGsJNWjbJFTd0VVco+nB/rEDJh2NDtwkDbXasRgQAdCd154ame5jSvCfU3QkmurGQCAFLwg
-    ex0z9Dq5mhVMikkFYOKAW8fVnXrVBFSZZYkVDvRNGEqnVHtRmvv2SasWl8VnZzm2jd3ZZ4MZkp8k
-    eDaQwJB27ayKkRfZQBQjNc10wRJYIsL5kp//VmLtNCnpqZt7koEDWZJzVc62lvRitw9r1H0hlkMC
-    d38n+n3rmUc54HOjuS8vuMGIMJ/xxkx2Yq7G1Z8BOqBL6AzGLpAi7gMKYhYF5ACiJmnzAj+g+YtE
-    GupSetiumTZBQJWF6BseZCj7+TmaMI3pQW+akIG2qAdMWLF05JsjWRMl2rKEtWi4S0XrgZLjbpyT
-    13E3AVosz4koKI45K4P9uVBG1Rph50+WppA6N7aU2WoCAjbfcJ7p1KkT8esqekzTwCbjWgpHUd8a
-    w0KHoaTuIQWI4TiF8hgLlccm67zOk1Pmpaft0So72mUhVy8pIzAdJpUy+KHHUHIl+xZflSzz/+iQ
-    t0AJMhd4uAyxD+Wxkee4J3sG5zRi6cxMwSOXPuBituuU7W0kBrB9mUWtsaNRzloyVhtshdeUWfYd
-    Mro1anqItBUpbxshUDgOUlWoiVZWm+Go9as2A0W460u3JxsjK9sifwUnVxam9fGI2fazjRNil+5Y
-    /BrpvmW7mcklxrsxwFt2QYtv54CAzHtVbkF1v5HDbRsfgtlK1c7s9sS+PUgwRrANyE7FHWOz+fvA
-    1nYiyHrG5mXSpsU7xNXHrOSAH9sZPlLAYTwOSli7quK44XOLHQaCyMRYqzjEBxYOzMWc/qtpCGXi
-    ym73oFpgG9u44+GlyVuqXRQxdStXqqdbrf8EjorhS4R8eQVXmsP8Gk0pbmt5A4SwyU33yb88S7Fc
-    qYhWfRsEvl2TyyGiPSPjixl8DSiczMmCyxurDn5ya9RZx3dcKdL0sSedzdMWaIgNzjkTSZ+an4MN
-    0e9Cz4+goZU2+VqcIvRBIYoaCqJqMpKbntlbVOMpDItqNsMsE9g6vC7gPEj2wacWjuXBZiDz0TTU
-    DSorPCoiIYFN2ZV9gwHYLeLc08MCB9kA2uFV0ZtgDBla1SfCPnNxt5NanLWcls0dmENTal160DWU
-    XOE0c6bkrBpFwj2adw2RNAaqO7bIKYL9tSOi0DMdne3S0wm4QURcDohZCrLqMcj4A/ihTQT/w4Rg
-    85x0cSJGnQ4CPs/b/Y9hiLln/D2toVkTMPq4etE5PVtF5jJzVdYFXqZRueD1Wd0BmSLwK2jJ3Q2U
-    Br8EY0/EKV8DYksRmZBdvjYV3UDXnQ9h+mU7DXmv0eTPEgC+ONqTs4PBVTzjneXRveOJnrwJXnG+
-    DwyncVZpfiISqWkcueHHoQnwy0u/BbhBEAzenuNhHMoPrMa+JbAfZFKf7rn0tp502EAt+2swAP9y
-    Cwfe4RkM6MbIUxiyndDhNe/lcO7ZKZrcsYrZOW3d2N0P7oARGMFCHO8rInYSAtaPPumzuYRiE+4d
-    8tu5nhmM/jzBymhstQyqtliZvlG/td5x/7vR2WNcx1DSbgrTW4iNw+HjC9TgEewSa0kzUW+WX5wO
-    2p0Mvz0hBAMBJH7nA4Lntb8AfF7iAGS+YZghXV97Ed75ng76M/KBGRgB+wBoS92ifxTOndxr6r7h
-    4R+53zXNLVrzIeBJ6WpNt869reJU9YFkOQFmagIBQQzqBgyC4ApBQdTCYdeEQA/BIRQKhwDKhNzB
-    YtCodEqdAq7Y7LLKxXavE4XjsX1YzlxL47FurFVvLhksn6w9Kkv9Idbs/xJZKVdiUYKAiFNni34m
-    aCmMkQ4jHBYYCwoKmJQleCCef2WhAwU4ooNIB0ZCOkA7Li46BwUysC+oQkqJu7yhWlq9UP9ewcEA
-    bgmcxIhxkCK7ycoxDggFpzIoZb/WUsN13X+geXqAfWMTFgxs6szR16KHiDM0T1IDAT6kRqRH+/2k
-    Za0K0CMBQKCOge0SKtMGZls7eArBjYtYx424RhQTohgAwJyVX3u+fXFIJVwzjHXKdXCQ4I0bi+we
-    foMYstqAWx8L5OCI7cQ1DgBu0FqhUycBkhmTftSm9ITIplIeQYXSRpqzqdHoNAMK0ptWOU/lmHQ0
-    cY9UM5PSvWxgLKlImnVuzjAihxTCKDryprhptBrWv9yYTv0KOEYfCS7tFGbz0io0wI+rkByDco7l
-    kIQlI1V0FUpniZwqqDVmLKbCnoHgdjn/ePOuu83cWrhwPeFgAF2LcxNMHVYmbN0g2lS1uLj04Mye
-    O/euotLp5pkMgQGfTuLN76UxGMZrkQMniZs1aK/eMbQEiyPeqVOXnnG5+uBrYar766YtVNXv3c/J
-    Fh3/+/+76NeQf1PcBEt5IBTUwiy72KOKeA/YowNuAOrGHkX6VbhOfKYpxVZ99yGXHRkrVQbWVwTu
-    91p/GraYSIbahfLKbCZIWAqEVtzmAkkG0uVicSkWk2EgJKpw3R9rkPZhWx1y0CFqcoBoWpNp8DGf
-    kYMQNkZk81GZ5Qq88YciiUdmJQGXCRYplhloVqKBiNwYwhU2Ze4FBA5EvUBDnQQFcVMA/6gAweeP
-    Dyk1aBi5CVeafYBVReiQFl5I6KS8QARpPbaI9+cMCIYkAHqdgiBEEIdS2kupplbqKHBeprqepK7G
-    qpmYAQ7wJ6lMBEELqoEYlYNDLAjFq6zeEIvVWsYmayisyjbL1Wu7TAiLeMF+GiAsFJLQhJ/OutVt
-    e8R9K24xao5rrmCIDKBKLCvomJ55USCAg7XtHmjuQkHeC8iw+vbrr7joAlKKDRDa9i5QdmVHQBIH
-    b1BUEP9Wmm/EFFds8cVUBLyHPUEAShSgLqiQSgA46vCKpkfciDFml67s8sswq9cqlpepiAgSOfhl
-    nk40HFWjED2EusGfNAg9AV+3xaz00v9MN53szCsIMkbLTPzwgkM0CGArDJkFew/Jdr6gNUFXmOxj
-    e3ASQ7WpaxuZtkZvZxW3b067M13bEYV7ohdTz61C1gv7XAICQjknA8/3QAj4EdZcAbjgaPNriN+x
-    4h215LMeh3nmdfN2N+UeIuYV3zbvgYQNYJt3w9ien0AX4+3WQPI2M7TAc1OWj6Rv7mRvjl2Ivv/e
-    Oe9CBl/SZ4olKGnAxJeiyt+ZOgUUjTz+IACweQkU4rL9gj75X95LDFj4FZMP92JnbdCYc6pNPAXh
-    5KmQ89kl3HQAjgUJ+3POrWvulvmPAqB5BOgL42WHgAV0mwH3hcDLfW6BJEif6NgRMD//fIMyfxiY
-    AIiwAj3Ryzw6wlFrdpQCnumMeCz7HwSBtDkU7s1/WBFQA/FlQBcGaIacGQEzSDMnmpjjghipk7yS
-    QJKg2Ip+IOCLEbBHgAfoBHscoYcNdRe53eGwf7i7ovCAp8D/THFOD6QPGFfUn648iwpNECHYSmaE
-    I5zpOzuy1Ra2dDSBzCCCVtoFHaOwxzW1qQN5JFQfpRHIThQyD4c0SyIdscgq/fEcjfRjVCJJAUoC
-    ZpCIfGQlNVkHTELCksEQDvvIWEb81AkJRjtBC/BnkNvAwEQG6tQjFAS7T5hILGW5SCdzeZJJSZAs
-    HokgL4GZiF924pbHQ6YtgykRZbqJ/5nLpMhhouLMcwzzmNDkhTGFmc2E6O0tpYwRIm6DFMAN4JYS
-    6llHTNQEj1nTD/x4Igiag4htcoCeVbDnBvDZIn2G4ZohqOaZAJrMbs6ToNQUKB8QyhmF8vOeDC1m
-    RBeqUH8OVKG4dOhEfUMHcZaxBJw8GlIQMKpqoFMfSUALNPOHxEfwA4kXNWg+J/rQhMp0nxvNjUUp
-    KtOd1jQNNM0pMG/6T4xaRaPK/GkwfDpRphp1pkgl6mnC2UMzKsQeo1pnN/miF17mg3XvnFobP4jT
-    p55EqjzdZVR9GVRlOhWtR0WrUhsqV6GeNQpznas224rWt7bDr4UJp5gGpEWiCISsZf8Jyix+9TOd
-    gPUTExIItYJnV7OYlVKV7eVUMgsIztbzssDxrC5DC1rgfdRuhosIV9PjiYK4omDdSWWEggBTGWRL
-    j8j7a26dNRbLTmKzu1VIbykyXBcVt5khFW5wNSdYFlnVMgvs2e1iOgLw7MCdBLmNDkgyPwjJC0dc
-    KEdyU3LcRpGjvFMQL1TUqxT2NsW9lILvM9CbEfmCr7n4fcoXOfCnWl6UAqXYwWOT6IIciGxTRDkA
-    B5f624wsV1kPBup4cTvhz1ZYohfWaYOJEeGmdDhy+cUvtKLRCsh9womF+1ksiuggWpiIBZ9aoGiT
-    qa8ZPxMrNgYqXDlcWg3vmMak/bH/2j5KpxArrx2L24YYWMCdgtmrhE0eprpMEQ298sLKssKyFLQc
-    DC5fOcfhBfN6xVxWIbfDy/FgEymhI+IUYODDhhjYbVcSFBvINli46iARVaotH6SOxz0u6L12ykcy
-    2xQqhGZwoC9p6ICaORqJpqE499Pci2wYEPZrmAysq7hpiawHuImMXcBLjvf6K8MmQHWpsaLqVWc5
-    Ia3usofLddowCfYiyEgEp2MgXTaSlQTy4lbnhk3sYhubGB9AwdQCQ1U4PODNCViArmMMBXXJdgL3
-    MHGCFobdY3v72+AO9zHLhaVmm6ANfVhAOuLBEUOQ2n6s1J64h7zCedv73gl500g0/wYCBizADQtg
-    iboBVJB24zuL9T64whduWXJrNrUxWEACGJAJga+b4UrbL8Y3znFl0PcBDAg5xRehgJA3gOIYKHnH
-    YVbYlbv85WpFq8gxsYhouwHlaYH50jSu856D2647PfnJMZEAaKv75ApI+cV9vjKeM/3pnbOvY6Jg
-    copnog82R7rSod70lnP960z7uOGGiXWTnzzkSbe41icxTbAbC858drvcFe7Z3lrg6GuhebQZsPZI
-    8wJqSDpNJatDLjOUAPDN7GuOES8FxodSjOYlluOpMHmFVD4i5bB7BfAudJTvPeQSXwR9Lt940i/D
-    9FXQm8f5ugvVn370x0I9kmTfKP/aH972rcd9ZzGIwUJ8gO8NSPvE+Y72TCzg+Mg//gUC/mhArEoZ
-    z+ewApAT/c5O3xrVB3RdF72OXmSfIt+3/JWgEn4XlT/wunf++AtjzOWD/gJVD33JQX91Dyz9PhEJ
-    3pGGtX8Pc98KapMczTcIAlh4o2WAEjWAXVCAksGA+eeAZzZM9gd6GPB5DPBmR+dvb3Z36Ud5eVMY
-    HehsSiF2y0AMrSJ1gacCKFgRhkGCjdcLLpiCKbCC59aCcCeDqRaDzCGByIB3Izd8SJd0/wZwlmB8
-    9zd3jYZ5OmgqS7h7l+ZgN4hjURgRTXgRkRGCVghpGBEJmnB8wPeDwDd0nNcH8+dPb7FWMVM4g5p3
-    hsj2f/3khlAFXAoIhXMIaFrYTVh4gF0GCoxggV9YgWYndGtBhl9YhwxXhYuBZnO3iLH3LWXBCJrw
-    hTdnfxzyEqE3cZMYAQA7
-    """
     if image_location != 'None':
-        with open(hadir + image_location, 'rb') as img_file:
-            image = img_file.read()
-        img_file.close()
-        base = base64.b64encode(image)
-    return base
+        return read_image(hadir + image_location)
+    path = os.path.join(os.path.dirname(__file__), NO_MAIL_IMAGE)
+    if not os.path.isfile(path) and not download(NO_MAIL_URL, path):
+        return b''
+    return read_image(path)
+
+def read_image(path):
+    """Read an image file once, and again only after it has been modified"""
+    mtime = os.path.getmtime(path)
+    with IMAGE_FILES_LOCK:
+        cached = IMAGE_FILES.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'rb') as img_file:
+                cached = (mtime, img_file.read())
+            IMAGE_FILES[path] = cached
+    return cached[1]
@@ -0,0 +1,29 @@
+"""Make the component and the benchmark helpers importable from the tests."""
+import imaplib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, 'benchmarks')]
+
+import fakeimap  # noqa: E402
+
+
+@pytest.fixture
+def imap_server():
+    """A fake server with two days of mail"""
+    server = fakeimap.FakeImapServer(fakeimap.seed_mailbox(fakeimap.Mailbox(), 10, images=2, days=2)).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def account(imap_server):
+    """A logged in connection to the fake server, with the inbox selected"""
+    connection = imaplib.IMAP4('127.0.0.1', imap_server.port)
+    connection.login('user@example.com', 'secret')
+    connection.select('INBOX')
+    yield connection
+    connection.logout()
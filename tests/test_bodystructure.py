@@ -0,0 +1,75 @@
+"""Tests for parsing BODYSTRUCTURE and the other FETCH responses."""
+import pytest
+
+pytest.importorskip('homeassistant')
+
+import fakeimap  # noqa: E402
+from custom_components.usps_mail import ResponseParser, disposition_sections, uid_fetch  # noqa: E402
+
+TEXT_PART = ['TEXT', 'HTML', ['CHARSET', 'utf-8'], None, None, '7BIT', '100', '5', None, None, None, None]
+IMAGE_PART = ['IMAGE', 'JPEG', ['NAME', 'a.jpg'], None, None, 'BASE64', '2000', None,
+              ['INLINE', ['FILENAME', 'a.jpg']], None, None]
+
+
+def parse(*lines):
+    """Feed response lines and bytes literals to a parser"""
+    parser = ResponseParser()
+    for line in lines:
+        if isinstance(line, bytes):
+            parser.feed(line)
+        else:
+            parser.literal(line[0])
+    return parser.result()
+
+
+def digest_uid(account):
+    """The UID of today's digest"""
+    return int(account.uid('SEARCH', None, 'SUBJECT "' + fakeimap.DIGEST_SUBJECT + '"')[1][0].split()[-1])
+
+
+def test_parse_atoms_and_lists():
+    """Test nested lists, NIL and atoms with a section."""
+    assert parse(b'* 1 FETCH (UID 5 FLAGS (\\Seen \\Flagged) BODY[1.2]<0> NIL)') == [
+        '*', '1', 'FETCH', ['UID', '5', 'FLAGS', ['\\Seen', '\\Flagged'], 'BODY[1.2]<0>', None]]
+
+
+def test_parse_quoted():
+    """Test quoted strings with escaped characters."""
+    assert parse(b'("a \\"b\\" \\\\ c" "" "(x)")') == [['a "b" \\ c', '', '(x)']]
+
+
+def test_parse_literals():
+    """Test that literals land where they are in the response."""
+    assert parse(b'* 2 FETCH (BODY[2] {3}', (b'abc',), b' BODY[3] {0}', (b'',), b' UID 7)') == [
+        '*', '2', 'FETCH', ['BODY[2]', b'abc', 'BODY[3]', b'', 'UID', '7']]
+
+
+def test_disposition_sections_multipart():
+    """Test that only parts with a Content-Disposition are listed, with their encoding."""
+    structure = [TEXT_PART, IMAGE_PART, IMAGE_PART, 'RELATED', ['BOUNDARY', 'x'], None, None, None]
+    assert disposition_sections(structure) == [('2', 'BASE64'), ('3', 'BASE64')]
+
+
+def test_disposition_sections_nested():
+    """Test section numbers of nested multiparts."""
+    related = [TEXT_PART, IMAGE_PART, 'RELATED', ['BOUNDARY', 'y'], None, None, None]
+    structure = [TEXT_PART, related, 'MIXED', ['BOUNDARY', 'x'], None, None, None]
+    assert disposition_sections(structure) == [('2.2', 'BASE64')]
+
+
+def test_disposition_sections_single_part():
+    """Test a message that is a single part."""
+    assert disposition_sections(IMAGE_PART) == [('1', 'BASE64')]
+    assert disposition_sections(TEXT_PART) == []
+
+
+def test_disposition_sections_without_extension_data():
+    """Test a server that leaves out the extension fields."""
+    assert disposition_sections(IMAGE_PART[:7]) == []
+
+
+def test_disposition_sections_from_server(account):
+    """Test the BODYSTRUCTURE of a digest as the server sends it."""
+    uid = digest_uid(account)
+    fetched = dict(uid_fetch(account, [uid], '(UID BODYSTRUCTURE)'))
+    assert disposition_sections(fetched[uid]['BODYSTRUCTURE']) == [('2', 'BASE64'), ('3', 'BASE64')]
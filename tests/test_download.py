@@ -0,0 +1,59 @@
+"""Tests for downloading the camera and the no mail picture."""
+import types
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+import requests  # noqa: E402
+from custom_components import usps_mail  # noqa: E402
+
+
+@pytest.fixture
+def unreachable(monkeypatch):
+    """Make every download time out, and remember the timeouts asked for"""
+    timeouts = []
+
+    def get(url, timeout=None):
+        """Time out like a server that never answers"""
+        timeouts.append(timeout)
+        raise requests.Timeout('no answer from ' + url)
+    monkeypatch.setattr(requests, 'get', get)
+    return timeouts
+
+
+def test_download(monkeypatch, tmpdir):
+    """Test that a download is written to a new folder."""
+    monkeypatch.setattr(requests, 'get', lambda url, timeout=None: types.SimpleNamespace(
+        status_code=200, content=b'GIF89a'))
+    path = str(tmpdir.join('new', 'image.gif'))
+    assert usps_mail.download(usps_mail.NO_MAIL_URL, path)
+    assert tmpdir.join('new', 'image.gif').read_binary() == b'GIF89a'
+
+
+def test_download_timeout(unreachable, tmpdir):
+    """Test that a server that does not answer fails the download instead of hanging."""
+    assert not usps_mail.download(usps_mail.NO_MAIL_URL, str(tmpdir.join('image.gif')))
+    assert unreachable == [usps_mail.DOWNLOAD_TIMEOUT.total_seconds()]
+    assert not tmpdir.join('image.gif').check()
+
+
+def test_download_not_writable(monkeypatch, tmpdir):
+    """Test that a folder that cannot be written fails the download."""
+    monkeypatch.setattr(requests, 'get', lambda url, timeout=None: types.SimpleNamespace(
+        status_code=200, content=b'GIF89a'))
+    tmpdir.join('file').write('')
+    assert not usps_mail.download(usps_mail.NO_MAIL_URL, str(tmpdir.join('file', 'image.gif')))
+
+
+def test_default_image_unreachable(unreachable, monkeypatch, tmpdir):
+    """Test that the empty placeholder is used when the no mail picture cannot be downloaded."""
+    monkeypatch.setattr(usps_mail, '__file__', str(tmpdir.join('usps_mail.py')))
+    assert usps_mail.default_image(str(tmpdir), 'None') == b''
+    assert len(unreachable) == 1
+
+
+def test_update_camera_unreachable(unreachable, tmpdir):
+    """Test that a missing camera that cannot be downloaded is left missing."""
+    usps_mail.update_camera('usps_mail.py', str(tmpdir) + '/')
+    assert not tmpdir.join('usps_mail.py').check()
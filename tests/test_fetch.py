@@ -0,0 +1,121 @@
+"""Tests for fetching many messages with one UID FETCH."""
+import imaplib
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+import fakeimap  # noqa: E402
+from bench_scan import BenchHass  # noqa: E402
+from custom_components import usps_mail  # noqa: E402
+from custom_components.usps_mail import image_part_parser, uid_fetch  # noqa: E402
+
+
+def all_uids(account, criteria='ALL'):
+    """The UIDs in the selected folder that match the search criteria"""
+    return [int(uid) for uid in account.uid('SEARCH', None, criteria)[1][0].split()]
+
+
+@pytest.fixture
+def noisy_fetch(monkeypatch):
+    """Make the server send the given untagged responses before every FETCH"""
+    responses = []
+    fetch = fakeimap.ImapHandler.do_FETCH
+
+    def send_then_fetch(handler, *args):
+        """Send the extra responses, servers may send flag updates with any response"""
+        for response in responses:
+            handler.send(response)
+        return fetch(handler, *args)
+    monkeypatch.setattr(fakeimap.ImapHandler, 'do_FETCH', send_then_fetch)
+    return responses
+
+
+def test_uid_fetch(account):
+    """Test that every UID asked for comes back with its items."""
+    uids = all_uids(account)
+    fetched = dict(uid_fetch(account, uids, '(UID RFC822.SIZE BODY.PEEK[HEADER.FIELDS (SUBJECT)])'))
+    assert sorted(fetched) == uids
+    for items in fetched.values():
+        assert int(items['RFC822.SIZE']) > 0
+        assert items['BODY[HEADER.FIELDS (SUBJECT)]'].startswith(b'Subject:')
+    assert account.noop()[0] == 'OK'
+
+
+def test_uid_fetch_literal_parser(account):
+    """Test that literals go through the literal parser."""
+    uid = all_uids(account, 'SUBJECT "' + fakeimap.DIGEST_SUBJECT + '"')[-1]
+    (fetched_uid, items), = uid_fetch(account, [uid], '(UID BODY.PEEK[])', image_part_parser)
+    assert fetched_uid == uid
+    assert items['BODY[]']['Subject'].startswith(fakeimap.DIGEST_SUBJECT)
+
+
+def test_uid_fetch_failure(account):
+    """Test that a rejected FETCH raises and leaves the connection usable."""
+    with pytest.raises(imaplib.IMAP4.error):
+        list(uid_fetch(account, 'x', '(UID)'))
+    assert account.noop()[0] == 'OK'
+
+
+def test_uid_fetch_nothing(imap_server, account):
+    """Test that no command is sent for no UIDs."""
+    imap_server.stats.reset()
+    assert list(uid_fetch(account, [], '(UID)')) == []
+    assert imap_server.stats.commands == {}
+
+
+def test_uid_fetch_ignores_other_uids(account, noisy_fetch):
+    """Test that flag updates of messages that were not asked for are left out."""
+    uids = all_uids(account)
+    noisy_fetch.append('* 7 FETCH (UID 900 MODSEQ (55) FLAGS (\\Seen))\r\n')
+    fetched = list(uid_fetch(account, uids[:2], '(UID RFC822.SIZE)'))
+    assert [uid for uid, _ in fetched] == uids[:2]
+
+
+def test_uid_fetch_merges_responses(account, noisy_fetch):
+    """Test that the items of a message sent in more than one response are merged."""
+    uid = all_uids(account)[0]
+    noisy_fetch.append('* 1 FETCH (UID %s FLAGS (\\Seen))\r\n' % uid)
+    fetched = list(uid_fetch(account, [uid], '(UID RFC822.SIZE BODY.PEEK[TEXT]<0.10>)'))
+    assert len(fetched) == 1
+    items = fetched[0][1]
+    assert items['FLAGS'] == ['\\Seen']
+    assert int(items['RFC822.SIZE']) > 0
+    assert len(items['BODY[TEXT]<0>']) == 10
+
+
+def test_uid_fetch_ignores_incomplete(account, monkeypatch):
+    """Test that a message that never got the items asked for is left out."""
+    uid = all_uids(account)[0]
+
+    def flags_only(handler, tag, args, uid_command):
+        """Answer with a flag update instead of the items asked for"""
+        handler.send('* 1 FETCH (UID %s FLAGS (\\Seen))\r\n' % uid)
+    monkeypatch.setattr(fakeimap.ImapHandler, 'do_FETCH', flags_only)
+    assert list(uid_fetch(account, [uid], '(UID RFC822.SIZE)')) == []
+    assert account.noop()[0] == 'OK'
+
+
+def test_uid_fetch_open_ended(account):
+    """Test a UID range that ends with *."""
+    uids = all_uids(account)
+    fetched = [uid for uid, _ in uid_fetch(account, str(uids[-3]) + ':*', '(UID)')]
+    assert fetched == uids[-3:]
+
+
+def test_flag_updates_during_scan(account, noisy_fetch, tmpdir):
+    """Test that flag updates do not turn into notices or empty mailpieces."""
+    component = usps_mail.UspsMail(BenchHass(str(tmpdir)), None, 'None', str(tmpdir),
+                                   cache=usps_mail.ImageCache(str(tmpdir)))
+    uids = all_uids(account)
+    notices = all_uids(account, 'SUBJECT "USPS"')
+    digests = all_uids(account, 'SUBJECT "' + fakeimap.DIGEST_SUBJECT + '"')
+    noisy_fetch.append('* 7 FETCH (UID 900 MODSEQ (55) FLAGS (\\Seen))\r\n')
+    noisy_fetch.extend('* 1 FETCH (UID %s FLAGS (\\Seen))\r\n' % uid for uid in uids)
+    component._fetch_notices(account, notices)
+    assert sorted(component._notices) == notices
+    assert all(notice['tracking_number'] for notice in component._notices.values())
+    component._uidvalidity = 1
+    component._fetch_chunk_of(account, uids, '(UID ' + usps_mail.HEADER_FIELDS + ' BODYSTRUCTURE)')
+    assert sorted(component._digests) == digests
+    assert all(len(hashes) == 2 for hashes in component._digests.values())
@@ -0,0 +1,95 @@
+"""Tests for the backoff and circuit breaker around connecting."""
+import pytest
+
+pytest.importorskip('homeassistant')
+
+from custom_components import usps_mail  # noqa: E402
+
+
+class Clock:
+    """A monotonic clock that only moves when told to"""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, delay):
+        """Move the clock on by a timedelta"""
+        self.now += delay.total_seconds()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Stand in for time.monotonic"""
+    clock = Clock()
+    monkeypatch.setattr(usps_mail.time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def health(clock):
+    """The health of a connection that has not failed yet"""
+    return usps_mail.ConnectionHealth('imap.example.com')
+
+
+def test_backoff_doubles(health, clock):
+    """Test that each failure doubles the wait, up to the maximum."""
+    health.check()
+    delays = []
+    for _ in range(10):
+        health.failure()
+        delays.append(health.delay())
+    assert health.state == usps_mail.HEALTH_BACKOFF
+    assert delays[:3] == [60, 120, 240]
+    assert delays[-1] == usps_mail.BACKOFF_MAX.total_seconds()
+    with pytest.raises(usps_mail.ConnectionPaused):
+        health.check()
+    clock.advance(usps_mail.BACKOFF_MAX)
+    health.check()
+
+
+def test_success_resets(health, clock):
+    """Test that a connection after failures starts over."""
+    health.failure()
+    health.failure()
+    clock.advance(usps_mail.BACKOFF_MAX)
+    health.check()
+    health.success()
+    assert health.state == usps_mail.HEALTH_OK
+    assert health.failures == 0
+    assert health.delay() == 0
+    health.failure()
+    assert health.delay() == usps_mail.BACKOFF_START.total_seconds()
+
+
+def test_breaker_opens(health, clock):
+    """Test that repeated auth failures stop logins until the cooldown is over."""
+    for _ in range(usps_mail.AUTH_FAILURE_LIMIT - 1):
+        health.auth_failure()
+        assert health.state == usps_mail.HEALTH_BACKOFF
+        clock.advance(usps_mail.BACKOFF_MAX)
+    health.auth_failure()
+    assert health.state == usps_mail.HEALTH_OPEN
+    assert health.delay() == usps_mail.BREAKER_COOLDOWN.total_seconds()
+    clock.advance(usps_mail.BACKOFF_MAX)
+    with pytest.raises(usps_mail.ConnectionPaused):
+        health.check()
+    assert health.attributes()['connection'] == usps_mail.HEALTH_OPEN
+    assert health.attributes()['connection_failures'] == usps_mail.AUTH_FAILURE_LIMIT
+
+
+def test_half_open(health, clock):
+    """Test that one login is tried after the cooldown, and a failure opens the breaker again."""
+    for _ in range(usps_mail.AUTH_FAILURE_LIMIT):
+        health.auth_failure()
+    clock.advance(usps_mail.BREAKER_COOLDOWN)
+    health.check()
+    assert health.state == usps_mail.HEALTH_HALF_OPEN
+    health.auth_failure()
+    assert health.state == usps_mail.HEALTH_OPEN
+    clock.advance(usps_mail.BREAKER_COOLDOWN)
+    health.check()
+    health.success()
+    assert health.state == usps_mail.HEALTH_OK
+    assert health.auth_failures == 0
@@ -0,0 +1,64 @@
+"""Tests for the SQLite history of digests and deliveries."""
+import datetime
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+from custom_components import usps_mail  # noqa: E402
+
+TODAY = datetime.date(2024, 3, 13)
+
+
+@pytest.fixture
+def history(tmpdir):
+    """A history with two weeks of mail for two accounts"""
+    history = usps_mail.MailHistory(str(tmpdir.join('.storage', 'usps_mail_history.db')))
+    # Wednesday: two digests that show one piece twice, and a delivery.
+    history.record('home', 1, TODAY, {10: ['a', 'b'], 11: ['b', 'c']}, [12])
+    # Monday: a piece without a hash.
+    history.record('home', 1, TODAY - datetime.timedelta(days=2), {5: ['d', '']}, [6, 7])
+    # The week before, and in February.
+    history.record('home', 1, TODAY - datetime.timedelta(days=7), {1: ['e']}, [])
+    history.record('home', 1, datetime.date(2024, 2, 28), {0: ['f', 'g']}, [2])
+    history.record('work', 3, TODAY, {20: ['x']}, [21])
+    return history
+
+
+def test_totals(history):
+    """Test that totals count every piece once and leave other accounts out."""
+    assert history.totals('home', TODAY) == {'letters': 3, 'packages': 1}
+    assert history.totals('home', TODAY - datetime.timedelta(days=2)) == {'letters': 5, 'packages': 3}
+    assert history.totals('nobody', TODAY) == {'letters': 0, 'packages': 0}
+
+
+def test_record_again(history):
+    """Test that recording a digest again replaces it."""
+    history.record('home', 1, TODAY, {10: ['a', 'b']}, [12])
+    assert history.totals('home', TODAY) == {'letters': 3, 'packages': 1}
+
+
+def test_counts_by_day(history):
+    """Test counts for each of the last days, with empty days."""
+    days = history.counts('home', 'day', 3, TODAY)
+    assert days == [
+        {'start': '2024-03-11', 'letters': 2, 'digests': 1, 'packages': 2},
+        {'start': '2024-03-12', 'letters': 0, 'digests': 0, 'packages': 0},
+        {'start': '2024-03-13', 'letters': 3, 'digests': 2, 'packages': 1},
+    ]
+
+
+def test_counts_by_week_and_month(history):
+    """Test weeks starting on Monday and calendar months."""
+    weeks = history.counts('home', 'week', 2, TODAY)
+    assert [week['start'] for week in weeks] == ['2024-03-04', '2024-03-11']
+    assert [week['letters'] for week in weeks] == [1, 5]
+    months = history.counts('home', 'month', 2, TODAY)
+    assert [month['start'] for month in months] == ['2024-02-01', '2024-03-01']
+    assert [(month['letters'], month['packages']) for month in months] == [(2, 1), (6, 3)]
+
+
+def test_counts_all_accounts(history):
+    """Test that no account counts every account."""
+    assert history.counts(None, 'day', 1, TODAY) == [
+        {'start': '2024-03-13', 'letters': 4, 'digests': 3, 'packages': 2}]
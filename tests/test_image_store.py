@@ -0,0 +1,68 @@
+"""Tests for the memory budget of the image store."""
+import pytest
+
+pytest.importorskip('homeassistant')
+
+from custom_components import usps_mail  # noqa: E402
+
+
+class CountingCache(usps_mail.ImageCache):
+    """A disk cache that counts the images read back"""
+    def __init__(self, path):
+        super().__init__(path)
+        self.reads = []
+
+    def read(self, digest):
+        self.reads.append(digest)
+        return super().read(digest)
+
+
+@pytest.fixture
+def cache(tmpdir):
+    """An empty disk cache"""
+    return CountingCache(str(tmpdir))
+
+
+def image(number, size=100):
+    """Distinct image bytes of a size"""
+    return bytes([number]) * size
+
+
+def test_within_budget(cache):
+    """Test that images that fit the budget are served from memory."""
+    store = usps_mail.ImageStore(cache, 300)
+    digests = [store.put(image(number)) for number in range(3)]
+    assert [store.get(digest) for digest in digests] == [image(number) for number in range(3)]
+    assert cache.reads == []
+
+
+def test_least_recently_used_dropped(cache):
+    """Test that going over the budget drops the image used longest ago, which comes back from disk."""
+    store = usps_mail.ImageStore(cache, 300)
+    first, second, third = [store.put(image(number)) for number in range(3)]
+    store.get(first)
+    fourth = store.put(image(3))
+    assert store.get(first) == image(0)
+    assert store.get(third) == image(2)
+    assert store.get(fourth) == image(3)
+    assert cache.reads == []
+    assert store.get(second) == image(1)
+    assert cache.reads == [second]
+
+
+def test_larger_than_budget(cache):
+    """Test that an image larger than the whole budget is never kept in memory."""
+    store = usps_mail.ImageStore(cache, 300)
+    small = store.put(image(0))
+    large = store.put(image(1, 400))
+    assert store.get(large) == image(1, 400)
+    assert store.get(large) == image(1, 400)
+    assert cache.reads == [large, large]
+    assert store.get(small) == image(0)
+    assert cache.reads == [large, large]
+
+
+def test_unknown_image(cache):
+    """Test that a hash that is in neither memory nor the disk cache gives None."""
+    store = usps_mail.ImageStore(cache, 300)
+    assert store.get('0' * 64) is None
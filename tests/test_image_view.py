@@ -0,0 +1,122 @@
+"""Tests for the image view and the image addresses of the camera."""
+import asyncio
+import importlib
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+from aiohttp.test_utils import make_mocked_request  # noqa: E402
+from homeassistant.components.http import KEY_AUTHENTICATED  # noqa: E402
+from custom_components import usps_mail  # noqa: E402
+
+camera_platform = importlib.import_module('custom_components.camera.usps_mail')
+
+JPEG = b'\xff\xd8\xff\xe0 a mailpiece'
+GIF = b'GIF89a the camera picture'
+
+
+class ViewHass:
+    """Just enough of Home Assistant for the view and the camera"""
+    def __init__(self):
+        self.data = {}
+
+    async def async_add_executor_job(self, target, *args):
+        """Run the job right away"""
+        return target(*args)
+
+
+@pytest.fixture
+def hass(tmpdir):
+    """An account with a mailpiece and a camera picture in its image store"""
+    hass = ViewHass()
+    store = usps_mail.ImageStore(usps_mail.ImageCache(str(tmpdir)))
+    store.pieces = [store.put(JPEG)]
+    store.set_variants([(320, 240, GIF), (640, 480, GIF + b' full size')])
+    hass.data[usps_mail.USPS_MAIL_DATA] = {None: {'image_store': store}}
+    return hass
+
+
+@pytest.fixture
+def store(hass):
+    """The image store of the account"""
+    return hass.data[usps_mail.USPS_MAIL_DATA][None]['image_store']
+
+
+def get(hass, path, authenticated=True, headers=None):
+    """Ask the view for a path"""
+    request = make_mocked_request('GET', path, headers=headers, app={'hass': hass})
+    request[KEY_AUTHENTICATED] = authenticated
+    digest = path.split('?')[0].rsplit('/', 1)[-1]
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(usps_mail.UspsMailImageView().get(request, digest))
+    finally:
+        loop.close()
+
+
+def test_serve_image(hass, store):
+    """Test serving an image with its hash as ETag."""
+    digest = store.pieces[0]
+    response = get(hass, usps_mail.image_url(digest))
+    assert response.status == 200
+    assert response.body == JPEG
+    assert response.content_type == 'image/jpeg'
+    assert response.headers['ETag'] == '"' + digest + '"'
+    assert response.headers['Cache-Control'] == usps_mail.IMAGE_CACHE_CONTROL
+
+
+def test_not_modified(hass, store):
+    """Test that a browser with the image gets a 304."""
+    digest = store.variants[-1][2]
+    response = get(hass, usps_mail.image_url(digest), headers={'If-None-Match': 'W/"other", "' + digest + '"'})
+    assert response.status == 304
+    assert response.headers['ETag'] == '"' + digest + '"'
+    response = get(hass, usps_mail.image_url(digest), headers={'If-None-Match': '"other"'})
+    assert response.status == 200
+    assert response.content_type == 'image/gif'
+
+
+def test_unknown_image(hass):
+    """Test that only images shown today are served."""
+    response = get(hass, usps_mail.image_url('0' * 64))
+    assert response.status == 404
+
+
+def test_login_or_token_required(hass, store):
+    """Test that the image needs a login or the access token of the camera."""
+    camera = camera_platform.UspsMailCamera(hass, 'USPS Mail Pictures')
+    path = usps_mail.image_url(store.pieces[0])
+    assert get(hass, path, authenticated=False).status == 401
+    assert get(hass, path + '?token=wrong', authenticated=False).status == 401
+    assert get(hass, usps_mail.image_url('0' * 64) + '?token=' + camera.access_tokens[-1],
+               authenticated=False).status == 401
+    assert get(hass, path + '?token=' + camera.access_tokens[-1], authenticated=False).status == 200
+
+
+def test_camera_attributes(hass, store):
+    """Test that the camera lists addresses with its access token that the view serves."""
+    camera = camera_platform.UspsMailCamera(hass, 'USPS Mail Pictures')
+    attributes = camera.device_state_attributes
+    token = '?token=' + camera.access_tokens[-1]
+    assert attributes == {
+        'images': [usps_mail.image_url(store.pieces[0]) + token],
+        'picture': usps_mail.image_url(store.variants[-1][2]) + token,
+        'picture_320': usps_mail.image_url(store.variants[0][2]) + token,
+    }
+    assert get(hass, attributes['picture_320'], authenticated=False).body == GIF
+    camera.async_update_token()
+    assert get(hass, attributes['picture_320'], authenticated=False).status == 200
+    camera.async_update_token()
+    assert get(hass, attributes['picture_320'], authenticated=False).status == 401
+
+
+def test_camera_content_type(hass, store):
+    """Test that the camera reports the type of the picture it serves."""
+    camera = camera_platform.UspsMailCamera(hass, 'USPS Mail Pictures')
+    assert camera.camera_image() == GIF + b' full size'
+    assert camera.content_type == 'image/gif'
+    assert camera.camera_image(width=300) == GIF
+    store.set_variants([(None, None, JPEG)])
+    assert camera.camera_image() == JPEG
+    assert camera.content_type == 'image/jpeg'
@@ -0,0 +1,61 @@
+"""Tests for reading USPS delivery notices from their headers and first bytes of text."""
+import pytest
+
+pytest.importorskip('homeassistant')
+
+from custom_components.usps_mail import TRACKING_NUMBER, package_list, parse_notice  # noqa: E402
+
+HEADERS = (b'Subject: =?utf-8?q?USPS=C2=AE_Item_Delivered=2C_Front_Door/Porch_9400111899223334445566?=\r\n'
+           b'Date: Wed, 13 Mar 2024 14:30:00 -0400\r\n\r\n')
+
+
+@pytest.mark.parametrize('text, number', [
+    ('USPS Tracking Number: 9400111899223334445566', '9400111899223334445566'),
+    ('Label 9205590164917312751089 was scanned', '9205590164917312751089'),
+    ('International item EA123456789US arrived', 'EA123456789US'),
+    ('Call 1-800-275-8777 for help', None),
+    ('Order 94001118992233344455667788990 is too long', None),
+    ('Code XX12345678US is too short', None),
+])
+def test_tracking_number(text, number):
+    """Test which numbers are taken for tracking numbers."""
+    match = TRACKING_NUMBER.search(text)
+    assert (match.group(1) if match else None) == number
+
+
+def test_parse_notice_subject():
+    """Test a notice with everything in its encoded Subject."""
+    assert parse_notice(HEADERS, b'') == {
+        'tracking_number': '9400111899223334445566',
+        'status': 'Delivered',
+        'date': '2024-03-13T18:30:00+00:00',
+    }
+
+
+def test_parse_notice_text():
+    """Test a notice that only has the status and a wrapped tracking number in its text."""
+    headers = b'Subject: Your package\r\nDate: not a date\r\n\r\n'
+    text = b'Your item is Out for Delivery.\r\nTracking Number: 94001118992233=\r\n34445566\r\n'
+    assert parse_notice(headers, text) == {
+        'tracking_number': '9400111899223334445566',
+        'status': 'Out for Delivery',
+        'date': None,
+    }
+
+
+def test_parse_notice_unknown():
+    """Test a notice without a status or tracking number."""
+    notice = parse_notice(b'Subject: Hello\r\n\r\n', b'Nothing to see')
+    assert notice['tracking_number'] is None
+    assert notice['status'] is None
+
+
+def test_package_list():
+    """Test that only the latest notice of each package is kept."""
+    notices = {
+        1: {'tracking_number': 'A', 'status': 'Expected', 'date': '2024-03-13T08:00:00+00:00'},
+        2: {'tracking_number': 'A', 'status': 'Delivered', 'date': '2024-03-13T18:00:00+00:00'},
+        3: {'tracking_number': 'B', 'status': 'Out for Delivery', 'date': '2024-03-13T09:00:00+00:00'},
+        4: {'tracking_number': None, 'status': 'Delivered', 'date': None},
+    }
+    assert package_list(notices) == [notices[4], notices[3], notices[2]]
@@ -0,0 +1,85 @@
+"""Tests for running the scans of several accounts side by side."""
+import threading
+import types
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+from custom_components import usps_mail  # noqa: E402
+
+WAIT = 5
+
+
+class FakeAccount:
+    """An account whose scans wait until they are let go"""
+    def __init__(self, name, slow=False):
+        self.session = types.SimpleNamespace(username=name)
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not slow:
+            self.release.set()
+
+    def scan_mail(self, call):
+        """Record the scan and wait to be let go"""
+        self.calls.append(call)
+        self.started.set()
+        assert self.release.wait(WAIT)
+        return call
+
+
+@pytest.fixture
+def pool():
+    """A pool with two workers"""
+    pool = usps_mail.ScanPool(2)
+    yield pool
+    pool.shutdown()
+
+
+def test_slow_account_does_not_hold_up_others(pool):
+    """Test that triggers for a slow account do not take the workers of the others."""
+    slow, fast = FakeAccount('slow', slow=True), FakeAccount('fast')
+    first = pool.submit(slow, 'first')
+    assert slow.started.wait(WAIT)
+    second = pool.submit(slow, 'second')
+    assert pool.submit(slow, 'third') is second
+    assert pool.submit(fast, 'fast').result(WAIT) == 'fast'
+    assert not second.running() and not second.done()
+    slow.release.set()
+    assert first.result(WAIT) == 'first'
+    assert second.result(WAIT) == 'second'
+    assert slow.calls == ['first', 'second']
+
+
+def test_scan_after_queue_empties(pool):
+    """Test that a new trigger after the queued scan ran starts another one."""
+    account = FakeAccount('account')
+    assert pool.submit(account, 'one').result(WAIT) == 'one'
+    assert pool.submit(account, 'two').result(WAIT) == 'two'
+    assert account.calls == ['one', 'two']
+
+
+def test_cancelled_queued_scan(pool):
+    """Test that a queued scan that was cancelled is skipped."""
+    account = FakeAccount('account', slow=True)
+    first = pool.submit(account, 'first')
+    assert account.started.wait(WAIT)
+    assert pool.submit(account, 'second').cancel()
+    third = pool.submit(account, 'third')
+    account.release.set()
+    first.result(WAIT)
+    assert third.result(WAIT) == 'third'
+    assert account.calls == ['first', 'third']
+
+
+def test_failed_scan_starts_queued(pool):
+    """Test that the queued scan runs after one that failed."""
+    account = FakeAccount('account', slow=True)
+    account.scan_mail = lambda call, scan=account.scan_mail: 1 / 0 if call == 'first' else scan(call)
+    first = pool.submit(account, 'first')
+    second = pool.submit(account, 'second')
+    account.release.set()
+    with pytest.raises(ZeroDivisionError):
+        first.result(WAIT)
+    assert second.result(WAIT) == 'second'
@@ -0,0 +1,68 @@
+"""Tests for resynchronizing with QRESYNC after a reconnect."""
+import datetime
+import imaplib
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+import fakeimap  # noqa: E402
+from bench_scan import BenchHass, WireStats, counting_imap  # noqa: E402
+from custom_components import usps_mail  # noqa: E402
+from custom_components.usps_mail import uid_fetch  # noqa: E402
+
+
+@pytest.fixture
+def component(imap_server, tmpdir):
+    """A component for the fake server"""
+    session = usps_mail.ImapSession('127.0.0.1', imap_server.port, 'INBOX', 'user@example.com', 'secret',
+                                    connect=counting_imap(WireStats()))
+    component = usps_mail.UspsMail(BenchHass(str(tmpdir)), session, 'None', str(tmpdir),
+                                   cache=usps_mail.ImageCache(str(tmpdir)))
+    yield component
+    component.close()
+
+
+def test_uid_fetch_vanished(imap_server, monkeypatch):
+    """Test that VANISHED in the middle of a FETCH is kept for later."""
+    fetch = fakeimap.ImapHandler.do_FETCH
+
+    def report_then_fetch(handler, *args):
+        """Report expunges first, servers may send them with any response"""
+        handler._report_changes()
+        return fetch(handler, *args)
+    monkeypatch.setattr(fakeimap.ImapHandler, 'do_FETCH', report_then_fetch)
+    account = imaplib.IMAP4('127.0.0.1', imap_server.port)
+    account.login('user@example.com', 'secret')
+    account.enable('QRESYNC')
+    account.select('INBOX')
+    uids = [int(uid) for uid in account.uid('SEARCH', None, 'ALL')[1][0].split()]
+    imap_server.mailbox.expunge(uids[0])
+    fetched = dict(uid_fetch(account, uids[1:], '(UID)'))
+    assert sorted(fetched) == uids[1:]
+    assert account.untagged_responses.pop('VANISHED') == [str(uids[0]).encode('ascii')]
+    account.logout()
+
+
+def test_deleted_while_disconnected(imap_server, component):
+    """Test that mail deleted between two connections drops out."""
+    component.scan_mail(None)
+    letters = component.letters
+    uid = imap_server.mailbox.append(fakeimap.make_digest(datetime.date.today(), 2, 320, seed=50))
+    component.scan_mail(None)
+    assert component.letters == letters + 2
+    component.close()
+    imap_server.mailbox.expunge(uid)
+    component.scan_mail(None)
+    assert component.session.resynced
+    assert component.letters == letters
+
+
+def test_resync_without_changes(imap_server, component):
+    """Test that a reconnect with nothing new searches nothing."""
+    component.scan_mail(None)
+    component.close()
+    imap_server.stats.reset()
+    component.scan_mail(None)
+    assert component.session.resynced
+    assert 'UID SEARCH' not in imap_server.stats.commands
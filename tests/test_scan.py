@@ -0,0 +1,139 @@
+"""Tests for scanning a mailbox, against servers with and without the IMAP extensions."""
+import datetime
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+import fakeimap  # noqa: E402
+from bench_scan import BenchHass, WireStats, counting_imap  # noqa: E402
+from custom_components import usps_mail  # noqa: E402
+
+CAPABILITIES = {
+    'plain': ['IMAP4rev1'],
+    'esearch': ['IMAP4rev1', 'ESEARCH'],
+    'condstore': ['IMAP4rev1', 'ENABLE', 'CONDSTORE'],
+    'gmail': ['IMAP4rev1', 'ESEARCH', 'CONDSTORE', 'X-GM-EXT-1'],
+    'qresync': ['IMAP4rev1', 'IDLE', 'ENABLE', 'ESEARCH', 'CONDSTORE', 'QRESYNC'],
+}
+
+
+@pytest.fixture(params=sorted(CAPABILITIES))
+def server(request):
+    """A fake server with a digest of 3 mailpieces and 3 notices today, 1 of them delivered"""
+    mailbox = fakeimap.seed_mailbox(fakeimap.Mailbox(), 30, images=3, notices=3, image_width=320, days=2)
+    server = fakeimap.FakeImapServer(mailbox, capabilities=CAPABILITIES[request.param]).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_component(server, tmpdir):
+    """Build components for the server that share an image cache on disk"""
+    components = []
+
+    def make(fetch_mode=usps_mail.FETCH_PARTS):
+        hass = BenchHass(str(tmpdir))
+        session = usps_mail.ImapSession('127.0.0.1', server.port, 'INBOX', 'user@example.com', 'secret',
+                                        connect=counting_imap(WireStats()))
+        cache = usps_mail.ImageCache(hass.path('.storage', usps_mail.CACHE_DIR))
+        component = usps_mail.UspsMail(hass, session, 'None', str(tmpdir), fetch_mode, 2, cache)
+        components.append(component)
+        return component
+    yield make
+    for component in components:
+        component.close()
+
+
+def deliver(server, images, seed):
+    """Add a digest for today, returns its UID"""
+    return server.mailbox.append(fakeimap.make_digest(datetime.date.today(), images, 320, seed=seed))
+
+
+@pytest.mark.parametrize('fetch_mode', [usps_mail.FETCH_PARTS, usps_mail.FETCH_RFC822])
+def test_first_scan(make_component, fetch_mode):
+    """Test counting today's mail and packages."""
+    component = make_component(fetch_mode)
+    component.scan_mail(None)
+    assert component.letters == 3
+    assert component.packages == 1
+    assert len(component.image_store.pieces) == 3
+    assert component.image_store.variants
+    assert component.metrics.state is not None
+
+
+def test_new_mail(server, make_component):
+    """Test that a new digest adds to the count and duplicates are counted once."""
+    component = make_component()
+    component.scan_mail(None)
+    deliver(server, 2, 50)
+    component.scan_mail(None)
+    assert component.letters == 5
+    deliver(server, 2, 50)
+    component.scan_mail(None)
+    assert component.letters == 5
+
+
+def test_unchanged_scan_fetches_nothing(server, make_component):
+    """Test that a scan without new mail downloads no messages."""
+    component = make_component()
+    component.scan_mail(None)
+    server.stats.reset()
+    component.scan_mail(None)
+    assert component.letters == 3
+    assert server.stats.round_trips <= 3
+    assert server.stats.bytes_out < 500
+
+
+def test_deleted_mail(server, make_component):
+    """Test that deleted digests and notices drop out of the counts."""
+    component = make_component()
+    component.scan_mail(None)
+    uid = deliver(server, 2, 50)
+    component.scan_mail(None)
+    assert component.letters == 5
+    server.mailbox.expunge(uid)
+    component.scan_mail(None)
+    assert component.letters == 3
+    for notice in list(component._notices):
+        server.mailbox.expunge(notice)
+    component.scan_mail(None)
+    assert component.packages == 0
+    assert component.letters == 3
+
+
+def test_new_notice(server, make_component):
+    """Test that a new notice is found by the one search of the scan."""
+    component = make_component()
+    component.scan_mail(None)
+    server.mailbox.append(fakeimap.make_notice(datetime.date.today(), '9400100000000000000099'))
+    server.stats.reset()
+    component.scan_mail(None)
+    assert component.packages == 2
+    assert server.stats.commands['UID SEARCH'] == 1
+
+
+def test_restart_uses_image_cache(server, make_component):
+    """Test that a restarted component gets today's images from the disk cache."""
+    server.stats.reset()
+    first = make_component()
+    first.scan_mail(None)
+    cold = server.stats.bytes_out
+    images = sum(len(first.image_store.get(digest)) for digest in first.image_store.pieces)
+    server.stats.reset()
+    component = make_component()
+    component.scan_mail(None)
+    assert component.letters == 3
+    assert component.packages == 1
+    assert server.stats.bytes_out < cold - images
+
+
+def test_uidvalidity_change(server, make_component):
+    """Test that a new UIDVALIDITY starts over."""
+    component = make_component()
+    component.scan_mail(None)
+    component.close()
+    server.mailbox.uidvalidity += 1
+    deliver(server, 2, 50)
+    component.scan_mail(None)
+    assert component.letters == 5
@@ -0,0 +1,100 @@
+"""Tests for the scan schedule."""
+import datetime
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+from custom_components.usps_mail import MAX_ARRIVALS, ScanSchedule  # noqa: E402
+
+DAY = datetime.datetime(2018, 10, 17)
+
+
+def at(hour, minute=0, second=0):
+    """A time on the test day"""
+    return DAY.replace(hour=hour, minute=minute, second=second)
+
+
+def make_schedule(*arrivals):
+    """A schedule without jitter that has seen mail at the given times"""
+    schedule = ScanSchedule(interval=datetime.timedelta(hours=1), busy_interval=datetime.timedelta(minutes=10),
+                            max_interval=datetime.timedelta(hours=4), window=datetime.timedelta(minutes=45),
+                            jitter=0)
+    for arrival in arrivals:
+        schedule.record(arrival, True)
+    return schedule
+
+
+def test_interval_without_arrivals():
+    """Test that a schedule without history scans every interval."""
+    schedule = make_schedule()
+    for _ in range(5):
+        schedule.record(at(3), False)
+    assert schedule.next_scan(at(3)) == at(4)
+
+
+def test_busy_interval_in_window():
+    """Test scanning every busy interval around an earlier arrival, up to the edge of the window."""
+    schedule = make_schedule(at(11))
+    assert schedule.next_scan(at(11, 30)) == at(11, 40)
+    assert schedule.next_scan(at(10, 15)) == at(10, 25)
+    assert schedule.next_scan(at(11, 45)) == at(11, 55)
+
+
+def test_back_off_while_quiet():
+    """Test that quiet scans double the interval up to the maximum."""
+    schedule = make_schedule(at(11))
+    assert schedule.next_scan(at(0)) == at(1)
+    schedule.record(at(0), False)
+    assert schedule.next_scan(at(0)) == at(2)
+    schedule.record(at(0), False)
+    assert schedule.next_scan(at(0)) == at(4)
+    schedule.record(at(0), False)
+    assert schedule.next_scan(at(0)) == at(4)
+
+
+def test_found_mail_resets_back_off():
+    """Test that finding mail starts the back off over."""
+    schedule = make_schedule(at(11))
+    for _ in range(3):
+        schedule.record(at(0), False)
+    schedule.record(at(11), True)
+    assert schedule.next_scan(at(0)) == at(1)
+
+
+def test_back_in_time_for_window():
+    """Test that a long back off is cut short when the next window opens."""
+    schedule = make_schedule(at(11))
+    for _ in range(3):
+        schedule.record(at(0), False)
+    assert schedule.next_scan(at(8)) == at(10, 15)
+
+
+def test_minimum_delay():
+    """Test that scans are at least a minute apart, even right before a window."""
+    schedule = make_schedule(at(11))
+    assert schedule.next_scan(at(10, 14, 30)) == at(10, 15, 30)
+
+
+def test_window_around_midnight():
+    """Test that the window of an arrival just after midnight starts the day before."""
+    schedule = make_schedule(at(0, 10))
+    assert schedule.in_window(at(23, 50))
+    assert schedule.next_scan(at(23, 50)) == at(23, 50) + datetime.timedelta(minutes=10)
+    assert not schedule.in_window(at(23, 20))
+    assert schedule.next_scan(at(23, 20)) == at(23, 25)
+
+
+def test_jitter():
+    """Test that the delay varies by at most the jitter."""
+    schedule = ScanSchedule(interval=datetime.timedelta(hours=1), jitter=0.1)
+    delays = {(schedule.next_scan(at(3)) - at(3)).total_seconds() for _ in range(50)}
+    assert len(delays) > 1
+    assert all(3240 <= delay <= 3960 for delay in delays)
+
+
+def test_arrivals_are_limited():
+    """Test that only the latest arrivals are remembered."""
+    schedule = make_schedule(*[at(hour % 24) for hour in range(MAX_ARRIVALS + 5)])
+    assert len(schedule.arrivals) == MAX_ARRIVALS
+    assert schedule.arrivals[-1] == (MAX_ARRIVALS + 4) % 24 * 60
@@ -0,0 +1,41 @@
+"""Tests for the one search that finds today's digests and notices."""
+import imaplib
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+import fakeimap  # noqa: E402
+from custom_components.usps_mail import (  # noqa: E402
+    get_formatted_date, mail_criteria, parse_sequence_set, sequence_set, uid_search)
+
+
+@pytest.fixture(params=[['IMAP4rev1'], ['IMAP4rev1', 'ESEARCH'], ['IMAP4rev1', 'ESEARCH', 'X-GM-EXT-1']],
+                ids=['plain', 'esearch', 'gmail'])
+def account(request):
+    """A connection to a server with two days of mail, with the inbox selected"""
+    server = fakeimap.FakeImapServer(fakeimap.seed_mailbox(fakeimap.Mailbox(), 20, days=2),
+                                     capabilities=request.param).start()
+    connection = imaplib.IMAP4('127.0.0.1', server.port)
+    connection.login('user@example.com', 'secret')
+    connection.select('INBOX')
+    yield connection
+    connection.logout()
+    server.stop()
+
+
+def test_parse_sequence_set():
+    """Test expanding sequence sets."""
+    assert parse_sequence_set('3:5,9') == [3, 4, 5, 9]
+    assert parse_sequence_set('7') == [7]
+    assert parse_sequence_set('') == []
+    assert parse_sequence_set(None) == []
+    assert parse_sequence_set(sequence_set([1, 2, 3, 7, 9, 10])) == [1, 2, 3, 7, 9, 10]
+
+
+def test_search_today(account):
+    """Test that one search finds today's digest and notices and nothing else."""
+    uids = uid_search(account, '(SINCE "' + get_formatted_date() + '" ' + mail_criteria(account) + ')')
+    digests = account.uid('SEARCH', None, 'SUBJECT "' + fakeimap.DIGEST_SUBJECT + '"')[1][0].split()
+    notices = account.uid('SEARCH', None, 'FROM "' + fakeimap.NOTICE_FROM + '"')[1][0].split()
+    assert uids == sorted(int(uid) for uid in digests[-1:] + notices[-2:])
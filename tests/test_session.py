@@ -0,0 +1,72 @@
+"""Tests for the IMAP session that is kept open between scans."""
+import imaplib
+
+import pytest
+
+pytest.importorskip('homeassistant')
+
+import fakeimap  # noqa: E402
+from bench_scan import WireStats, counting_imap  # noqa: E402
+from custom_components import usps_mail  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    """A fake server with a few messages"""
+    server = fakeimap.FakeImapServer(fakeimap.seed_mailbox(fakeimap.Mailbox(), 5, digests=0, notices=0)).start()
+    yield server
+    server.stop()
+
+
+def make_session(server, folder='INBOX'):
+    """A session for the fake server that counts its traffic"""
+    stats = WireStats()
+    session = usps_mail.ImapSession('127.0.0.1', server.port, folder, 'user@example.com', 'secret',
+                                    connect=counting_imap(stats))
+    return session, stats
+
+
+def test_connection_is_reused(server):
+    """Test that the connection stays open between uses."""
+    session, stats = make_session(server)
+    with session.borrow() as account:
+        assert account.state == 'SELECTED'
+    with session.borrow() as second:
+        assert second is account
+    assert stats.commands['CONNECT'] == 1
+    assert stats.commands['NOOP'] == 1
+    assert session.uidvalidity == 1
+    session.close()
+
+
+def test_dropped_after_error(server):
+    """Test that a connection that failed in use is not lent out again."""
+    session, stats = make_session(server)
+    with pytest.raises(ValueError):
+        with session.borrow():
+            raise ValueError('halfway through a response')
+    with session.borrow():
+        pass
+    assert stats.commands['CONNECT'] == 2
+    session.close()
+
+
+def test_connect_timeout(server):
+    """Test that connections get a socket timeout."""
+    session, _ = make_session(server)
+    with session.borrow() as account:
+        assert account.sock.gettimeout() == usps_mail.IMAP_TIMEOUT.total_seconds()
+    session.close()
+
+
+def test_missing_folder(server):
+    """Test that a folder that cannot be selected counts as a failed connection."""
+    session, stats = make_session(server, 'Missing')
+    with pytest.raises(imaplib.IMAP4.abort):
+        session.connection()
+    assert session.health.state == usps_mail.HEALTH_BACKOFF
+    assert session.health.failures == 1
+    assert session.health.auth_failures == 0
+    with pytest.raises(usps_mail.ConnectionPaused):
+        session.connection()
+    assert stats.commands['CONNECT'] == 1